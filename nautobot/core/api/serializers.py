@@ -9,6 +9,7 @@ from django.db.models import AutoField, ManyToManyField
 from drf_yasg.utils import swagger_serializer_method
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.reverse import reverse
 
 from nautobot.utilities.utils import dict_to_filter_params
 
@@ -194,6 +195,31 @@ class BulkOperationSerializer(serializers.Serializer):
     id = serializers.CharField()  # This supports both UUIDs and numeric ID for the User model
 
 
+#
+# Search
+#
+
+
+class SearchResultSerializer(serializers.Serializer):
+    id = serializers.UUIDField(source="object_id", read_only=True)
+    object_type = serializers.SerializerMethodField(read_only=True)
+    display = serializers.CharField(source="name", read_only=True)
+    rank = serializers.IntegerField(read_only=True)
+    url = serializers.SerializerMethodField(read_only=True)
+
+    @swagger_serializer_method(serializer_or_field=serializers.CharField)
+    def get_object_type(self, obj):
+        return f"{obj.content_type.app_label}.{obj.content_type.model}"
+
+    @swagger_serializer_method(serializer_or_field=serializers.URLField)
+    def get_url(self, obj):
+        return reverse(
+            f"{obj.content_type.app_label}-api:{obj.content_type.model}-detail",
+            kwargs={"pk": obj.object_id},
+            request=self.context.get("request"),
+        )
+
+
 #
 # GraphQL, used by the openapi doc, not by the view
 #
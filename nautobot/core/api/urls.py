@@ -3,7 +3,7 @@ from django.urls import path, re_path
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 
-from nautobot.core.api.views import APIRootView, StatusView, GraphQLDRFAPIView
+from nautobot.core.api.views import APIRootView, SearchView, StatusView, GraphQLDRFAPIView
 from nautobot.extras.plugins.urls import plugin_api_patterns
 
 
@@ -33,6 +33,7 @@ urlpatterns = [
     path("users/", include("nautobot.users.api.urls")),
     path("virtualization/", include("nautobot.virtualization.api.urls")),
     path("status/", StatusView.as_view(), name="api-status"),
+    path("search/", SearchView.as_view(), name="api-search"),
     path("docs/", schema_view.with_ui("swagger"), name="api_docs"),
     path("redoc/", schema_view.with_ui("redoc"), name="api_redocs"),
     re_path(
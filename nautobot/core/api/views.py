@@ -5,10 +5,13 @@ from collections import OrderedDict
 from django import __version__ as DJANGO_VERSION
 from django.apps import apps
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.http.response import HttpResponseBadRequest
-from django.db import transaction
-from django.db.models import ProtectedError
+from django.db import router, transaction
+from django.db.models import Model, ProtectedError
+from django.db.models.deletion import Collector
+from django.shortcuts import get_object_or_404
 from django_rq.queues import get_connection as get_rq_connection
 from rest_framework import status
 from rest_framework.response import Response
@@ -18,6 +21,7 @@ from rest_framework.viewsets import ModelViewSet as ModelViewSet_
 from rest_framework.viewsets import ReadOnlyModelViewSet as ReadOnlyModelViewSet_
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.exceptions import PermissionDenied, ParseError
+from drf_yasg import openapi
 from drf_yasg.openapi import Schema, TYPE_OBJECT, TYPE_ARRAY
 from drf_yasg.utils import swagger_auto_schema
 from rq.worker import Worker as RQWorker
@@ -32,6 +36,9 @@ from graphene_django.views import GraphQLView, instantiate_middleware, HttpError
 from nautobot.core.celery import app as celery_app
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.pagination import OptionalLimitOffsetPagination
+from nautobot.utilities.exceptions import CeleryWorkerNotRunningException
+from nautobot.extras.search import search
 from nautobot.utilities.api import get_serializer_for_model
 from . import serializers
 
@@ -168,6 +175,53 @@ class ModelViewSetMixin:
 
         return super().get_queryset()
 
+    def list(self, request, *args, **kwargs):
+        if "export" in request.query_params:
+            return self.enqueue_export(request)
+        return super().list(request, *args, **kwargs)
+
+    def enqueue_export(self, request):
+        """
+        Enqueue a background job to export the objects matching the request's filters, returning its JobResult.
+
+        As in the web UI, `?export` selects the model's built-in YAML or CSV export, and `?export=<name>` the
+        ExportTemplate of that name. Once the job has completed, the exported file can be downloaded from the
+        JobResult's `download` endpoint.
+        """
+        # Import added here to avoid circular imports with the extras app.
+        from nautobot.extras.api.serializers import JobResultSerializer
+        from nautobot.extras.models import ExportTemplate
+        from nautobot.extras.tasks import enqueue_export_task
+        from nautobot.extras.utils import get_worker_count
+        from nautobot.utilities.templatetags.helpers import validated_viewname
+
+        model = self.queryset.model
+        # The objects are retrieved in the background as by the list view in the web UI
+        view_name = validated_viewname(model, "list")
+        export_template = None
+        if request.query_params["export"]:
+            export_template = get_object_or_404(
+                ExportTemplate,
+                content_type=ContentType.objects.get_for_model(model),
+                name=request.query_params["export"],
+            )
+        elif not hasattr(model, "to_yaml") and not hasattr(model, "to_csv"):
+            view_name = None
+        if view_name is None:
+            raise ParseError(f"Export of {model._meta.verbose_name_plural} is not supported.")
+        if not request.user.is_authenticated:
+            # The exported file is only available to the user who requested it
+            raise PermissionDenied("Exports can only be requested by authenticated users.")
+
+        if not get_worker_count():
+            raise CeleryWorkerNotRunningException()
+
+        job_result = enqueue_export_task(
+            model, view_name, request.query_params.urlencode(), request.user, export_template=export_template
+        )
+        serializer = JobResultSerializer(job_result, context={"request": request})
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
     def initialize_request(self, request, *args, **kwargs):
         # Check if brief=True has been passed
         if request.method == "GET" and request.GET.get("brief"):
@@ -244,6 +298,32 @@ class ModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ModelViewSetMixi
         except ObjectDoesNotExist:
             raise PermissionDenied()
 
+    def perform_bulk_update(self, objects, update_data, partial):
+        if type(self).perform_update is not ModelViewSet.perform_update:
+            # Subclasses which customize perform_update() expect it to be called for each object
+            return super().perform_bulk_update(objects, update_data, partial)
+
+        model = self.queryset.model
+        logger = logging.getLogger("nautobot.core.api.views.ModelViewSet")
+        logger.info(f"Updating {len(update_data)} {model._meta.verbose_name_plural}")
+
+        # Each object is validated and saved in turn, so that its validation sees the objects already updated by this
+        # request. Object-level permissions are enforced for all of the saved objects at once.
+        try:
+            with transaction.atomic():
+                serializers = []
+                for obj in objects:
+                    data = update_data.get(str(obj.id))
+                    serializer = self.get_serializer(obj, data=data, partial=partial)
+                    serializer.is_valid(raise_exception=True)
+                    serializer.save()
+                    serializers.append(serializer)
+                self._validate_objects([serializer.instance for serializer in serializers])
+
+                return [serializer.data for serializer in serializers]
+        except ObjectDoesNotExist:
+            raise PermissionDenied()
+
     def perform_destroy(self, instance):
         model = self.queryset.model
         logger = logging.getLogger("nautobot.core.api.views.ModelViewSet")
@@ -251,6 +331,23 @@ class ModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ModelViewSetMixi
 
         return super().perform_destroy(instance)
 
+    def perform_bulk_destroy(self, objects):
+        model = self.queryset.model
+        if model.delete is not Model.delete or type(self).perform_destroy is not ModelViewSet.perform_destroy:
+            # The model's own delete(), or the subclass's perform_destroy(), must be called for each object
+            return super().perform_bulk_destroy(objects)
+
+        logger = logging.getLogger("nautobot.core.api.views.ModelViewSet")
+        objects = list(objects)
+        logger.info(f"Deleting {len(objects)} {model._meta.verbose_name_plural}")
+
+        # Collect the objects (and those related to them) for deletion together, as QuerySet.delete() does, rather
+        # than object by object. Signals (and thus change logging and webhooks) are still sent for each object.
+        with transaction.atomic():
+            collector = Collector(using=router.db_for_write(model))
+            collector.collect(objects)
+            collector.delete()
+
 
 class ReadOnlyModelViewSet(ModelViewSetMixin, ReadOnlyModelViewSet_):
     """
@@ -367,6 +464,49 @@ class StatusView(APIView):
         )
 
 
+#
+# Search
+#
+
+
+class SearchView(APIView):
+    """
+    Search objects of all types at once, as the global search of the web UI does, returning the matching objects which
+    the user is permitted to view, best matches first.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter("q", openapi.IN_QUERY, description="Text to search for", type=openapi.TYPE_STRING),
+            openapi.Parameter(
+                "obj_type",
+                openapi.IN_QUERY,
+                description="Only search objects of this type (e.g. 'device')",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={"200": serializers.SearchResultSerializer(many=True)},
+    )
+    def get(self, request):
+        # Import added here to avoid circular imports with the tables of each app.
+        from nautobot.core.constants import SEARCH_TYPES
+
+        models = None
+        obj_type = request.query_params.get("obj_type")
+        if obj_type:
+            if obj_type not in SEARCH_TYPES:
+                raise ParseError(f"Invalid obj_type: {obj_type}")
+            models = [SEARCH_TYPES[obj_type]["queryset"].model]
+
+        results = search(request.query_params.get("q", ""), request.user, models=models)
+        paginator = OptionalLimitOffsetPagination()
+        page = paginator.paginate_queryset(results.select_related("content_type"), request, view=self)
+        serializer = serializers.SearchResultSerializer(page, many=True, context={"request": request})
+        return paginator.get_paginated_response(serializer.data)
+
+
 #
 # GraphQL
 #
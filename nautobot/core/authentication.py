@@ -11,7 +11,9 @@ from django.contrib.auth.models import Group
 from django.db.models import Q
 
 from nautobot.users.models import ObjectPermission
+from nautobot.utilities.caching import VersionedCache
 from nautobot.utilities.permissions import (
+    compile_constraints,
     permission_is_exempt,
     resolve_permission,
     resolve_permission_ct,
@@ -20,33 +22,58 @@ from nautobot.utilities.permissions import (
 logger = logging.getLogger("nautobot.authentication")
 
 
+def _load_object_permissions(user_pk):
+    """
+    Load the permissions granted to the given user by ObjectPermissions.
+
+    Returns:
+        tuple: A dictionary mapping each permission name to the list of its constraint sets, and a dictionary mapping
+            each permission name to the Q object compiled from those constraint sets
+    """
+    # Retrieve all assigned and enabled ObjectPermissions
+    object_permissions = ObjectPermission.objects.filter(
+        Q(users=user_pk) | Q(groups__user=user_pk), enabled=True
+    ).prefetch_related("object_types")
+
+    # Create a dictionary mapping permissions to their constraints
+    perms = defaultdict(list)
+    for obj_perm in object_permissions:
+        for object_type in obj_perm.object_types.all():
+            for action in obj_perm.actions:
+                perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
+                perms[perm_name].extend(obj_perm.list_constraints())
+
+    return dict(perms), {perm_name: compile_constraints(constraints) for perm_name, constraints in perms.items()}
+
+
+# Permissions of each user keyed by user ID; invalidated by signal handlers when ObjectPermissions, their assignment to
+# users and groups, or group memberships change
+object_permission_cache = VersionedCache("users.object_permission", _load_object_permissions)
+
+
 class ObjectPermissionBackend(ModelBackend):
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return dict()
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache, user_obj._object_perm_constraints = object_permission_cache.get(user_obj.pk)
         return user_obj._object_perm_cache
 
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
         """
-        # Retrieve all assigned and enabled ObjectPermissions
-        object_permissions = ObjectPermission.objects.filter(
-            Q(users=user_obj) | Q(groups__user=user_obj), enabled=True
-        ).prefetch_related("object_types")
-
-        # Create a dictionary mapping permissions to their constraints
-        perms = defaultdict(list)
-        for obj_perm in object_permissions:
-            for object_type in obj_perm.object_types.all():
-                for action in obj_perm.actions:
-                    perm_name = f"{object_type.app_label}.{action}_{object_type.model}"
-                    perms[perm_name].extend(obj_perm.list_constraints())
-
+        perms, _ = object_permission_cache.get(user_obj.pk)
         return perms
 
+    def get_permission_constraints(self, user_obj, perm):
+        """
+        Return a Q object matching all objects on which the user has been granted the given permission by an
+        ObjectPermission, compiled from the constraints of those ObjectPermissions.
+        """
+        self.get_all_permissions(user_obj)
+        return user_obj._object_perm_constraints[perm]
+
     def has_perm(self, user_obj, perm, obj=None):
         app_label, action, model_name = resolve_permission(perm)
 
@@ -71,26 +98,52 @@ class ObjectPermissionBackend(ModelBackend):
         if obj is None:
             return True
 
-        # Sanity check: Ensure that the requested permission applies to the specified object
-        model = obj._meta.model
+        return obj.pk in self.get_permitted_pks(user_obj, perm, [obj])
+
+    def get_permitted_pks(self, user_obj, perm, objs):
+        """
+        Return the set of primary keys of those of the given objects (all of the same model) on which the user has
+        been granted the given permission, as `has_perm()` would for each of them, but using at most one query.
+
+        The result for each object is memoized on the user instance, and hence for the duration of the request.
+        """
+        objs = list(objs)
+        if not objs:
+            return set()
+        app_label, action, model_name = resolve_permission(perm)
+
+        # Sanity check: Ensure that the requested permission applies to the specified objects
+        model = objs[0]._meta.model
         if model._meta.label_lower != ".".join((app_label, model_name)):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
-        # Compile a query filter that matches all instances of the specified model
-        obj_perm_constraints = self.get_all_permissions(user_obj)[perm]
-        constraints = Q()
-        for perm_constraints in obj_perm_constraints:
-            if perm_constraints:
-                constraints |= Q(**perm_constraints)
-            else:
-                # Found ObjectPermission with null constraints; allow model-level access
-                constraints = Q()
-                break
-
-        # Permission to perform the requested action on the object depends on whether the specified object matches
-        # the specified constraints. Note that this check is made against the *database* record representing the object,
+        # Superusers implicitly have all permissions, and exempt permissions are not enforced
+        if (user_obj.is_active and user_obj.is_superuser) or permission_is_exempt(perm):
+            return {obj.pk for obj in objs}
+
+        # Handle inactive/anonymous users and users without any applicable ObjectPermission
+        if not user_obj.is_active or user_obj.is_anonymous or perm not in self.get_all_permissions(user_obj):
+            return set()
+
+        # Retrieve the query filter that matches all permitted instances of the specified model
+        constraints = self.get_permission_constraints(user_obj, perm)
+        if not constraints:
+            # Found ObjectPermission with null constraints; allow model-level access
+            return {obj.pk for obj in objs}
+
+        # Permission to perform the requested action on each object depends on whether the object matches the
+        # specified constraints. Note that this check is made against the *database* record representing the object,
         # not the instance itself.
-        return model.objects.filter(constraints, pk=obj.pk).exists()
+        if not hasattr(user_obj, "_object_perm_pk_cache"):
+            user_obj._object_perm_pk_cache = defaultdict(dict)
+        results = user_obj._object_perm_pk_cache[perm]
+        unknown_pks = {obj.pk for obj in objs if obj.pk not in results}
+        if unknown_pks:
+            permitted_pks = set(model.objects.filter(constraints, pk__in=unknown_pks).values_list("pk", flat=True))
+            for pk in unknown_pks:
+                results[pk] = pk in permitted_pks
+
+        return {obj.pk for obj in objs if results[obj.pk]}
 
 
 class RemoteUserBackend(_RemoteUserBackend):
@@ -1,6 +1,7 @@
 import logging
 
 from celery import current_app
+from celery.beat import ScheduleEntry
 from django_celery_beat.schedulers import ModelEntry, DatabaseScheduler
 from kombu.utils.json import loads
 
@@ -61,3 +62,24 @@ class NautobotDatabaseScheduler(DatabaseScheduler):
     Entry = NautobotScheduleEntry
     Model = ScheduledJob
     Changes = ScheduledJobs
+
+    def setup_schedule(self):
+        # Statically configured entries (CELERY_BEAT_SCHEDULE, such as Nautobot's own housekeeping tasks) aren't Jobs,
+        # so rather than being stored as ScheduledJob records, they're kept in memory alongside those from the database.
+        self._static_entries = {
+            name: ScheduleEntry(name=name, app=self.app, **fields)
+            for name, fields in self.app.conf.beat_schedule.items()
+        }
+        self.install_default_entries(self.schedule)
+
+    def all_as_schedule(self):
+        schedule = super().all_as_schedule()
+        schedule.update(self._static_entries)
+        return schedule
+
+    def reserve(self, entry):
+        if entry.name not in self._static_entries:
+            return super().reserve(entry)
+
+        new_entry = self._static_entries[entry.name] = self._schedule[entry.name] = next(entry)
+        return new_entry
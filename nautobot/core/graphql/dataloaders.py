@@ -0,0 +1,178 @@
+"""Batch loading of the fields which GraphQL resolves for each object in a list (tags, config contexts, relationships).
+
+Rather than querying the database for each object, a resolver registers the object with a `DataLoader` and returns a
+`Promise`; once all objects of the list have been registered, the loader retrieves the field for all of them at once.
+"""
+
+import logging
+
+import graphene_django_optimizer as gql_optimizer
+from django.contrib.contenttypes.models import ContentType
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from nautobot.extras.choices import RelationshipSideChoices
+from nautobot.extras.models import RelationshipAssociation, Tag, TaggedItem
+
+logger = logging.getLogger("nautobot.graphql.dataloaders")
+
+
+def get_dataloader(info, loader_class, *args):
+    """
+    Return the `loader_class(*args)` for the request being executed, creating it on first use.
+
+    Loaders are kept on the request (`info.context`) so that the objects of a list, which are resolved separately, are
+    collected by the same loader.
+    """
+    loaders = getattr(info.context, "_graphql_dataloaders", None)
+    if loaders is None:
+        loaders = info.context._graphql_dataloaders = {}
+    key = (loader_class, *args)
+    if key not in loaders:
+        loaders[key] = loader_class(*args)
+    return loaders[key]
+
+
+class BaseLoader(DataLoader):
+    """
+    Base class of the loaders below, whose results are never cached, so that several queries executed with the same
+    request always see current data.
+    """
+
+    def __init__(self):
+        super().__init__(cache=False)
+
+    def batch_load_fn(self, keys):
+        return Promise.resolve(self.load_many_now(keys))
+
+    def load_many_now(self, keys):
+        """
+        Return the value for each of the given keys, in the same order. Keys may be repeated.
+        """
+        raise NotImplementedError
+
+
+def _get_tag_ids(model, pks):
+    """
+    Return the IDs of the Tags of each of the objects of the given model with the given primary keys, by a single query.
+    """
+    tag_ids = {}
+    tagged_items = TaggedItem.objects.filter(
+        content_type=ContentType.objects.get_for_model(model), object_id__in=set(pks)
+    ).values_list("object_id", "tag_id")
+    for object_id, tag_id in tagged_items:
+        tag_ids.setdefault(object_id, []).append(tag_id)
+    return tag_ids
+
+
+class TagsLoader(BaseLoader):
+    """
+    Load the Tags of objects of the given model, by their primary keys.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def load_many_now(self, keys):
+        tags = {}
+        tagged_items = (
+            TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(self.model), object_id__in=set(keys)
+            )
+            .select_related("tag")
+            .order_by(*(f"tag__{field}" for field in Tag._meta.ordering))
+        )
+        for tagged_item in tagged_items:
+            tags.setdefault(tagged_item.object_id, []).append(tagged_item.tag)
+        return [tags.get(key, []) for key in keys]
+
+
+class ConfigContextLoader(BaseLoader):
+    """
+    Load the rendered configuration context of objects of the given model (Devices or VirtualMachines; see
+    `get_config_context()`), given the objects themselves.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+    def load_many_now(self, keys):
+        # Import added here to avoid circular imports with ConfigContext.
+        from nautobot.extras.config_contexts import get_config_context_index
+
+        pending = [obj for obj in keys if getattr(obj, "config_context_data", None) is None]
+        if pending:
+            index = get_config_context_index()
+            tag_ids = _get_tag_ids(self.model, [obj.pk for obj in pending])
+            for obj in pending:
+                obj.config_context_data = index.get_context_data(obj, tag_ids=tag_ids.get(obj.pk, []))
+        return [obj.get_config_context() for obj in keys]
+
+
+class RelationshipLoader(BaseLoader):
+    """
+    Load the peers of objects on the given side of a Relationship, by the objects' primary keys: a list of peers, or
+    a single peer (or None), depending on the type of the relationship.
+
+    The peers are retrieved with the optimizations (`select_related()` etc.) suggested by graphene_django_optimizer
+    for the subfields requested by the field being resolved (`info`), so each field node of the query (identified by
+    `field_id`) has its own loader.
+    """
+
+    def __init__(self, relationship, side, peer_model, field_id):
+        super().__init__()
+        self.relationship = relationship
+        self.side = side
+        self.peer_model = peer_model
+        # Set by the resolver before loading each key
+        self.info = None
+
+    def get_peer_ids(self, keys):
+        """
+        Return the IDs of the peers of each of the objects with the given primary keys.
+        """
+        associations = RelationshipAssociation.objects.filter(relationship=self.relationship)
+        peer_ids = {}
+        if not self.relationship.symmetric:
+            # Get the objects on the other side of this relationship
+            peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+            for object_id, peer_id in associations.filter(**{f"{self.side}_id__in": keys}).values_list(
+                f"{self.side}_id", f"{peer_side}_id"
+            ):
+                peer_ids.setdefault(object_id, []).append(peer_id)
+        else:
+            # Get objects that are peers for this relationship, regardless of side
+            for source_id, destination_id in associations.filter(source_id__in=keys).values_list(
+                "source_id", "destination_id"
+            ):
+                peer_ids.setdefault(source_id, []).append(destination_id)
+            for source_id, destination_id in associations.filter(destination_id__in=keys).values_list(
+                "source_id", "destination_id"
+            ):
+                peer_ids.setdefault(destination_id, []).append(source_id)
+        return peer_ids
+
+    def load_many_now(self, keys):
+        keys_set = set(keys)
+        peer_ids = self.get_peer_ids(keys_set)
+        queryset = self.peer_model.objects.filter(id__in={pk for pks in peer_ids.values() for pk in pks})
+        try:
+            peers = list(gql_optimizer.query(queryset, self.info))
+        except (AttributeError, TypeError):
+            # https://github.com/nautobot/nautobot/issues/1228
+            logger.debug("Caught exception in graphene_django_optimizer, falling back to un-optimized query")
+            peers = list(queryset)
+        # Peers in the order of the peer model
+        peers = {peer.pk: (i, peer) for i, peer in enumerate(peers)}
+
+        results = []
+        has_many = self.relationship.has_many(RelationshipSideChoices.OPPOSITE[self.side])
+        for key in keys:
+            key_peers = [peer for _, peer in sorted(peers[pk] for pk in set(peer_ids.get(key, [])) if pk in peers)]
+            if has_many:
+                results.append(key_peers)
+            else:
+                results.append(key_peers[0] if key_peers else None)
+        return results
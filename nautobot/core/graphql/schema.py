@@ -10,6 +10,7 @@ import graphene
 from graphene.types import generic
 
 from nautobot.circuits.graphql.types import CircuitTerminationType
+from nautobot.core.graphql.dataloaders import ConfigContextLoader, get_dataloader, TagsLoader
 from nautobot.core.graphql.utils import str_to_var_name
 from nautobot.core.graphql.generators import (
     generate_attrs_for_schema_type,
@@ -292,8 +293,11 @@ def extend_schema_type_tags(schema_type, model):
     if "tags" not in fields_name:
         return schema_type
 
-    def resolve_tags(self, args):
-        return self.tags.all()
+    def resolve_tags(self, info):
+        if "tags" in getattr(self, "_prefetched_objects_cache", {}):
+            return self.tags.all()
+        # Retrieve the Tags of all objects in the list being resolved at once
+        return get_dataloader(info, TagsLoader, model).load(self.pk)
 
     setattr(schema_type, "resolve_tags", resolve_tags)
 
@@ -315,8 +319,9 @@ def extend_schema_type_config_context(schema_type, model):
     if "local_context_data" not in fields_name:
         return schema_type
 
-    def resolve_config_context(self, args):
-        return self.get_config_context()
+    def resolve_config_context(self, info):
+        # Determine the config contexts of all objects in the list being resolved at once
+        return get_dataloader(info, ConfigContextLoader, model).load(self)
 
     schema_type._meta.fields["config_context"] = graphene.Field.mounted(generic.GenericScalar())
     setattr(schema_type, "resolve_config_context", resolve_config_context)
@@ -1,7 +1,11 @@
 import graphene
 from graphene_django.types import ObjectType
+from graphql import GraphQLError
 
+from nautobot.core.constants import SEARCH_MAX_RESULTS, SEARCH_TYPES
+from nautobot.extras.search import search
 from .schema import generate_query_mixin
+from .types import SearchResultType
 
 
 DynamicGraphQL = generate_query_mixin()
@@ -10,5 +14,21 @@ DynamicGraphQL = generate_query_mixin()
 class Query(ObjectType, DynamicGraphQL):
     """Contains the entire GraphQL Schema definition for Nautobot."""
 
+    search = graphene.List(
+        SearchResultType,
+        q=graphene.String(required=True),
+        obj_type=graphene.String(),
+        limit=graphene.Int(default_value=SEARCH_MAX_RESULTS),
+        description="Search objects of all types at once, best matches first",
+    )
+
+    def resolve_search(self, info, q, obj_type=None, limit=SEARCH_MAX_RESULTS):
+        models = None
+        if obj_type:
+            if obj_type not in SEARCH_TYPES:
+                raise GraphQLError(f"Invalid obj_type: {obj_type}")
+            models = [SEARCH_TYPES[obj_type]["queryset"].model]
+        return search(q, info.context.user, models=models).select_related("content_type")[:limit]
+
 
 schema = graphene.Schema(query=Query, auto_camelcase=False)
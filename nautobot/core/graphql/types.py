@@ -1,5 +1,6 @@
 from django.contrib.contenttypes.models import ContentType
 
+import graphene
 import graphene_django_optimizer as gql_optimizer
 
 
@@ -12,3 +13,23 @@ class ContentTypeType(gql_optimizer.OptimizedDjangoObjectType):
 
     class Meta:
         model = ContentType
+
+
+class SearchResultType(graphene.ObjectType):
+    """
+    A result of the global search: an object of any searchable type, identified by its type and ID.
+    """
+
+    id = graphene.UUID()
+    object_type = graphene.String()
+    display = graphene.String()
+    rank = graphene.Int()
+
+    def resolve_id(self, info):
+        return self.object_id
+
+    def resolve_object_type(self, info):
+        return f"{self.content_type.app_label}.{self.content_type.model}"
+
+    def resolve_display(self, info):
+        return self.name
@@ -11,6 +11,7 @@ This will run the following management commands with default settings, in order:
 
 - migrate
 - trace_paths
+- rebuild_search_index --missing
 - collectstatic
 - remove_stale_contenttypes
 - clearsessions
@@ -56,6 +57,13 @@ class Command(BaseCommand):
             default=True,
             help="Do not automatically perform any database migrations.",
         )
+        parser.add_argument(
+            "--no-rebuild-search-index",
+            action="store_false",
+            dest="rebuild_search_index",
+            default=True,
+            help="Do not automatically add missing objects to the search index.",
+        )
         parser.add_argument(
             "--no-remove-stale-contenttypes",
             action="store_false",
@@ -89,6 +97,12 @@ class Command(BaseCommand):
             call_command("trace_paths", no_input=True)
             print()
 
+        # Run rebuild_search_index
+        if options.get("rebuild_search_index"):
+            print("Indexing objects for search...")
+            call_command("rebuild_search_index", missing=True)
+            print()
+
         # Run collectstatic
         if options.get("collectstatic"):
             print("Collecting static files...")
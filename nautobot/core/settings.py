@@ -1,5 +1,6 @@
 import os
 import platform
+from datetime import timedelta
 
 from django.contrib.messages import constants as messages
 import django.forms
@@ -54,6 +55,17 @@ ALLOWED_URL_SCHEMES = (
     "xmpp",
 )
 
+# Changelog retention housekeeping
+CHANGELOG_PRUNE_BATCH_DELAY = 0
+CHANGELOG_PRUNE_BATCH_SIZE = 1000
+
+# The maximum number of objects updated by a single query when provisioning or deleting custom field data
+CUSTOM_FIELD_DATA_BATCH_SIZE = 1000
+
+# The maximum number of compiled Jinja2 templates (computed fields, custom links, export templates, etc.) retained by
+# each process
+JINJA2_TEMPLATE_CACHE_SIZE = 256
+
 # Base directory wherein all created files (jobs, git repositories, file uploads, static files) will be stored)
 NAUTOBOT_ROOT = os.getenv("NAUTOBOT_ROOT", os.path.expanduser("~/.nautobot"))
 
@@ -73,8 +85,27 @@ EXEMPT_EXCLUDE_MODELS = (
 )
 
 EXEMPT_VIEW_PERMISSIONS = []
+
+# Exports of more than this many objects from the web UI are generated by a background job (0 to disable)
+EXPORT_JOB_THRESHOLD = 0
+
 GIT_ROOT = os.getenv("NAUTOBOT_GIT_ROOT", os.path.join(NAUTOBOT_ROOT, "git").rstrip("/"))
+
+# Clone Git repositories shallowly, checking out only the directories of their provided contents
+GIT_SHALLOW_CHECKOUT = False
+
+# Maximum number of Git repositories refreshed at once when discovering jobs
+GIT_SYNC_MAX_WORKERS = 4
+
 HTTP_PROXIES = None
+
+# CSV imports of more than this many rows from the web UI are performed by a background job (0 to disable)
+IMPORT_JOB_THRESHOLD = 0
+
+# Log entries of running Jobs are written in batches of this many entries, or once this many seconds have passed
+JOB_LOG_BUFFER_SIZE = 100
+JOB_LOG_FLUSH_INTERVAL = 1
+
 JOBS_ROOT = os.getenv("NAUTOBOT_JOBS_ROOT", os.path.join(NAUTOBOT_ROOT, "jobs").rstrip("/"))
 MAINTENANCE_MODE = False
 
@@ -108,6 +139,13 @@ SOCIAL_AUTH_BACKEND_PREFIX = "social_core.backends"
 STORAGE_BACKEND = None
 STORAGE_CONFIG = {}
 
+# Webhook delivery
+WEBHOOK_CONCURRENCY = 8
+WEBHOOK_CONCURRENCY_PER_RECEIVER = 4
+WEBHOOK_RETRIES = 3
+WEBHOOK_RETRY_BACKOFF = 1
+WEBHOOK_TIMEOUT = 30
+
 # Test runner that is aware of our use of "integration" tags and only runs
 # integration tests if explicitly passed in with `nautobot-server test --tag integration`.
 TEST_RUNNER = "nautobot.core.tests.runner.NautobotTestRunner"
@@ -556,6 +594,7 @@ CACHEOPS = {
     "dcim.rackgroup": None,  # MPTT models are exempt due to raw SQL
     "dcim.*": {"ops": "all"},
     "ipam.*": {"ops": "all"},
+    "extras.searchindexentry": None,  # Search results are too varied to be worth caching
     "extras.*": {"ops": "all"},
     "users.*": {"ops": "all"},
     "tenancy.tenantgroup": None,  # MPTT models are exempt due to raw SQL
@@ -630,6 +669,14 @@ CELERY_RESULT_SERIALIZER = "nautobot_json"
 
 CELERY_BEAT_SCHEDULER = "nautobot.core.celery.schedulers:NautobotDatabaseScheduler"
 
+# Housekeeping tasks run periodically by the Celery beat scheduler, in addition to any scheduled Jobs
+CELERY_BEAT_SCHEDULE = {
+    "nautobot.extras.tasks.prune_changelog": {
+        "task": "nautobot.extras.tasks.prune_changelog",
+        "schedule": timedelta(hours=1),
+    },
+}
+
 #
 # Custom branding (logo and title)
 #
@@ -3,30 +3,32 @@ from django.test.runner import DiscoverRunner
 
 class NautobotTestRunner(DiscoverRunner):
     """
-    Custom test runner that excludes integration tests by default.
+    Custom test runner that excludes integration and performance tests by default.
 
-    This test runner is aware of our use of the "integration" tag and only runs integration tests if
-    explicitly passed in with `nautobot-server test --tag integration`.
+    This test runner is aware of our use of the "integration" and "performance" tags and only runs integration or
+    performance tests if explicitly passed in with `nautobot-server test --tag integration` or `--tag performance`.
 
     By Nautobot convention, integration tests must be tagged with "integration". The base
     `nautobot.utilities.testing.integration.SeleniumTestCase` has this tag, therefore any test cases
     inheriting from that class do not need to be explicitly tagged.
 
     Only integration tests that DO NOT inherit from `SeleniumTestCase` will need to be explicitly tagged.
+
+    Likewise, performance tests inheriting from `nautobot.utilities.testing.performance.PerformanceTestCase` are
+    tagged with "performance".
     """
 
-    exclude_tags = ["integration"]
+    exclude_tags = ["integration", "performance"]
 
     def __init__(self, **kwargs):
-        # Assert "integration" hasn't been provided w/ --tag
+        # Assert "integration" or "performance" hasn't been provided w/ --tag
         incoming_tags = kwargs.get("tags") or []
 
         # Assert "exclude_tags" hasn't been provided w/ --exclude-tag; else default to our own.
         incoming_exclude_tags = kwargs.get("exclude_tags") or []
 
-        # Only include our excluded tags if "integration" isn't provided w/ --tag
-        if "integration" not in incoming_tags:
-            incoming_exclude_tags.extend(self.exclude_tags)
-            kwargs["exclude_tags"] = incoming_exclude_tags
+        # Only include each of our excluded tags if it isn't provided w/ --tag
+        incoming_exclude_tags.extend(tag for tag in self.exclude_tags if tag not in incoming_tags)
+        kwargs["exclude_tags"] = incoming_exclude_tags
 
         super().__init__(**kwargs)
@@ -1,13 +1,18 @@
 import json
+from unittest import mock
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.test import override_settings
 from django.urls import reverse
 
 from constance import config
 from constance.test import override_config
 
-from nautobot.circuits.models import Provider
+from nautobot.circuits.models import Circuit, CircuitType, Provider
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.models import ExportTemplate, JobLogEntry, JobResult, ObjectChange, Status
+from nautobot.users.models import ObjectPermission
 from nautobot.utilities.testing import APITestCase
 
 
@@ -126,3 +131,172 @@ class APIPaginationTestCase(APITestCase):
         response = self.client.get(f"{self.url}?limit={limit}", **self.header)
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
+
+
+class APIBulkOperationsTestCase(APITestCase):
+    """
+    Test the bulk update and deletion of objects through a model's list endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.providers = [Provider.objects.create(name=f"Provider {i}", slug=f"provider-{i}") for i in range(3)]
+        cls.url = reverse("circuits-api:provider-list")
+
+    def test_bulk_update_is_all_or_none(self):
+        self.add_permissions("circuits.change_provider")
+        data = [
+            {"id": str(self.providers[0].pk), "asn": 65001},
+            {"id": str(self.providers[1].pk), "asn": "invalid"},
+        ]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertFalse(Provider.objects.filter(asn__isnull=False).exists())
+        self.assertFalse(ObjectChange.objects.exists())
+
+    def test_bulk_update_validates_objects_against_earlier_updates(self):
+        self.add_permissions("circuits.change_provider")
+        data = [{"id": str(provider.pk), "name": "Duplicate Provider"} for provider in self.providers[:2]]
+
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertFalse(Provider.objects.filter(name="Duplicate Provider").exists())
+        self.assertFalse(ObjectChange.objects.exists())
+
+    def test_bulk_update_with_constrained_permission(self):
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission", constraints={"asn__lt": 65100}, actions=["change"]
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Provider))
+        data = [
+            {"id": str(self.providers[0].pk), "asn": 65001},
+            {"id": str(self.providers[1].pk), "asn": 65101},
+        ]
+
+        # Objects are only permitted to be changed while their ASN is below 65100
+        Provider.objects.update(asn=65000)
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+        self.assertEqual(set(Provider.objects.values_list("asn", flat=True)), {65000})
+
+        data[1]["asn"] = 65099
+        response = self.client.patch(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(Provider.objects.get(pk=self.providers[1].pk).asn, 65099)
+        self.assertEqual(
+            ObjectChange.objects.filter(action=ObjectChangeActionChoices.ACTION_UPDATE, user=self.user).count(), 2
+        )
+
+    def test_bulk_delete(self):
+        self.add_permissions("circuits.delete_provider")
+        data = [{"id": str(provider.pk)} for provider in self.providers[:2]]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 204)
+        self.assertEqual(list(Provider.objects.values_list("pk", flat=True)), [self.providers[2].pk])
+        # Each deleted object is still change-logged
+        self.assertEqual(
+            set(
+                ObjectChange.objects.filter(action=ObjectChangeActionChoices.ACTION_DELETE).values_list(
+                    "changed_object_id", flat=True
+                )
+            ),
+            {provider.pk for provider in self.providers[:2]},
+        )
+
+    def test_bulk_delete_protected_objects(self):
+        self.add_permissions("circuits.delete_provider")
+        circuit_type = CircuitType.objects.create(name="Circuit Type 1", slug="circuit-type-1")
+        Circuit.objects.create(
+            cid="Circuit 1",
+            provider=self.providers[1],
+            type=circuit_type,
+            status=Status.objects.get_for_model(Circuit).get(slug="active"),
+        )
+        data = [{"id": str(provider.pk)} for provider in self.providers]
+
+        response = self.client.delete(self.url, data, format="json", **self.header)
+        self.assertHttpStatus(response, 409)
+        self.assertEqual(Provider.objects.count(), 3)
+
+
+@mock.patch("nautobot.extras.tasks.export_objects.apply_async")
+@mock.patch("nautobot.extras.utils.get_worker_count", return_value=1)
+class APIExportTestCase(APITestCase):
+    """
+    Test the export of objects, in a background job, through a model's list endpoint.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Provider.objects.create(name="Provider 1", slug="provider-1")
+        cls.url = reverse("circuits-api:provider-list")
+
+    def test_export_enqueued(self, mock_get_worker_count, mock_apply_async):
+        self.add_permissions("circuits.view_provider")
+
+        response = self.client.get(f"{self.url}?export&slug=provider-1", **self.header)
+        self.assertHttpStatus(response, 202)
+        job_result = JobResult.objects.get(pk=response.data["id"])
+        self.assertEqual(response.data["name"], "nautobot_providers.csv")
+        self.assertEqual(job_result.user, self.user)
+
+        kwargs = mock_apply_async.call_args.kwargs["kwargs"]
+        self.assertEqual(kwargs["view_name"], "circuits:provider_list")
+        self.assertIn("slug=provider-1", kwargs["query_string"])
+        self.assertIsNone(kwargs["export_template_pk"])
+
+    def test_export_template_enqueued(self, mock_get_worker_count, mock_apply_async):
+        self.add_permissions("circuits.view_provider")
+        export_template = ExportTemplate.objects.create(
+            content_type=ContentType.objects.get_for_model(Provider),
+            name="Provider names",
+            template_code="{% for obj in queryset %}{{ obj.name }}\n{% endfor %}",
+            file_extension="txt",
+        )
+
+        response = self.client.get(f"{self.url}?export=Provider+names", **self.header)
+        self.assertHttpStatus(response, 202)
+        self.assertEqual(response.data["name"], "nautobot_providers.txt")
+        self.assertEqual(mock_apply_async.call_args.kwargs["kwargs"]["export_template_pk"], export_template.pk)
+
+    def test_export_template_not_found(self, mock_get_worker_count, mock_apply_async):
+        self.add_permissions("circuits.view_provider")
+
+        response = self.client.get(f"{self.url}?export=Nonexistent", **self.header)
+        self.assertHttpStatus(response, 404)
+        mock_apply_async.assert_not_called()
+        self.assertFalse(JobResult.objects.exists())
+
+    def test_export_not_supported(self, mock_get_worker_count, mock_apply_async):
+        self.add_permissions("extras.view_joblogentry")
+
+        response = self.client.get(f"{reverse('extras-api:joblogentry-list')}?export", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.data["detail"], f"Export of {JobLogEntry._meta.verbose_name_plural} is not supported."
+        )
+        mock_apply_async.assert_not_called()
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_export_without_permission(self, mock_get_worker_count, mock_apply_async):
+        response = self.client.get(f"{self.url}?export", **self.header)
+        self.assertHttpStatus(response, 403)
+        mock_apply_async.assert_not_called()
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_export_anonymous(self, mock_get_worker_count, mock_apply_async):
+        response = self.client.get(f"{self.url}?export")
+        self.assertHttpStatus(response, 403)
+        mock_apply_async.assert_not_called()
+        self.assertFalse(JobResult.objects.exists())
+
+    def test_export_without_worker(self, mock_get_worker_count, mock_apply_async):
+        self.add_permissions("circuits.view_provider")
+        mock_get_worker_count.return_value = 0
+
+        response = self.client.get(f"{self.url}?export", **self.header)
+        self.assertHttpStatus(response, 503)
+        mock_apply_async.assert_not_called()
@@ -15,7 +15,8 @@ from nautobot.dcim.models import Site
 from nautobot.extras.models import Status
 from nautobot.ipam.models import Prefix
 from nautobot.users.models import ObjectPermission, Token
-from nautobot.utilities.testing import TestCase
+from nautobot.utilities.permissions import get_permitted_pks
+from nautobot.utilities.testing import TestCase, TransactionTestCase
 
 
 # Use the proper swappable User model
@@ -412,3 +413,100 @@ class ObjectPermissionAPIViewTestCase(TestCase):
         url = reverse("ipam-api:prefix-detail", kwargs={"pk": self.prefixes[0].pk})
         response = self.client.delete(url, format="json", **self.header)
         self.assertEqual(response.status_code, 204)
+
+
+class ObjectPermissionBackendTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+
+        cls.sites = (
+            Site.objects.create(name="Site 1", slug="site-1"),
+            Site.objects.create(name="Site 2", slug="site-2"),
+            Site.objects.create(name="Site 3", slug="site-3"),
+        )
+
+    def setUp(self):
+        self.user = User.objects.create(username="testuser")
+
+    def test_get_permitted_pks(self):
+
+        # No permission
+        self.assertEqual(get_permitted_pks(self.user, "dcim.change_site", self.sites), set())
+
+        # Assign object permission
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints=[{"name": "Site 1"}, {"name": "Site 3"}],
+            actions=["change"],
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Site))
+        self.user = User.objects.get(pk=self.user.pk)
+        self.assertTrue(self.user.has_perm("dcim.change_site"))
+
+        # All objects are evaluated in one query, and the results are memoized for has_perm()
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_permitted_pks(self.user, "dcim.change_site", self.sites),
+                {self.sites[0].pk, self.sites[2].pk},
+            )
+        with self.assertNumQueries(0):
+            self.assertTrue(self.user.has_perm("dcim.change_site", self.sites[0]))
+            self.assertFalse(self.user.has_perm("dcim.change_site", self.sites[1]))
+
+        self.assertEqual(get_permitted_pks(self.user, "dcim.delete_site", self.sites), set())
+
+    def test_get_permitted_pks_superuser(self):
+        self.user.is_superuser = True
+        self.user.save()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_permitted_pks(self.user, "dcim.delete_site", self.sites),
+                {site.pk for site in self.sites},
+            )
+
+
+class ObjectPermissionCacheTestCase(TransactionTestCase):
+    def setUp(self):
+        self.site = Site.objects.create(name="Site 1", slug="site-1")
+        self.user = User.objects.create(username="testuser")
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test permission",
+            constraints={"name": "Site 1"},
+            actions=["view"],
+        )
+        self.obj_perm.users.add(self.user)
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Site))
+
+    def get_user(self):
+        # A new instance of the user, as for a new request
+        return User.objects.get(pk=self.user.pk)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_permissions_cached(self):
+        self.assertTrue(Site.objects.restrict(self.get_user(), "view").exists())
+
+        user = self.get_user()
+        with self.assertNumQueries(0):
+            self.assertIn("dcim.view_site", user.get_all_permissions())
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=[])
+    def test_cache_invalidated(self):
+        self.assertTrue(Site.objects.restrict(self.get_user(), "view").exists())
+
+        # Changing the permission's constraints
+        self.obj_perm.constraints = {"name": "Site 2"}
+        self.obj_perm.save()
+        self.assertFalse(Site.objects.restrict(self.get_user(), "view").exists())
+
+        # Removing the user from the permission, and then adding it by way of a group
+        self.obj_perm.constraints = None
+        self.obj_perm.save()
+        self.obj_perm.users.remove(self.user)
+        self.assertFalse(self.get_user().has_perm("dcim.view_site"))
+        group = Group.objects.create(name="Group 1")
+        self.obj_perm.groups.add(group)
+        self.assertFalse(self.get_user().has_perm("dcim.view_site"))
+        self.user.groups.add(group)
+        self.assertTrue(self.get_user().has_perm("dcim.view_site"))
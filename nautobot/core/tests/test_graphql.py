@@ -5,7 +5,9 @@ import uuid
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.test.client import RequestFactory
 from django.urls import reverse
 from graphql import GraphQLError
@@ -59,6 +61,7 @@ from nautobot.extras.models import (
     Relationship,
     RelationshipAssociation,
     Status,
+    Tag,
     Webhook,
 )
 from nautobot.ipam.models import IPAddress, VLAN
@@ -896,6 +899,61 @@ class GraphQLQueryTest(TestCase):
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_and_tags_batched(self):
+        """The config context and tags of all devices in a list are each retrieved by a fixed number of queries."""
+        query = """
+        query ($name: [String]) {
+            devices (name: $name) {
+                name
+                config_context
+                tags {
+                    name
+                }
+            }
+        }
+        """
+
+        with CaptureQueriesContext(connection) as single_device_queries:
+            result = self.execute_query(query, variables={"name": ["Device 1"]})
+        self.assertEqual(len(result.data["devices"]), 1)
+
+        with CaptureQueriesContext(connection) as all_devices_queries:
+            result = self.execute_query(query, variables={"name": ["Device 1", "Device 2", "Device 3"]})
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["devices"]), 3)
+        self.assertEqual(result.data["devices"][0]["config_context"], {"a": 123, "b": 456, "c": 777})
+        self.assertLessEqual(len(all_devices_queries), len(single_device_queries))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_of_devices_and_virtual_machines(self):
+        """The config contexts of Devices and VirtualMachines queried together are each based on their own tags."""
+        device_tag = Tag.objects.create(name="Device Tag", slug="device-tag")
+        vm_tag = Tag.objects.create(name="VM Tag", slug="vm-tag")
+        self.device1.tags.add(device_tag)
+        self.virtualmachine.tags.add(vm_tag)
+        device_context = ConfigContext.objects.create(name="device context", weight=100, data={"device": True})
+        device_context.tags.add(device_tag)
+        vm_context = ConfigContext.objects.create(name="vm context", weight=100, data={"vm": True})
+        vm_context.tags.add(vm_tag)
+
+        query = """
+        query {
+            devices (name: "Device 1") {
+                name
+                config_context
+            }
+            virtual_machines {
+                name
+                config_context
+            }
+        }
+        """
+        result = self.execute_query(query)
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data["devices"][0]["config_context"], {"a": 123, "b": 456, "c": 777, "device": True})
+        self.assertEqual(result.data["virtual_machines"][0]["config_context"], {"vm": True})
+
     @skip("Works in isolation, fails as part of the overall test suite due to issue #446")
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_relationship_associations(self):
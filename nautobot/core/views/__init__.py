@@ -2,7 +2,11 @@ import os
 import platform
 import sys
 
+import netaddr
+
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, OuterRef, Subquery
 from django.http import HttpResponseServerError, JsonResponse
 from django.shortcuts import render
 from django.template import loader, RequestContext, Template
@@ -17,9 +21,10 @@ from graphene_django.views import GraphQLView
 from nautobot.core.constants import SEARCH_MAX_RESULTS, SEARCH_TYPES
 from nautobot.core.forms import SearchForm
 from nautobot.core.releases import get_latest_release
-from nautobot.extras.models import GraphQLQuery
+from nautobot.extras.models import GraphQLQuery, SearchIndexEntry
 from nautobot.extras.registry import registry
 from nautobot.extras.forms import GraphQLQueryForm
+from nautobot.extras.search import filter_search_index, get_search_rank
 
 
 class HomeView(TemplateView):
@@ -116,15 +121,46 @@ class SearchView(View):
                 # Searching all object types
                 obj_types = SEARCH_TYPES.keys()
 
+            # Count the matching objects of each type by a single query of the search index
+            query = form.cleaned_data["q"]
+            models = [SEARCH_TYPES[obj_type]["queryset"].model for obj_type in obj_types]
+            entries = filter_search_index(query, request.user, models=models)
+            counts = dict(entries.order_by().values_list("content_type").annotate(count=Count("pk")))
+
+            # The index only matches text, so IP addresses and networks also match the prefixes, aggregates and IP
+            # addresses containing them (or contained by them) by way of their FilterSets
+            try:
+                netaddr.IPNetwork(query)
+                is_ip_query = True
+            except (netaddr.AddrFormatError, TypeError, ValueError):
+                is_ip_query = False
+
             for obj_type in obj_types:
 
                 queryset = SEARCH_TYPES[obj_type]["queryset"].restrict(request.user, "view")
-                filterset = SEARCH_TYPES[obj_type]["filterset"]
                 table = SEARCH_TYPES[obj_type]["table"]
                 url = SEARCH_TYPES[obj_type]["url"]
 
-                # Construct the results table for this object type
-                filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
+                content_type = ContentType.objects.get_for_model(queryset.model)
+                if is_ip_query and hasattr(queryset, "string_search"):
+                    filterset = SEARCH_TYPES[obj_type]["filterset"]
+                    filtered_queryset = filterset({"q": query}, queryset=queryset).qs
+
+                # Only construct results tables for object types with matching objects
+                elif not counts.get(content_type.pk):
+                    continue
+
+                else:
+                    # Order the matching objects by their rank, as per `search()`
+                    type_entries = SearchIndexEntry.objects.filter(
+                        content_type=content_type, text__contains=query.lower()
+                    )
+                    rank = type_entries.filter(object_id=OuterRef("pk")).annotate(rank=get_search_rank(query))
+                    filtered_queryset = (
+                        queryset.filter(pk__in=type_entries.values("object_id"))
+                        .annotate(search_rank=Subquery(rank.values("rank")[:1]))
+                        .order_by("-search_rank", *queryset.model._meta.ordering)
+                    )
                 table = table(filtered_queryset, orderable=False)
                 table.paginate(per_page=SEARCH_MAX_RESULTS)
 
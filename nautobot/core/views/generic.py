@@ -10,10 +10,11 @@ from django.core.exceptions import (
     ObjectDoesNotExist,
     ValidationError,
 )
+from django.core.files.base import ContentFile
 from django.db import transaction, IntegrityError
 from django.db.models import ManyToManyField, ProtectedError
 from django.forms import Form, ModelMultipleChoiceField, MultipleHiddenInput, Textarea
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import NoReverseMatch, reverse
 from django.utils.html import escape
@@ -22,7 +23,10 @@ from django.utils.safestring import mark_safe
 from django.views.generic import View
 from django_tables2 import RequestConfig
 
-from nautobot.extras.models import CustomField, ExportTemplate
+from nautobot.extras.custom_fields import get_custom_fields_for_model
+from nautobot.extras.models import ExportTemplate
+from nautobot.extras.tasks import enqueue_export_task, enqueue_import_task
+from nautobot.extras.utils import get_worker_count
 from nautobot.utilities.error_handlers import handle_protectederror
 from nautobot.utilities.exceptions import AbortTransaction
 from nautobot.utilities.forms import (
@@ -38,7 +42,9 @@ from nautobot.utilities.forms import (
 from nautobot.utilities.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.utilities.permissions import get_permission_for_model
 from nautobot.utilities.utils import (
+    buffer_chunks,
     csv_format,
+    iter_queryset,
     normalize_querydict,
     prepare_cloned_fields,
 )
@@ -148,19 +154,24 @@ class ObjectListView(ObjectPermissionRequiredMixin, View):
     def get_required_permission(self):
         return get_permission_for_model(self.queryset.model, "view")
 
+    def iter_queryset_yaml(self):
+        """
+        Export the queryset of objects as concatenated YAML documents, yielded one object at a time.
+        """
+        for i, obj in enumerate(iter_queryset(self.queryset)):
+            yield obj.to_yaml() if i == 0 else "---\n" + obj.to_yaml()
+
     def queryset_to_yaml(self):
         """
         Export the queryset of objects as concatenated YAML documents.
         """
-        yaml_data = [obj.to_yaml() for obj in self.queryset]
+        return "".join(self.iter_queryset_yaml())
 
-        return "---\n".join(yaml_data)
-
-    def queryset_to_csv(self):
+    def iter_queryset_csv(self):
         """
-        Export the queryset of objects as comma-separated value (CSV), using the model's to_csv() method.
+        Export the queryset of objects as comma-separated value (CSV), using the model's to_csv() method, yielded one
+        line at a time.
         """
-        csv_data = []
         custom_fields = []
 
         # Start with the column headers
@@ -168,22 +179,89 @@ class ObjectListView(ObjectPermissionRequiredMixin, View):
 
         # Add custom field headers, if any
         if hasattr(self.queryset.model, "_custom_field_data"):
-            for custom_field in CustomField.objects.get_for_model(self.queryset.model):
+            for custom_field in get_custom_fields_for_model(self.queryset.model):
                 headers.append(custom_field.name)
                 custom_fields.append(custom_field.name)
 
-        csv_data.append(",".join(headers))
+        yield ",".join(headers)
 
         # Iterate through the queryset appending each object
-        for obj in self.queryset:
+        for obj in iter_queryset(self.queryset):
             data = obj.to_csv()
 
             for custom_field in custom_fields:
                 data += (obj.cf.get(custom_field, ""),)
 
-            csv_data.append(csv_format(data))
+            yield "\n" + csv_format(data)
+
+    def queryset_to_csv(self):
+        """
+        Export the queryset of objects as comma-separated value (CSV), using the model's to_csv() method.
+        """
+        return "".join(self.iter_queryset_csv())
+
+    def has_streaming_export(self, export_format):
+        """
+        Return whether the queryset can be exported in the given format ("csv" or "yaml") incrementally, i.e. whether
+        this view doesn't override `queryset_to_csv()` or `queryset_to_yaml()` (rather than the corresponding
+        `iter_queryset_*()` method).
+        """
+        to_string = getattr(self, f"queryset_to_{export_format}")
+        return to_string.__func__ is getattr(ObjectListView, f"queryset_to_{export_format}")
 
-        return "\n".join(csv_data)
+    def iter_export(self, export_format):
+        """
+        Export the queryset of objects in the given format ("csv" or "yaml"), yielded in chunks.
+        """
+        if self.has_streaming_export(export_format):
+            yield from buffer_chunks(getattr(self, f"iter_queryset_{export_format}")())
+        else:
+            yield getattr(self, f"queryset_to_{export_format}")()
+
+    def get_export_response(self, export_format, content_type):
+        """
+        Return a response containing the queryset exported in the given format ("csv" or "yaml").
+
+        The export is streamed as it's generated, so that the size of the queryset isn't limited by the memory
+        available, unless the view overrides `queryset_to_csv()` or `queryset_to_yaml()`.
+        """
+        if self.has_streaming_export(export_format):
+            response = StreamingHttpResponse(self.iter_export(export_format), content_type=content_type)
+        else:
+            response = HttpResponse(getattr(self, f"queryset_to_{export_format}")(), content_type=content_type)
+
+        filename = "nautobot_{}.{}".format(self.queryset.model._meta.verbose_name_plural, export_format)
+        response["Content-Disposition"] = 'attachment; filename="{}"'.format(filename)
+        return response
+
+    def should_export_in_background(self, request):
+        """
+        Return whether the export of the queryset should be generated by a background job rather than within the
+        request, i.e. whether it contains more than EXPORT_JOB_THRESHOLD objects and a Celery worker is available.
+
+        Anonymous users (where permitted by EXEMPT_VIEW_PERMISSIONS) always export within the request, as the exported
+        file of a background job is only available to the user who requested it.
+        """
+        if not request.user.is_authenticated:
+            return False
+        if not settings.EXPORT_JOB_THRESHOLD or self.queryset.count() <= settings.EXPORT_JOB_THRESHOLD:
+            return False
+        return bool(get_worker_count(request))
+
+    def enqueue_export(self, request, export_template=None):
+        """
+        Enqueue a background job to export the queryset, and redirect to its JobResult, from which the exported file
+        can be downloaded once the job has completed.
+        """
+        job_result = enqueue_export_task(
+            self.queryset.model,
+            request.resolver_match.view_name,
+            request.GET.urlencode(),
+            request.user,
+            export_template=export_template,
+        )
+        messages.info(request, f"The export of {self.queryset.model._meta.verbose_name_plural} has been queued.")
+        return redirect(job_result.get_absolute_url())
 
     def get(self, request):
 
@@ -200,6 +278,8 @@ class ObjectListView(ObjectPermissionRequiredMixin, View):
                 content_type=content_type,
                 name=request.GET.get("export"),
             )
+            if self.should_export_in_background(request):
+                return self.enqueue_export(request, export_template=et)
             try:
                 return et.render_to_response(self.queryset)
             except Exception as e:
@@ -210,17 +290,15 @@ class ObjectListView(ObjectPermissionRequiredMixin, View):
 
         # Check for YAML export support
         elif "export" in request.GET and hasattr(model, "to_yaml"):
-            response = HttpResponse(self.queryset_to_yaml(), content_type="text/yaml")
-            filename = "nautobot_{}.yaml".format(self.queryset.model._meta.verbose_name_plural)
-            response["Content-Disposition"] = 'attachment; filename="{}"'.format(filename)
-            return response
+            if self.should_export_in_background(request):
+                return self.enqueue_export(request)
+            return self.get_export_response("yaml", "text/yaml")
 
         # Fall back to built-in CSV formatting if export requested but no template specified
         elif "export" in request.GET and hasattr(model, "to_csv"):
-            response = HttpResponse(self.queryset_to_csv(), content_type="text/csv")
-            filename = "nautobot_{}.csv".format(self.queryset.model._meta.verbose_name_plural)
-            response["Content-Disposition"] = 'attachment; filename="{}"'.format(filename)
-            return response
+            if self.should_export_in_background(request):
+                return self.enqueue_export(request)
+            return self.get_export_response("csv", "text/csv")
 
         # Provide a hook to tweak the queryset based on the request immediately prior to rendering the object list
         self.queryset = self.alter_queryset(request)
@@ -765,6 +843,38 @@ class BulkImportView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
     def get_required_permission(self):
         return get_permission_for_model(self.queryset.model, "add")
 
+    def should_import_in_background(self, request, records):
+        """
+        Return whether the given CSV records should be imported by a background job rather than within the request,
+        i.e. whether there are more than IMPORT_JOB_THRESHOLD of them and a Celery worker is available.
+        """
+        if not settings.IMPORT_JOB_THRESHOLD or len(records) <= settings.IMPORT_JOB_THRESHOLD:
+            return False
+        return bool(get_worker_count(request))
+
+    def enqueue_import(self, request, field_name):
+        """
+        Enqueue a background job to import the submitted CSV data, and redirect to its JobResult, to which the job
+        reports its progress and any rows which could not be imported.
+        """
+        verbose_name_plural = self.queryset.model._meta.verbose_name_plural
+        if field_name == "csv_file":
+            csv_file = request.FILES["csv_file"]
+            csv_file.seek(0)
+        else:
+            csv_file = ContentFile(
+                request.POST["csv_data"].strip().encode("utf-8"), name=f"nautobot_{verbose_name_plural}.csv"
+            )
+        job_result = enqueue_import_task(
+            self.queryset.model,
+            request.resolver_match.view_name,
+            csv_file,
+            request.user,
+            sniff_dialect=field_name == "csv_file",
+        )
+        messages.info(request, f"The import of {verbose_name_plural} has been queued.")
+        return redirect(job_result.get_absolute_url())
+
     def get(self, request):
 
         return render(
@@ -787,14 +897,17 @@ class BulkImportView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
         if form.is_valid():
             logger.debug("Form validation was successful")
 
+            if request.FILES:
+                field_name = "csv_file"
+            else:
+                field_name = "csv_data"
+            headers, records = form.cleaned_data[field_name]
+            if self.should_import_in_background(request, records):
+                return self.enqueue_import(request, field_name)
+
             try:
                 # Iterate through CSV data and bind each row to a new model form instance.
                 with transaction.atomic():
-                    if request.FILES:
-                        field_name = "csv_file"
-                    else:
-                        field_name = "csv_data"
-                    headers, records = form.cleaned_data[field_name]
                     for row, data in enumerate(records, start=1):
                         obj_form = self.model_form(data, headers=headers)
                         restrict_form_fields(obj_form, request.user)
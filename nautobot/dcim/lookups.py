@@ -1,10 +1,16 @@
-from django.db import NotSupportedError
 from django.db.models.lookups import Lookup
 
 from nautobot.dcim.utils import object_to_path_node
 
 
 class PathContains(Lookup):
+    """
+    Match CablePaths whose `path` traverses the given object.
+
+    Rather than searching the contents of every `path`, this looks the object up in the (indexed) CablePathNode table
+    which is maintained alongside each CablePath.
+    """
+
     lookup_name = "contains"
 
     def get_prep_lookup(self):
@@ -12,27 +18,20 @@ class PathContains(Lookup):
         self.rhs = object_to_path_node(self.rhs)
         return super().get_prep_lookup()
 
-    def process_rhs(self, compiler, connection):
-        rhs, rhs_params = super().process_rhs(compiler, connection)
-        rhs = "%s" % rhs_params[0]
-        return rhs, []
-
     def as_sql(self, compiler, connection):
-        lhs, lhs_params = self.process_lhs(compiler, connection)
-        rhs, rhs_params = self.process_rhs(compiler, connection)
-        params = lhs_params + rhs_params
-
-        vendor = connection.vendor
-        # Mapping of vendor => expr
-        sql_map = {
-            "postgresql": "%s::jsonb ? '%s'",
-            "mysql": "JSON_CONTAINS(%s, '\"%s\"','$')",
-        }
-
-        if vendor not in sql_map:
-            raise NotSupportedError(f"PathContains not supported by database {vendor}")
-
-        sql_expr = sql_map[vendor]
-        sql = sql_expr % (lhs, rhs)
-
-        return sql, params
+        # Import added here to avoid circular imports with CablePath.
+        from nautobot.dcim.models import CablePathNode
+
+        qn = compiler.quote_name_unless_alias
+        model = self.lhs.target.model
+        node_field = CablePathNode._meta.get_field("node")
+        cable_path_field = CablePathNode._meta.get_field("cable_path")
+
+        sql = "%s.%s IN (SELECT %s FROM %s WHERE %s = %%s)" % (
+            qn(self.lhs.alias),
+            qn(model._meta.pk.column),
+            qn(cable_path_field.column),
+            qn(CablePathNode._meta.db_table),
+            qn(node_field.column),
+        )
+        return sql, [self.rhs]
@@ -1,9 +1,13 @@
-from django.core.management.base import BaseCommand
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
 from django.core.management.color import no_style
 from django.db import connection
+from django.utils import timezone
 
 from nautobot.circuits.models import CircuitTermination
 from nautobot.dcim.models import (
+    Cable,
     CablePath,
     ConsolePort,
     ConsoleServerPort,
@@ -12,7 +16,10 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
+from nautobot.dcim.tracing import CableGraph, get_stale_path_origins, iter_traced_paths, save_traced_paths
+
+# Time at which paths were last traced, for use by --incremental
+LAST_RUN_CACHE_KEY = "nautobot.dcim.trace_paths.last_run"
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -41,6 +48,19 @@ class Command(BaseCommand):
             dest="no_input",
             help="Do not prompt user for any input/confirmation",
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            help="Only retrace paths affected by cables which have changed since the last run",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            dest="workers",
+            help="Number of worker processes to trace paths with (default: 1)",
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -50,6 +70,9 @@ class Command(BaseCommand):
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending="")
 
     def handle(self, *model_names, **options):
+        if options["force"] and options["incremental"]:
+            raise CommandError("--force and --incremental are mutually exclusive")
+        start_time = timezone.now()
 
         # If --force was passed, first delete all existing CablePaths
         if options["force"]:
@@ -79,22 +102,67 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
+        # Load the complete cable graph
+        self.stdout.write("Loading cables...")
+        graph = CableGraph.load()
+        self.stdout.write(f"  Loaded {len(graph.cable_statuses)} cables")
+
+        # Determine which existing paths may have been affected by changes to cables since the last run
+        stale_origins = None
+        if options["incremental"]:
+            last_run = cache.get(LAST_RUN_CACHE_KEY)
+            if last_run is None:
+                self.stdout.write("No previous run recorded; comparing all existing cable paths")
+            else:
+                changed_cable_ids = Cable.objects.filter(last_updated__gte=last_run).values_list("pk", flat=True)
+                stale_origins = get_stale_path_origins(graph, changed_cable_ids)
+                self.stdout.write(f"Found {len(stale_origins)} cable paths affected by changes since {last_run}")
+
         # Retrace paths
         for model in ENDPOINT_MODELS:
+            content_type = ContentType.objects.get_for_model(model)
             origins = model.objects.filter(cable__isnull=False)
-            if not options["force"]:
+            if stale_origins is not None:
+                stale_origin_ids = {
+                    origin_id for origin_type_id, origin_id in stale_origins if origin_type_id == content_type.pk
+                }
+                origins = origins.filter(_path__isnull=True) | origins.filter(pk__in=stale_origin_ids)
+            elif not options["force"] and not options["incremental"]:
                 origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
+            origin_path_ids = dict(origins.values_list("pk", "_path_id").iterator())
+
+            if stale_origins is not None:
+                # Paths from origins which are no longer cabled are obsolete
+                deleted_count, _ = CablePath.objects.filter(
+                    origin_type=content_type, origin_id__in=stale_origin_ids - origin_path_ids.keys()
+                ).delete()
+                if deleted_count:
+                    self.stdout.write(f"Deleted {deleted_count} obsolete {model._meta.verbose_name} paths")
+
+            origins_count = len(origin_path_ids)
             if not origins_count:
                 self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
                 continue
             self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
+            i = created_count = updated_count = 0
+            results = iter_traced_paths(
+                graph, [(content_type.pk, pk) for pk in origin_path_ids], workers=options["workers"]
+            )
+            for chunk in results:
+                for origin, _, error in chunk:
+                    if error is not None:
+                        self.stdout.write(self.style.ERROR(f"\n  Unable to trace path from {origin[1]}: {error}"))
+                created, updated, _ = save_traced_paths(content_type, chunk, origin_path_ids)
+                created_count += created
+                updated_count += updated
+                i += len(chunk)
+                self.draw_progress_bar(i * 100 / origins_count)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"\n  Retraced {i} {model._meta.verbose_name_plural} "
+                    f"({created_count} paths created, {updated_count} updated)"
+                )
+            )
 
+        cache.set(LAST_RUN_CACHE_KEY, start_time, timeout=None)
         self.stdout.write(self.style.SUCCESS("Finished."))
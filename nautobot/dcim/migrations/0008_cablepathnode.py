@@ -0,0 +1,52 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+def populate_cablepath_nodes(apps, schema_editor):
+    """Record the nodes of all existing CablePaths."""
+    CablePath = apps.get_model("dcim", "CablePath")
+    CablePathNode = apps.get_model("dcim", "CablePathNode")
+
+    nodes = []
+    for cable_path_id, path in CablePath.objects.values_list("pk", "path").iterator():
+        nodes.extend(CablePathNode(cable_path_id=cable_path_id, node=node) for node in path)
+        if len(nodes) >= 1000:
+            CablePathNode.objects.bulk_create(nodes)
+            nodes = []
+    CablePathNode.objects.bulk_create(nodes)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dcim", "0007_device_secrets_group"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CablePathNode",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("node", models.CharField(db_index=True, max_length=64)),
+                (
+                    "cable_path",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="nodes", to="dcim.cablepath"
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.RunPython(
+            code=populate_cablepath_nodes,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
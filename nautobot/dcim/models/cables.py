@@ -29,6 +29,7 @@ from .device_components import FrontPort, RearPort
 __all__ = (
     "Cable",
     "CablePath",
+    "CablePathNode",
 )
 
 
@@ -341,6 +342,8 @@ class CablePath(BaseModel):
         model = self.origin._meta.model
         model.objects.filter(pk=self.origin.pk).update(_path=self.pk)
 
+        CablePathNode.update_for_paths([self])
+
     @property
     def segment_count(self):
         total_length = 1 + len(self.path) + (1 if self.destination else 0)
@@ -476,3 +479,31 @@ class CablePath(BaseModel):
         """
         rearport = path_node_to_object(self.path[-1])
         return FrontPort.objects.filter(rear_port=rearport)
+
+
+class CablePathNode(BaseModel):
+    """
+    A node traversed by a CablePath, in the same representation as within its `path`.
+
+    CablePathNodes are maintained alongside the `path` of each CablePath, so that the CablePaths which traverse a given
+    object (`CablePath.objects.filter(path__contains=obj)`) can be found using an index rather than by searching every
+    path.
+    """
+
+    cable_path = models.ForeignKey(to="dcim.CablePath", on_delete=models.CASCADE, related_name="nodes")
+    # "<content type ID>:<UUID>", i.e. 37 characters plus the digits of the content type ID
+    node = models.CharField(max_length=64, db_index=True)
+
+    def __str__(self):
+        return self.node
+
+    @classmethod
+    def update_for_paths(cls, cablepaths, batch_size=1000):
+        """
+        Replace the CablePathNodes of each of the given CablePaths with those of its current `path`.
+        """
+        cls.objects.filter(cable_path__in=[cablepath.pk for cablepath in cablepaths]).delete()
+        cls.objects.bulk_create(
+            [cls(cable_path_id=cablepath.pk, node=node) for cablepath in cablepaths for node in cablepath.path],
+            batch_size=batch_size,
+        )
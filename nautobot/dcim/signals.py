@@ -1,7 +1,5 @@
 import logging
 
-from cacheops import invalidate_obj
-from django.contrib.contenttypes.models import ContentType
 from django.db.models.signals import post_save, post_delete, pre_delete
 from django.db import transaction
 from django.dispatch import receiver
@@ -16,6 +14,7 @@ from .models import (
     RackGroup,
     VirtualChassis,
 )
+from .tracing import retrace_cable_paths
 
 
 def create_cablepath(node, rebuild=True):
@@ -39,14 +38,11 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
+    cable_paths = list(CablePath.objects.filter(path__contains=obj))
 
-    with transaction.atomic():
-        for cp in cable_paths:
-            invalidate_obj(cp.origin)
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+    if cable_paths:
+        with transaction.atomic():
+            retrace_cable_paths(cable_paths)
 
 
 #
@@ -176,16 +172,5 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b._cable_peer = None
         instance.termination_b.save()
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    # Retrace (or delete) any dependent cable paths
+    rebuild_paths(instance)
@@ -1230,6 +1230,20 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
 
         self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
 
+    def test_unique_name_per_site_constraint_bulk_update(self):
+        """
+        Check that renaming two devices within a site to the same name in one bulk update fails.
+        """
+        devices = Device.objects.filter(site__slug="site-1", tenant__isnull=True)[:2]
+        data = [{"id": str(device.pk), "name": "Duplicate Device"} for device in devices]
+
+        self.add_permissions("dcim.change_device")
+        url = reverse("dcim-api:device-list")
+        response = self.client.patch(url, data, format="json", **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Device.objects.filter(name="Duplicate Device").exists())
+
     def test_local_context_schema_validation_pass(self):
         """
         Given a config context schema
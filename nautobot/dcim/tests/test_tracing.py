@@ -0,0 +1,176 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.models import (
+    Cable,
+    CablePath,
+    CablePathNode,
+    ConsolePort,
+    ConsoleServerPort,
+    Device,
+    DeviceRole,
+    DeviceType,
+    FrontPort,
+    Interface,
+    Manufacturer,
+    RearPort,
+    Site,
+)
+from nautobot.dcim.tracing import CableGraph, retrace_cable_paths
+from nautobot.extras.models import Status
+
+
+class CableGraphTestCase(TestCase):
+    """
+    Test bulk tracing of CablePaths with `nautobot.dcim.tracing`, and the `trace_paths` management command which uses
+    it, against paths traced individually by the signal handlers.
+
+        [IF1] --C1-- [FP1] [RP1] --C3-- [RP2] [FP3] --C4-- [IF3]
+        [IF2] --C2-- [FP2] [RP1] --C3-- [RP2] [FP4] --C5-- [IF4]
+        [IF5] --C6-- [CT1A] [CT1Z] --C7-- [IF6]
+        [IF7] --C8-- [RP3]
+        [CP1] --C9-- [CSP1]
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name="Site", slug="site")
+        manufacturer = Manufacturer.objects.create(name="Generic", slug="generic")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Test Device")
+        device_role = DeviceRole.objects.create(name="Device Role", slug="device-role")
+        device = Device.objects.create(
+            site=site,
+            device_type=device_type,
+            device_role=device_role,
+            name="Test Device",
+            status=Status.objects.get_for_model(Device).get(slug="active"),
+        )
+        provider = Provider.objects.create(name="Provider", slug="provider")
+        circuit_type = CircuitType.objects.create(name="Circuit Type", slug="circuit-type")
+        circuit = Circuit.objects.create(provider=provider, type=circuit_type, cid="Circuit 1")
+        cls.status = Status.objects.get_for_model(Cable).get(slug="connected")
+        cls.status_planned = Status.objects.get_for_model(Cable).get(slug="planned")
+
+        interfaces = [Interface.objects.create(device=device, name=f"Interface {i}") for i in range(1, 8)]
+        rearport1 = RearPort.objects.create(device=device, name="Rear Port 1", positions=2)
+        rearport2 = RearPort.objects.create(device=device, name="Rear Port 2", positions=2)
+        rearport3 = RearPort.objects.create(device=device, name="Rear Port 3", positions=1)
+        frontports = [
+            FrontPort.objects.create(
+                device=device, name=f"Front Port {i}", rear_port=rear_port, rear_port_position=position
+            )
+            for i, (rear_port, position) in enumerate(
+                [(rearport1, 1), (rearport1, 2), (rearport2, 1), (rearport2, 2)], start=1
+            )
+        ]
+        circuittermination1 = CircuitTermination.objects.create(circuit=circuit, site=site, term_side="A")
+        circuittermination2 = CircuitTermination.objects.create(circuit=circuit, site=site, term_side="Z")
+        consoleport = ConsolePort.objects.create(device=device, name="Console Port 1")
+        consoleserverport = ConsoleServerPort.objects.create(device=device, name="Console Server Port 1")
+
+        cls.cables = [
+            Cable.objects.create(termination_a=termination_a, termination_b=termination_b, status=cls.status)
+            for termination_a, termination_b in (
+                (interfaces[0], frontports[0]),
+                (interfaces[1], frontports[1]),
+                (rearport1, rearport2),
+                (frontports[2], interfaces[2]),
+                (frontports[3], interfaces[3]),
+                (interfaces[4], circuittermination1),
+                (circuittermination2, interfaces[5]),
+                (interfaces[6], rearport3),
+                (consoleport, consoleserverport),
+            )
+        ]
+        cls.origins = [*interfaces, circuittermination1, circuittermination2, consoleport, consoleserverport]
+
+    def get_paths(self):
+        return {
+            cablepath.origin_id: (cablepath.path, cablepath.destination_id, cablepath.is_active, cablepath.is_split)
+            for cablepath in CablePath.objects.all()
+        }
+
+    def test_trace(self):
+        graph = CableGraph.load()
+        for origin in self.origins:
+            origin.refresh_from_db()
+            expected = CablePath.from_origin(origin)
+            path, destination, is_active, is_split = graph.trace(
+                (ContentType.objects.get_for_model(origin).pk, origin.pk)
+            )
+            self.assertEqual(path, expected.path, msg=f"Path from {origin}")
+            self.assertEqual(destination[1] if destination else None, expected.destination_id)
+            self.assertEqual(is_active, expected.is_active)
+            self.assertEqual(is_split, expected.is_split)
+
+    def test_trace_lazy(self):
+        origins = [(ContentType.objects.get_for_model(origin).pk, origin.pk) for origin in self.origins]
+        self.assertEqual(CableGraph(lazy=True).trace_many(origins), CableGraph.load().trace_many(origins))
+
+    def test_path_nodes(self):
+        for cablepath in CablePath.objects.all():
+            self.assertEqual(sorted(cablepath.nodes.values_list("node", flat=True)), sorted(cablepath.path))
+        self.assertEqual(CablePath.objects.filter(path__contains=self.cables[2]).count(), 4)
+
+    def test_retrace_cable_paths(self):
+        expected_paths = self.get_paths()
+
+        # Change the status of cable 3 without triggering the signal handlers which would update its paths
+        Cable.objects.filter(pk=self.cables[2].pk).update(status=self.status_planned)
+        retrace_cable_paths(list(CablePath.objects.filter(path__contains=self.cables[2])))
+
+        paths = self.get_paths()
+        for origin_id, (path, destination_id, is_active, is_split) in expected_paths.items():
+            if origin_id in {interface.pk for interface in self.origins[:4]}:
+                self.assertEqual(paths[origin_id], (path, destination_id, False, is_split))
+            else:
+                self.assertEqual(paths[origin_id], expected_paths[origin_id])
+
+    @mock.patch("nautobot.dcim.tracing.invalidate_obj")
+    @mock.patch("nautobot.dcim.tracing.invalidate_model")
+    def test_retrace_cable_paths_invalidates_objects(self, mock_invalidate_model, mock_invalidate_obj):
+        cablepaths = list(CablePath.objects.filter(path__contains=self.cables[2]))
+        Cable.objects.filter(pk=self.cables[2].pk).update(status=self.status_planned)
+        retrace_cable_paths(cablepaths)
+
+        # Only the cached queries involving the updated CablePaths are invalidated, not those of whole models
+        mock_invalidate_model.assert_called_once_with(CablePathNode)
+        invalidated = [call.args[0] for call in mock_invalidate_obj.call_args_list]
+        self.assertEqual({cablepath.pk for cablepath in invalidated}, {cablepath.pk for cablepath in cablepaths})
+        self.assertTrue(all(isinstance(obj, CablePath) for obj in invalidated))
+
+    def test_trace_paths(self):
+        expected_paths = self.get_paths()
+        self.assertEqual(len(expected_paths), len(self.origins))
+
+        # Deleting all CablePaths also clears the origins' references to them
+        CablePath.objects.all().delete()
+        call_command("trace_paths", no_input=True, stdout=StringIO())
+
+        self.assertEqual(self.get_paths(), expected_paths)
+        for origin in self.origins:
+            origin.refresh_from_db()
+            self.assertEqual(origin._path.origin_id, origin.pk)
+
+    def test_trace_paths_incremental(self):
+        expected_paths = self.get_paths()
+        call_command("trace_paths", incremental=True, stdout=StringIO())
+        self.assertEqual(self.get_paths(), expected_paths)
+
+        # Change the status of cable 3 without triggering the signal handlers which would update its paths
+        Cable.objects.filter(pk=self.cables[2].pk).update(status=self.status_planned, last_updated=timezone.now())
+        call_command("trace_paths", incremental=True, stdout=StringIO())
+
+        paths = self.get_paths()
+        self.assertEqual(paths.keys(), expected_paths.keys())
+        for origin_id, (path, destination_id, is_active, is_split) in expected_paths.items():
+            if origin_id in {interface.pk for interface in self.origins[:4]}:
+                self.assertEqual(paths[origin_id], (path, destination_id, False, is_split))
+            else:
+                self.assertEqual(paths[origin_id], expected_paths[origin_id])
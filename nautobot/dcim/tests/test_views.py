@@ -772,7 +772,7 @@ device-bays:
 
         response = self.client.get("{}?export".format(url))
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(response.getvalue(), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 4)
         self.assertEqual(data[0]["manufacturer"], "Manufacturer 1")
         self.assertEqual(data[0]["model"], "Device Type 1")
@@ -0,0 +1,473 @@
+import copy
+from multiprocessing import Pool
+
+from cacheops import invalidate_model, invalidate_obj
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
+
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.models import (
+    Cable,
+    CablePath,
+    CablePathNode,
+    ConsolePort,
+    ConsoleServerPort,
+    FrontPort,
+    Interface,
+    PowerFeed,
+    PowerOutlet,
+    PowerPort,
+    RearPort,
+)
+from nautobot.dcim.utils import compile_path_node, decompile_path_node
+
+
+# All models which may be terminated by a Cable
+CABLE_TERMINATION_MODELS = (
+    CircuitTermination,
+    ConsolePort,
+    ConsoleServerPort,
+    FrontPort,
+    Interface,
+    PowerFeed,
+    PowerOutlet,
+    PowerPort,
+    RearPort,
+)
+
+
+class NotLoaded(Exception):
+    """
+    Raised when tracing a path requires data which a lazily-loaded CableGraph hasn't loaded yet.
+    """
+
+    def __init__(self, table, key):
+        super().__init__(table.name, key)
+        self.table = table
+        self.key = key
+
+
+class GraphTable(dict):
+    """
+    A mapping within a CableGraph.
+
+    Looking up a missing key returns None if the table is complete, or raises NotLoaded if the table is loaded lazily
+    (in which case keys known not to exist are stored with a value of None).
+    """
+
+    def __init__(self, name, lazy=False):
+        super().__init__()
+        self.name = name
+        self.lazy = lazy
+
+    def __missing__(self, key):
+        if self.lazy:
+            raise NotLoaded(self, key)
+        return None
+
+
+class CableGraph:
+    """
+    An in-memory copy of cables and the pass-through port and circuit mappings between them, from which CablePaths can
+    be traced without querying the database for each hop.
+
+    Nodes (cable terminations) are represented as (ContentType ID, object ID) tuples. Paths are traced exactly as by
+    `CablePath.from_origin()`, but return the path's attributes rather than a CablePath instance.
+
+    A complete graph (see `load()`) contains only plain data, so it can be passed to worker processes to trace paths in
+    parallel. A lazy graph instead starts out empty, and `trace_many()` loads whatever parts of the graph are needed to
+    trace the given paths, one hop at a time for all paths at once.
+    """
+
+    def __init__(self, lazy=False):
+        content_types = ContentType.objects.get_for_models(Cable, *CABLE_TERMINATION_MODELS)
+        self.content_types = {content_type.pk: model for model, content_type in content_types.items()}
+        self.cable_type_id = content_types[Cable].pk
+        self.front_port_type_id = content_types[FrontPort].pk
+        self.rear_port_type_id = content_types[RearPort].pk
+        self.circuit_termination_type_id = content_types[CircuitTermination].pk
+        self.connected_status_id = Cable.STATUS_CONNECTED.pk
+
+        # node -> (Cable ID, far-end node or None), or None if not connected to a Cable
+        self.terminations = GraphTable("terminations", lazy)
+        # Cable ID -> Status ID
+        self.cable_statuses = GraphTable("cable_statuses", lazy)
+        # FrontPort ID -> (RearPort ID, RearPort position)
+        self.front_ports = GraphTable("front_ports", lazy)
+        # (RearPort ID, position) -> FrontPort ID, or None
+        self.front_ports_by_position = GraphTable("front_ports_by_position", lazy)
+        # RearPort ID -> number of positions
+        self.rear_port_positions = GraphTable("rear_port_positions", lazy)
+        # CircuitTermination ID -> peer CircuitTermination ID, or None
+        self.circuit_terminations = GraphTable("circuit_terminations", lazy)
+
+    @classmethod
+    def load(cls):
+        """
+        Load the complete graph from the database, using a fixed number of queries.
+        """
+        graph = cls()
+        graph.cable_statuses.update(Cable.objects.values_list("pk", "status_id").iterator())
+        for content_type_id, model in graph.content_types.items():
+            if model is not Cable:
+                graph._load_terminations(content_type_id, model.objects.filter(cable__isnull=False))
+        graph._load_front_ports(FrontPort.objects.all())
+        graph.rear_port_positions.update(RearPort.objects.values_list("pk", "positions").iterator())
+        graph._load_circuit_terminations(CircuitTermination.objects.all())
+        return graph
+
+    def _load_terminations(self, content_type_id, queryset):
+        terminations = queryset.values_list("pk", "cable_id", "_cable_peer_type_id", "_cable_peer_id")
+        for pk, cable_id, peer_type_id, peer_id in terminations.iterator():
+            if cable_id is None:
+                self.terminations[(content_type_id, pk)] = None
+            else:
+                peer = (peer_type_id, peer_id) if peer_type_id is not None else None
+                self.terminations[(content_type_id, pk)] = (cable_id, peer)
+
+    def _load_front_ports(self, queryset):
+        front_ports = queryset.values_list("pk", "rear_port_id", "rear_port_position")
+        for pk, rear_port_id, rear_port_position in front_ports.iterator():
+            self.front_ports[pk] = (rear_port_id, rear_port_position)
+            self.front_ports_by_position[(rear_port_id, rear_port_position)] = pk
+
+    def _load_circuit_terminations(self, queryset):
+        circuit_terminations = {}
+        for pk, circuit_id, term_side in queryset.values_list("pk", "circuit_id", "term_side"):
+            circuit_terminations[(circuit_id, term_side)] = pk
+        for (circuit_id, term_side), pk in circuit_terminations.items():
+            self.circuit_terminations[pk] = circuit_terminations.get((circuit_id, "Z" if term_side == "A" else "A"))
+
+    def _load(self, table, keys):
+        """
+        Load the given keys of a lazy graph's table (and any other data retrieved along with them).
+        """
+        if table is self.terminations:
+            keys_by_type = {}
+            for content_type_id, pk in keys:
+                keys_by_type.setdefault(content_type_id, []).append(pk)
+            for content_type_id, pks in keys_by_type.items():
+                self._load_terminations(content_type_id, self.content_types[content_type_id].objects.filter(pk__in=pks))
+        elif table is self.cable_statuses:
+            table.update(Cable.objects.filter(pk__in=keys).values_list("pk", "status_id"))
+        elif table is self.front_ports:
+            self._load_front_ports(FrontPort.objects.filter(pk__in=keys))
+        elif table is self.front_ports_by_position:
+            self._load_front_ports(FrontPort.objects.filter(rear_port__in={rear_port_id for rear_port_id, _ in keys}))
+        elif table is self.rear_port_positions:
+            table.update(RearPort.objects.filter(pk__in=keys).values_list("pk", "positions"))
+        elif table is self.circuit_terminations:
+            circuit_ids = CircuitTermination.objects.filter(pk__in=keys).values("circuit_id")
+            self._load_circuit_terminations(CircuitTermination.objects.filter(circuit__in=circuit_ids))
+
+        # Record any keys which don't exist, so that they aren't looked for again
+        for key in keys:
+            table.setdefault(key, None)
+
+    def trace(self, origin):
+        """
+        Trace the path originating from the given node.
+
+        Returns:
+            (list, tuple, bool, bool): The path, destination node (or None), is_active, and is_split; or None if the
+                origin isn't connected to a Cable
+        """
+        if self.terminations[origin] is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node = origin
+        visited_nodes = set()
+        while self.terminations[node] is not None:
+            if node in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node)
+            cable_id, peer_termination = self.terminations[node]
+            if self.cable_statuses[cable_id] != self.connected_status_id:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_type_id, cable_id))
+            if peer_termination is None:
+                break
+            peer_type_id, peer_id = peer_termination
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_type_id == self.front_port_type_id:
+                path.append(compile_path_node(*peer_termination))
+                rear_port_id, rear_port_position = self.front_ports[peer_id]
+                node = (self.rear_port_type_id, rear_port_id)
+                if self.rear_port_positions[rear_port_id] > 1:
+                    position_stack.append(rear_port_position)
+                path.append(compile_path_node(*node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_type_id == self.rear_port_type_id:
+                path.append(compile_path_node(*peer_termination))
+
+                # Determine the peer FrontPort's position
+                if self.rear_port_positions[peer_id] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                front_port_id = self.front_ports_by_position[(peer_id, position)]
+                if front_port_id is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = (self.front_port_type_id, front_port_id)
+                path.append(compile_path_node(*node))
+
+            # Follow a Circuit Termination if there is a corresponding Circuit Termination
+            elif peer_type_id == self.circuit_termination_type_id:
+                peer_circuit_termination_id = self.circuit_terminations[peer_id]
+                # A Circuit Termination does not require a peer.
+                if peer_circuit_termination_id is None:
+                    destination = peer_termination
+                    break
+                node = (self.circuit_termination_type_id, peer_circuit_termination_id)
+                path.append(compile_path_node(*peer_termination))
+                path.append(compile_path_node(*node))
+
+            # Anything else marks the end of the path
+            else:
+                destination = peer_termination
+                break
+
+        if destination is None:
+            is_active = False
+
+        return path, destination, is_active, is_split
+
+    def trace_many(self, origins):
+        """
+        Trace the paths originating from each of the given nodes.
+
+        For a lazy graph, all of the paths are traced as far as the data loaded so far allows, then the missing data
+        needed by all of them is loaded in bulk, and so on until every path is complete.
+
+        Returns:
+            list: An (origin, result, error) tuple for each origin, where `result` is as returned by `trace()`, and
+                `error` is the message of the ValidationError raised while tracing it (if any)
+        """
+        results = {}
+        pending = list(origins)
+        while pending:
+            missing = {}
+            incomplete = []
+            for origin in pending:
+                try:
+                    results[origin] = (self.trace(origin), None)
+                except ValidationError as e:
+                    results[origin] = (None, "; ".join(e.messages))
+                except NotLoaded as e:
+                    missing.setdefault(e.table.name, (e.table, set()))[1].add(e.key)
+                    incomplete.append(origin)
+            for table, keys in missing.values():
+                self._load(table, keys)
+            pending = incomplete
+
+        return [(origin, *results[origin]) for origin in origins]
+
+    def get_cable_terminations(self, cable_ids):
+        """
+        Return the set of nodes terminating any of the given Cables.
+        """
+        cable_ids = set(cable_ids)
+        return {node for node, termination in self.terminations.items() if termination and termination[0] in cable_ids}
+
+
+# The CableGraph used by each worker process
+_worker_graph = None
+
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _trace_chunk(origins):
+    return _worker_graph.trace_many(origins)
+
+
+def iter_traced_paths(graph, origins, workers=1, chunk_size=1000):
+    """
+    Trace the paths originating from the given nodes, optionally using a pool of worker processes.
+
+    Yields:
+        list: The results of `CableGraph.trace_many()` for each chunk of (up to `chunk_size`) origins, in order
+    """
+    chunks = [origins[i : i + chunk_size] for i in range(0, len(origins), chunk_size)]
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield graph.trace_many(chunk)
+        return
+
+    # Worker processes mustn't share the parent's database connections
+    connections.close_all()
+    with Pool(workers, initializer=_init_worker, initargs=(graph,)) as pool:
+        yield from pool.imap(_trace_chunk, chunks)
+
+
+def save_traced_paths(origin_type, results, origin_path_ids, batch_size=1000, invalidate_models=True):
+    """
+    Write traced paths to the database, creating, updating or deleting CablePaths as needed.
+
+    Only CablePaths which have actually changed are written, and each kind of write is performed in bulk.
+
+    Args:
+        origin_type (ContentType): The ContentType of all of the origins
+        results (list): Results of `CableGraph.trace_many()`; loop errors are ignored
+        origin_path_ids (dict): The current `_path_id` of each origin, keyed by origin ID
+        batch_size (int): Maximum number of objects written per query
+        invalidate_models (bool): Invalidate all cached queries of CablePaths and of the origins' model (as suits a
+            rebuild of many paths), rather than only those involving the CablePaths and origins which were written
+
+    Returns:
+        (int, int, int): The number of CablePaths created, updated and deleted
+    """
+    model = origin_type.model_class()
+    existing_paths = {
+        cablepath.origin_id: cablepath
+        for cablepath in CablePath.objects.filter(
+            origin_type=origin_type, origin_id__in=[origin_id for (_, origin_id), _, _ in results]
+        )
+    }
+
+    created_paths = []
+    updated_paths = []
+    # Copies of the updated CablePaths as they were before being updated
+    prior_paths = []
+    deleted_path_ids = []
+    updated_origins = []
+    for (_, origin_id), result, error in results:
+        if error is not None:
+            continue
+        cablepath = existing_paths.get(origin_id)
+        if result is None:
+            if cablepath is not None:
+                deleted_path_ids.append(cablepath.pk)
+            continue
+
+        path, destination, is_active, is_split = result
+        destination_type_id, destination_id = destination or (None, None)
+        if cablepath is None:
+            cablepath = CablePath(origin_type=origin_type, origin_id=origin_id)
+            created_paths.append(cablepath)
+        elif (
+            cablepath.path != path
+            or cablepath.destination_type_id != destination_type_id
+            or cablepath.destination_id != destination_id
+            or cablepath.is_active != is_active
+            or cablepath.is_split != is_split
+        ):
+            prior_paths.append(copy.copy(cablepath))
+            updated_paths.append(cablepath)
+        cablepath.path = path
+        cablepath.destination_type_id = destination_type_id
+        cablepath.destination_id = destination_id
+        cablepath.is_active = is_active
+        cablepath.is_split = is_split
+
+        # Record a direct reference to the CablePath on its originating object
+        if origin_path_ids.get(origin_id) != cablepath.pk:
+            updated_origins.append(model(pk=origin_id, _path_id=cablepath.pk))
+
+    with transaction.atomic():
+        if deleted_path_ids:
+            CablePath.objects.filter(pk__in=deleted_path_ids).delete()
+        CablePath.objects.bulk_create(created_paths, batch_size=batch_size)
+        CablePath.objects.bulk_update(
+            updated_paths,
+            ["path", "destination_type", "destination_id", "is_active", "is_split"],
+            batch_size=batch_size,
+        )
+        CablePathNode.update_for_paths(created_paths + updated_paths, batch_size=batch_size)
+        model.objects.bulk_update(updated_origins, ["_path"], batch_size=batch_size)
+
+    # Bulk operations bypass cacheops' automatic invalidation (deleted CablePaths are invalidated by their post_delete
+    # signals). CablePathNodes are only queried to find the paths affected by changes, so are invalidated as a whole.
+    invalidate_model(CablePathNode)
+    if invalidate_models:
+        invalidate_model(CablePath)
+        if updated_origins:
+            invalidate_model(model)
+    else:
+        # Invalidate queries matching either the prior or the current state of each object
+        for cablepath in prior_paths + updated_paths + created_paths:
+            invalidate_obj(cablepath)
+        if updated_origins:
+            for origin in model.objects.filter(pk__in=[origin.pk for origin in updated_origins]).nocache():
+                invalidate_obj(origin)
+                origin._path_id = origin_path_ids.get(origin.pk)
+                invalidate_obj(origin)
+
+    return len(created_paths), len(updated_paths), len(deleted_path_ids)
+
+
+def retrace_cable_paths(cablepaths):
+    """
+    Retrace the given existing CablePaths, as a single batch.
+
+    The parts of the cable graph needed to trace all of the paths are loaded in bulk, and only paths which have changed
+    are updated (or deleted, if their origin is no longer connected to a Cable).
+
+    Raises:
+        ValidationError: If any of the paths contains a loop
+    """
+    if not cablepaths:
+        return
+
+    origin_path_ids = {(cablepath.origin_type_id, cablepath.origin_id): cablepath.pk for cablepath in cablepaths}
+    results = CableGraph(lazy=True).trace_many(list(origin_path_ids))
+
+    results_by_type = {}
+    for origin, result, error in results:
+        if error is not None:
+            raise ValidationError(error)
+        results_by_type.setdefault(origin[0], []).append((origin, result, error))
+    for origin_type_id, origin_results in results_by_type.items():
+        save_traced_paths(
+            ContentType.objects.get_for_id(origin_type_id),
+            origin_results,
+            {origin_id: origin_path_ids[(origin_type_id, origin_id)] for (_, origin_id), _, _ in origin_results},
+            invalidate_models=False,
+        )
+
+
+def get_stale_path_origins(graph, cable_ids):
+    """
+    Return the origins of all existing CablePaths which may be affected by changes to the given Cables.
+
+    This includes any path which traverses or ends at one of the Cables' terminations, or which traverses a Cable that
+    no longer exists.
+
+    Returns:
+        set: Origin nodes, as (ContentType ID, object ID) tuples
+    """
+    cable_ids = set(cable_ids)
+    affected_nodes = {compile_path_node(graph.cable_type_id, cable_id) for cable_id in cable_ids}
+    affected_nodes.update(compile_path_node(*node) for node in graph.get_cable_terminations(cable_ids))
+
+    # Find any Cables which have since been deleted
+    cable_nodes = CablePathNode.objects.filter(node__startswith=compile_path_node(graph.cable_type_id, ""))
+    for node in cable_nodes.values_list("node", flat=True).distinct().iterator():
+        if decompile_path_node(node)[1] not in graph.cable_statuses:
+            affected_nodes.add(node)
+
+    origins = set()
+    affected_nodes = list(affected_nodes)
+    for i in range(0, len(affected_nodes), 1000):
+        cablepaths = CablePath.objects.filter(nodes__node__in=affected_nodes[i : i + 1000])
+        origins.update(cablepaths.values_list("origin_type_id", "origin_id"))
+    return origins
@@ -1,9 +1,9 @@
-from django.contrib.contenttypes.models import ContentType
 from rest_framework.serializers import SerializerMethodField
 from rest_framework.fields import CreateOnlyDefault, Field
 
 from nautobot.core.api import ValidatedModelSerializer
-from nautobot.extras.models import CustomField
+from nautobot.extras.computed_fields import render_computed_fields
+from nautobot.extras.custom_fields import get_custom_fields_for_model
 
 
 #
@@ -22,8 +22,7 @@ class CustomFieldDefaultValues:
         self.model = serializer_field.parent.Meta.model
 
         # Retrieve the CustomFields for the parent model
-        content_type = ContentType.objects.get_for_model(self.model)
-        fields = CustomField.objects.filter(content_types=content_type)
+        fields = get_custom_fields_for_model(self.model)
 
         # Populate the default value for each CustomField
         value = {}
@@ -42,8 +41,7 @@ class CustomFieldsDataField(Field):
         Cache CustomFields assigned to this model to avoid redundant database queries
         """
         if not hasattr(self, "_custom_fields"):
-            content_type = ContentType.objects.get_for_model(self.parent.Meta.model)
-            self._custom_fields = CustomField.objects.filter(content_types=content_type)
+            self._custom_fields = get_custom_fields_for_model(self.parent.Meta.model)
         return self._custom_fields
 
     def to_representation(self, obj):
@@ -71,11 +69,13 @@ class CustomFieldModelSerializer(ValidatedModelSerializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        # Rendered computed fields, by object PK, when serializing a list of objects
+        self._computed_fields = {}
+
         if self.instance is not None:
 
             # Retrieve the set of CustomFields which apply to this type of object
-            content_type = ContentType.objects.get_for_model(self.Meta.model)
-            fields = CustomField.objects.filter(content_types=content_type)
+            fields = get_custom_fields_for_model(self.Meta.model)
 
             # Populate CustomFieldValues for each instance from database
             if type(self.instance) in (list, tuple):
@@ -90,4 +90,10 @@ class CustomFieldModelSerializer(ValidatedModelSerializer):
             instance.custom_fields[field.name] = instance.cf.get(field.name)
 
     def get_computed_fields(self, obj):
-        return obj.get_computed_fields()
+        if obj.pk not in self._computed_fields:
+            # When serializing a list of objects, render the computed fields of all of them in one pass
+            objects = self.instance if type(self.instance) in (list, tuple) else [obj]
+            if obj not in objects:
+                objects = [obj]
+            self._computed_fields.update(zip([o.pk for o in objects], render_computed_fields(objects)))
+        return self._computed_fields.pop(obj.pk)
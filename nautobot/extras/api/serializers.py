@@ -950,4 +950,5 @@ class WebhookSerializer(ValidatedModelSerializer):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_payload",
         ]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from django.contrib.contenttypes.models import ContentType
 from django.forms import ValidationError as FormsValidationError
-from django.http import Http404
+from django.http import FileResponse, Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_yasg import openapi
@@ -21,6 +21,7 @@ from nautobot.core.api.views import ModelViewSet, ReadOnlyModelViewSet
 from nautobot.core.graphql import execute_saved_query
 from nautobot.extras import filters
 from nautobot.extras.choices import JobExecutionType, JobResultStatusChoices
+from nautobot.extras.custom_fields import get_custom_fields_for_model
 from nautobot.extras.datasources import enqueue_pull_git_repository_and_refresh_data
 from nautobot.extras.models import (
     ComputedField,
@@ -28,6 +29,7 @@ from nautobot.extras.models import (
     ConfigContextSchema,
     CustomLink,
     ExportTemplate,
+    FileProxy,
     GitRepository,
     GraphQLQuery,
     ImageAttachment,
@@ -47,7 +49,7 @@ from nautobot.extras.models import (
 )
 from nautobot.extras.models import CustomField, CustomFieldChoice
 from nautobot.extras.jobs import get_job, get_jobs, run_job
-from nautobot.extras.utils import get_worker_count
+from nautobot.extras.utils import can_download_job_result_files, get_worker_count
 from nautobot.utilities.exceptions import CeleryWorkerNotRunningException
 from nautobot.utilities.utils import copy_safe_request, count_related
 from . import nested_serializers, serializers
@@ -171,8 +173,7 @@ class CustomFieldModelViewSet(ModelViewSet):
     def get_serializer_context(self):
 
         # Gather all custom fields for the model
-        content_type = ContentType.objects.get_for_model(self.queryset.model)
-        custom_fields = content_type.custom_fields.all()
+        custom_fields = get_custom_fields_for_model(self.queryset.model)
 
         context = super().get_serializer_context()
         context.update(
@@ -457,6 +458,20 @@ class JobResultViewSet(ModelViewSet):
         serializer = nested_serializers.NestedJobLogEntrySerializer(logs, context={"request": request}, many=True)
         return Response(serializer.data)
 
+    @action(detail=True)
+    def download(self, request, pk=None):
+        """
+        Download the file most recently produced by this job result, such as an export.
+        """
+        job_result = self.get_object()
+        if not can_download_job_result_files(request.user, job_result):
+            raise PermissionDenied("Only the user who ran this job may download its files.")
+        try:
+            file_proxy = job_result.files.latest()
+        except FileProxy.DoesNotExist:
+            raise Http404("This job result has no files.")
+        return FileResponse(file_proxy.file.open("rb"), as_attachment=True, filename=file_proxy.name)
+
 
 #
 # Scheduled Jobs
@@ -0,0 +1,170 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from nautobot.extras.models import ObjectChange
+
+
+class _PendingObjectChanges:
+    """
+    ObjectChange records created within a single transaction or savepoint.
+
+    Instances are registered as `transaction.on_commit()` callbacks; Django discards the callback if the transaction or
+    savepoint that registered it is rolled back, which is how the owning `ObjectChangeBuffer` tells which records
+    describe changes that actually persisted.
+    """
+
+    def __init__(self, buffer, savepoint_ids, run_on_commit):
+        self.buffer = buffer
+        # The key of this instance in the buffer's pending records
+        self.savepoint_ids = savepoint_ids
+        # The connection's list of on-commit callbacks in which this instance was last known to be registered
+        self.run_on_commit = run_on_commit
+        self.objectchanges = []
+
+    def __call__(self):
+        self.buffer._commit(self)
+
+
+class ObjectChangeBuffer:
+    """
+    Collect the ObjectChange records generated while change logging is enabled and write them with `bulk_create()`,
+    rather than issuing one INSERT per changed object.
+
+    Records created outside of any transaction are written when `flush()` is called (typically on exit from the
+    `change_logging()` context manager) or once `batch_size` of them have accumulated. Records created inside of a
+    transaction are held until that transaction commits and are discarded if it is rolled back, just as they would
+    have been had they been saved directly.
+
+    Many-to-many changes (e.g. tags being assigned after an object is created) are merged into the buffered records
+    in memory instead of re-querying the ObjectChange table.
+    """
+
+    batch_size = 1000
+
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.using = using
+        # ObjectChanges whose underlying changes have been committed (or were made in autocommit mode)
+        self._committed = []
+        # Savepoint IDs -> _PendingObjectChanges for records created inside of a transaction
+        self._pending = {}
+        # (content type ID, object ID) -> unwritten ObjectChanges for that object
+        self._by_object = {}
+        # (content type ID, object ID) -> request ID, for objects with ObjectChanges already written
+        self._written = {}
+        # The connection's list of on-commit callbacks, and the _PendingObjectChanges registered in it, as of the last
+        # time that list had to be searched
+        self._registered_in = None
+        self._registered = set()
+
+    def __len__(self):
+        return len(self._committed) + sum(len(pending.objectchanges) for pending in self._pending.values())
+
+    @property
+    def connection(self):
+        return transaction.get_connection(self.using)
+
+    def _is_registered(self, pending):
+        """Return True if the on_commit callback for `pending` has not been discarded by a rollback."""
+        run_on_commit = self.connection.run_on_commit
+        if pending.run_on_commit is run_on_commit:
+            # Django replaces the list whenever a transaction ends or a savepoint is rolled back, so no callbacks have
+            # been discarded from it since `pending` was registered
+            return True
+        if self._registered_in is not run_on_commit:
+            self._registered_in = run_on_commit
+            self._registered = {func for _, func in run_on_commit if isinstance(func, _PendingObjectChanges)}
+        if pending in self._registered:
+            pending.run_on_commit = run_on_commit
+            return True
+        return False
+
+    def add(self, objectchange):
+        """
+        Buffer the given (unsaved) ObjectChange for writing.
+        """
+        objectchange.populate_static_fields()
+        key = (objectchange.changed_object_type_id, objectchange.changed_object_id)
+        self._by_object.setdefault(key, []).append(objectchange)
+
+        if not self.connection.in_atomic_block:
+            self._committed.append(objectchange)
+            if len(self._committed) >= self.batch_size:
+                self.flush()
+            return
+
+        savepoint_ids = tuple(self.connection.savepoint_ids)
+        pending = self._pending.get(savepoint_ids)
+        if pending is not None and not self._is_registered(pending):
+            # The transaction which created these records was rolled back; drop them.
+            del self._pending[savepoint_ids]
+            pending = None
+        if pending is None:
+            pending = _PendingObjectChanges(self, savepoint_ids, self.connection.run_on_commit)
+            self._pending[savepoint_ids] = pending
+            transaction.on_commit(pending, using=self.using)
+        pending.objectchanges.append(objectchange)
+
+    def update_object_data(self, instance, object_data):
+        """
+        Update the `object_data` of all ObjectChanges recorded so far for the given instance.
+
+        This is used to reflect many-to-many changes, which are only signaled after the instance itself was saved.
+        """
+        key = (ContentType.objects.get_for_model(instance).pk, instance.pk)
+        for objectchange in self._by_object.get(key, []):
+            objectchange.object_data = object_data
+
+        if key in self._written:
+            ObjectChange.objects.using(self.using).filter(
+                changed_object_type_id=key[0],
+                changed_object_id=key[1],
+                request_id=self._written[key],
+            ).update(object_data=object_data)
+
+    def _commit(self, pending):
+        """
+        Callback for when the transaction owning `pending` commits.
+        """
+        if self._pending.get(pending.savepoint_ids) is not pending:
+            # Already handled by close()
+            return
+        del self._pending[pending.savepoint_ids]
+
+        self._committed.extend(pending.objectchanges)
+        pending.objectchanges = []
+        self.flush()
+
+    def flush(self):
+        """
+        Write all committed ObjectChanges to the database.
+        """
+        if not self._committed:
+            return
+
+        objectchanges, self._committed = self._committed, []
+        ObjectChange.objects.using(self.using).bulk_create(objectchanges, batch_size=self.batch_size)
+
+        for objectchange in objectchanges:
+            key = (objectchange.changed_object_type_id, objectchange.changed_object_id)
+            self._by_object.pop(key, None)
+            self._written[key] = objectchange.request_id
+
+    def close(self):
+        """
+        Write out any remaining ObjectChanges and discard those belonging to rolled-back transactions.
+
+        If we're still inside of a transaction (for example when change logging is enabled within a caller-managed
+        atomic block), records from its live savepoints are written as part of that transaction, so that they are
+        committed or rolled back along with the changes they describe.
+        """
+        in_atomic_block = self.connection.in_atomic_block
+        for pending in self._pending.values():
+            if in_atomic_block and self._is_registered(pending):
+                self._committed.extend(pending.objectchanges)
+            pending.objectchanges = []
+        self._pending = {}
+        self._registered_in = None
+        self._registered = set()
+
+        self.flush()
+        self._by_object = {}
@@ -0,0 +1,53 @@
+from django.contrib.contenttypes.models import ContentType
+
+from nautobot.utilities.caching import VersionedCache
+
+
+def _load_computed_fields(content_type_id):
+    """
+    Load the ComputedFields for the given content type ID.
+    """
+    # Import added here to avoid circular imports with CustomFieldModel.
+    from nautobot.extras.models import ComputedField
+
+    return list(ComputedField.objects.filter(content_type_id=content_type_id))
+
+
+# ComputedFields keyed by content type ID; invalidated by signal handlers when ComputedFields change
+computed_field_cache = VersionedCache("extras.computed_field", _load_computed_fields)
+
+
+def get_computed_fields_for_model(model, version=None):
+    """
+    Return the list of ComputedFields assigned to the given model (or instance thereof), in order of weight.
+    """
+    content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+    return computed_field_cache.get(content_type.pk, version=version)
+
+
+def render_computed_fields(objects, label_as_key=False):
+    """
+    Render the values of all ComputedFields of the given objects, which must all be of the same model.
+
+    The ComputedFields are looked up once for all of the objects, and each template is only compiled once (see
+    `render_jinja2()`).
+
+    Args:
+        objects (list): Objects whose computed fields are to be rendered
+        label_as_key (bool): Use the `label` of each ComputedField as its key, rather than its `slug`
+
+    Returns:
+        list: A dictionary of rendered values for each object, in the same order as `objects`
+    """
+    objects = list(objects)
+    if not objects:
+        return []
+
+    computed_fields = get_computed_fields_for_model(objects[0])
+    return [
+        {
+            computed_field.label if label_as_key else computed_field.slug: computed_field.render(context={"obj": obj})
+            for computed_field in computed_fields
+        }
+        for obj in objects
+    ]
@@ -0,0 +1,193 @@
+import copy
+from collections import OrderedDict
+
+from nautobot.utilities.caching import VersionedCache
+from nautobot.utilities.utils import deepmerge
+
+
+# The ConfigContext fields by which a ConfigContext may be scoped to particular devices and virtual machines
+SCOPE_FIELDS = (
+    "regions",
+    "sites",
+    "roles",
+    "device_types",
+    "platforms",
+    "cluster_groups",
+    "clusters",
+    "tenant_groups",
+    "tenants",
+    "tags",
+)
+
+
+class ConfigContextIndex:
+    """
+    An in-memory index of all active ConfigContexts, by which the ConfigContexts applicable to a Device or
+    VirtualMachine can be found without querying the database.
+
+    Each active ConfigContext is assigned a bit, in order of weight and name. For each scope (regions, sites, etc.),
+    the index maps each related object to the bitset of ConfigContexts assigned to it; ConfigContexts which aren't
+    scoped by a given field apply regardless of its value. The ConfigContexts applicable to an object are therefore
+    those whose bits are set in every scope after combining the bitsets of the object's region(s), site, and so on.
+
+    The merged data of each distinct combination of ConfigContexts is computed once and retained by the index. As the
+    combination is determined from the object's current attributes each time, changes to an object never leave it
+    with stale data; the index itself is rebuilt whenever ConfigContexts, their scopes, or the hierarchy of regions,
+    sites, clusters and tenants change.
+    """
+
+    def __init__(self):
+        self.context_ids = []
+        self.context_data = []
+        self.scopes = {}  # field name -> (bitset of ConfigContexts not scoped by it, {object ID: bitset})
+        self.region_parents = {}  # Region ID -> parent Region ID
+        self.site_regions = {}  # Site ID -> Region ID
+        self.cluster_groups = {}  # Cluster ID -> ClusterGroup ID
+        self.cluster_sites = {}  # Cluster ID -> Site ID
+        self.tenant_groups = {}  # Tenant ID -> TenantGroup ID
+        self._merged_data = {}  # bitset -> merged data
+
+    @classmethod
+    def load(cls):
+        """
+        Load the index from the database, using a fixed number of queries.
+        """
+        # Import added here to avoid circular imports with ConfigContextQuerySet.
+        from nautobot.extras.models import ConfigContext
+
+        index = cls()
+        contexts = ConfigContext.objects.filter(is_active=True).order_by("weight", "name").values_list("pk", "data")
+        bits = {}
+        for i, (pk, data) in enumerate(contexts):
+            index.context_ids.append(pk)
+            index.context_data.append(data)
+            bits[pk] = 1 << i
+        all_contexts = (1 << len(bits)) - 1
+
+        for field_name in SCOPE_FIELDS:
+            field = ConfigContext._meta.get_field(field_name)
+            through = field.remote_field.through
+            assignments = through.objects.values_list(
+                through._meta.get_field(field.m2m_field_name()).attname,
+                through._meta.get_field(field.m2m_reverse_field_name()).attname,
+            )
+            scoped = 0
+            by_object = {}
+            for context_id, object_id in assignments:
+                if context_id in bits:
+                    scoped |= bits[context_id]
+                    by_object[object_id] = by_object.get(object_id, 0) | bits[context_id]
+            index.scopes[field_name] = (all_contexts & ~scoped, by_object)
+
+        def get_model(field_name):
+            return ConfigContext._meta.get_field(field_name).related_model
+
+        index.region_parents = dict(get_model("regions").objects.values_list("pk", "parent_id"))
+        index.site_regions = dict(get_model("sites").objects.values_list("pk", "region_id"))
+        for pk, group_id, site_id in get_model("clusters").objects.values_list("pk", "group_id", "site_id"):
+            index.cluster_groups[pk] = group_id
+            index.cluster_sites[pk] = site_id
+        index.tenant_groups = dict(get_model("tenants").objects.values_list("pk", "group_id"))
+
+        return index
+
+    def get_scope(self, obj, tag_ids=None):
+        """
+        Return the IDs of the objects by which ConfigContexts may be scoped to the given Device or VirtualMachine.
+
+        Args:
+            obj: A Device or VirtualMachine
+            tag_ids (list): IDs of the object's Tags, if already known
+
+        Returns:
+            dict: A list of object IDs, keyed by scope field name
+        """
+        cluster_id = obj.cluster_id
+        # `site` for Device; the Cluster's site for VirtualMachine
+        site_id = getattr(obj, "site_id", None) or self.cluster_sites.get(cluster_id)
+
+        # Match against the site's region as well as any parent regions.
+        regions = []
+        region_id = self.site_regions.get(site_id)
+        while region_id is not None:
+            regions.append(region_id)
+            region_id = self.region_parents.get(region_id)
+
+        if tag_ids is None:
+            tag_ids = [tag.pk for tag in obj.tags.all()]
+
+        return {
+            "regions": regions,
+            "sites": [site_id],
+            # `device_role` for Device; `role` for VirtualMachine
+            "roles": [getattr(obj, "device_role_id", None) or obj.role_id],
+            # `device_type` for Device only
+            "device_types": [getattr(obj, "device_type_id", None)],
+            "platforms": [obj.platform_id],
+            "cluster_groups": [self.cluster_groups.get(cluster_id)],
+            "clusters": [cluster_id],
+            "tenant_groups": [self.tenant_groups.get(obj.tenant_id)],
+            "tenants": [obj.tenant_id],
+            "tags": tag_ids,
+        }
+
+    def get_bitset(self, obj, tag_ids=None):
+        """
+        Return the bitset of ConfigContexts applicable to the given Device or VirtualMachine.
+        """
+        bitset = (1 << len(self.context_ids)) - 1
+        for field_name, object_ids in self.get_scope(obj, tag_ids=tag_ids).items():
+            unscoped, by_object = self.scopes[field_name]
+            field_bitset = unscoped
+            for object_id in object_ids:
+                field_bitset |= by_object.get(object_id, 0)
+            bitset &= field_bitset
+            if not bitset:
+                break
+        return bitset
+
+    def _iter_bits(self, bitset):
+        i = 0
+        while bitset:
+            if bitset & 1:
+                yield i
+            bitset >>= 1
+            i += 1
+
+    def get_context_ids(self, obj, tag_ids=None):
+        """
+        Return the IDs of the ConfigContexts applicable to the given Device or VirtualMachine, in order of weight and
+        name.
+        """
+        return [self.context_ids[i] for i in self._iter_bits(self.get_bitset(obj, tag_ids=tag_ids))]
+
+    def get_context_data(self, obj, tag_ids=None):
+        """
+        Return the merged data of all ConfigContexts applicable to the given Device or VirtualMachine (excluding its
+        local context data).
+        """
+        bitset = self.get_bitset(obj, tag_ids=tag_ids)
+        if bitset not in self._merged_data:
+            # Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs
+            data = OrderedDict()
+            for i in self._iter_bits(bitset):
+                data = deepmerge(data, self.context_data[i])
+            self._merged_data[bitset] = data
+
+        # Callers may modify the returned data
+        return copy.deepcopy(self._merged_data[bitset])
+
+
+def _load_config_context_index(key):
+    return ConfigContextIndex.load()
+
+
+# The ConfigContextIndex, which is invalidated by signal handlers whenever ConfigContexts or their scopes change
+config_context_cache = VersionedCache("extras.config_context", _load_config_context_index)
+
+
+def get_config_context_index(version=None):
+    """
+    Return the current ConfigContextIndex.
+    """
+    return config_context_cache.get("index", version=version)
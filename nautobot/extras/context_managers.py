@@ -6,7 +6,9 @@ from django.core.handlers.wsgi import WSGIRequest
 from django.db.models.signals import m2m_changed, pre_delete, post_save
 from django.test.client import RequestFactory
 
+from nautobot.extras.change_logging import ObjectChangeBuffer
 from nautobot.extras.signals import _handle_changed_object, _handle_deleted_object
+from nautobot.extras.webhooks import WebhookQueue
 from nautobot.utilities.utils import curry
 
 
@@ -16,24 +18,38 @@ def change_logging(request):
     Enable change logging by connecting the appropriate signals to their receivers before code is run, and
     disconnecting them afterward.
 
+    ObjectChange records are buffered for the duration of the context and written in bulk as each transaction commits,
+    with any remainder written on exit. Webhook events are likewise collected and enqueued in batches on exit.
+
     :param request: WSGIRequest object with a unique `id` set
     """
+    objectchange_buffer = ObjectChangeBuffer()
+    webhook_queue = WebhookQueue(request.id)
+
     # Curry signals receivers to pass the current request
-    handle_changed_object = curry(_handle_changed_object, request)
-    handle_deleted_object = curry(_handle_deleted_object, request)
+    handle_changed_object = curry(
+        _handle_changed_object, request, objectchange_buffer=objectchange_buffer, webhook_queue=webhook_queue
+    )
+    handle_deleted_object = curry(
+        _handle_deleted_object, request, objectchange_buffer=objectchange_buffer, webhook_queue=webhook_queue
+    )
 
     # Connect our receivers to the post_save and post_delete signals.
     post_save.connect(handle_changed_object, dispatch_uid="handle_changed_object")
     m2m_changed.connect(handle_changed_object, dispatch_uid="handle_changed_object")
     pre_delete.connect(handle_deleted_object, dispatch_uid="handle_deleted_object")
 
-    yield
-
-    # Disconnect change logging signals. This is necessary to avoid recording any errant
-    # changes during test cleanup.
-    post_save.disconnect(handle_changed_object, dispatch_uid="handle_changed_object")
-    m2m_changed.disconnect(handle_changed_object, dispatch_uid="handle_changed_object")
-    pre_delete.disconnect(handle_deleted_object, dispatch_uid="handle_deleted_object")
+    try:
+        yield
+    finally:
+        # Disconnect change logging signals. This is necessary to avoid recording any errant
+        # changes during test cleanup.
+        post_save.disconnect(handle_changed_object, dispatch_uid="handle_changed_object")
+        m2m_changed.disconnect(handle_changed_object, dispatch_uid="handle_changed_object")
+        pre_delete.disconnect(handle_deleted_object, dispatch_uid="handle_deleted_object")
+
+        objectchange_buffer.close()
+        webhook_queue.close()
 
 
 @contextmanager
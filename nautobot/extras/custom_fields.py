@@ -0,0 +1,27 @@
+from django.contrib.contenttypes.models import ContentType
+
+from nautobot.utilities.caching import VersionedCache
+
+
+def _load_custom_fields(content_type_id):
+    """
+    Load the CustomFields (and their choices) for the given content type ID.
+    """
+    # Import added here to avoid circular imports with CustomFieldModel.
+    from nautobot.extras.models import CustomField
+
+    return list(CustomField.objects.filter(content_types=content_type_id).prefetch_related("choices"))
+
+
+# CustomFields keyed by content type ID; invalidated by signal handlers when CustomFields or their choices change
+custom_field_cache = VersionedCache("extras.custom_field", _load_custom_fields)
+
+
+def get_custom_fields_for_model(model, version=None):
+    """
+    Return the list of CustomFields assigned to the given model (or instance thereof), in order of weight.
+
+    The CustomFields are shared by all callers within the process, and must not be modified.
+    """
+    content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+    return custom_field_cache.get(content_type.pk, version=version)
@@ -1,6 +1,8 @@
 """Git data source functionality."""
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import logging
 import mimetypes
 import os
@@ -9,8 +11,9 @@ from urllib.parse import quote
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils.text import slugify
 import yaml
 
@@ -42,6 +45,14 @@ from .utils import files_from_contenttype_directories
 
 logger = logging.getLogger("nautobot.datasources.git")
 
+# The directory of a Git repository from which each type of content provided by the repository is loaded
+GIT_CONTENT_DIRECTORIES = {
+    "extras.configcontext": "config_contexts",
+    "extras.configcontextschema": "config_context_schemas",
+    "extras.exporttemplate": "export_templates",
+    "extras.job": "jobs",
+}
+
 
 def enqueue_pull_git_repository_and_refresh_data(repository, request):
     """
@@ -98,7 +109,25 @@ def pull_git_repository_and_refresh_data(repository_pk, request, job_result_pk):
             logger=logger,
         )
 
-        refresh_datasource_content("extras.gitrepository", repository_record, request, job_result, delete=False)
+        # Skip the refresh if neither the repository's content nor what it provides has changed since the last one
+        refresh_key = f"nautobot.extras.git_repository.refreshed.{repository_record.pk}"
+        refresh_state = (
+            repository_record.current_head,
+            sorted(repository_record.provided_contents),
+            get_git_repository_content_hash(repository_record),
+        )
+        if cache.get(refresh_key) == refresh_state:
+            job_result.log(
+                "The repository is unchanged since it was last refreshed; skipping refresh of its data",
+                level_choice=LogLevelChoices.LOG_INFO,
+                logger=logger,
+            )
+        else:
+            refresh_datasource_content("extras.gitrepository", repository_record, request, job_result, delete=False)
+            if not JobLogEntry.objects.filter(
+                job_result__pk=job_result.pk, log_level=LogLevelChoices.LOG_FAILURE
+            ).exists():
+                cache.set(refresh_key, refresh_state, timeout=None)
 
     except Exception as exc:
         job_result.log(
@@ -177,7 +206,7 @@ def ensure_git_repository(repository_record, job_result=None, logger=None, head=
     from_branch = repository_record.branch
 
     try:
-        repo_helper = GitRepo(to_path, from_url)
+        repo_helper = GitRepo(to_path, from_url, **_get_checkout_options(repository_record))
         head = repo_helper.checkout(from_branch, head)
         if repository_record.current_head != head:
             repository_record.current_head = head
@@ -204,6 +233,76 @@ def ensure_git_repository(repository_record, job_result=None, logger=None, head=
         logger.info("Repository successfully refreshed")
 
 
+def _get_checkout_options(repository_record):
+    """
+    Return the GitRepo arguments for a shallow and sparse checkout of the given repository if GIT_SHALLOW_CHECKOUT is
+    enabled: only its latest commit is fetched, and only the directories of the contents it provides are checked out.
+    """
+    if not settings.GIT_SHALLOW_CHECKOUT:
+        return {}
+
+    options = {"depth": 1}
+    # Content provided by plugins may be loaded from any directory, in which case the whole tree is checked out
+    if all(content in GIT_CONTENT_DIRECTORIES for content in repository_record.provided_contents):
+        options["sparse_paths"] = sorted(
+            GIT_CONTENT_DIRECTORIES[content] for content in repository_record.provided_contents
+        )
+    return options
+
+
+def get_git_repository_content_hash(repository_record):
+    """
+    Return a hash of the files on disk in the directories of the contents provided by the given repository (or of all
+    of its files, if it provides content from other directories), to detect whether they have changed.
+    """
+    if all(content in GIT_CONTENT_DIRECTORIES for content in repository_record.provided_contents):
+        paths = sorted(GIT_CONTENT_DIRECTORIES[content] for content in repository_record.provided_contents)
+    else:
+        paths = [""]
+
+    content_hash = hashlib.sha256()
+    for path in paths:
+        for dir_path, dir_names, file_names in os.walk(os.path.join(repository_record.filesystem_path, path)):
+            dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name != ".git")
+            for file_name in sorted(file_names):
+                file_path = os.path.join(dir_path, file_name)
+                content_hash.update(os.path.relpath(file_path, repository_record.filesystem_path).encode() + b"\0")
+                with open(file_path, "rb") as fd:
+                    content_hash.update(hashlib.sha256(fd.read()).digest())
+    return content_hash.hexdigest()
+
+
+def ensure_git_repositories(repository_records, logger=None):
+    """
+    Ensure that each of the given Git repositories is present and has its `current_head` checked out, as
+    `ensure_git_repository()` does, refreshing up to GIT_SYNC_MAX_WORKERS of them at once.
+
+    Returns:
+        dict: The exception raised for each repository (by its PK) which could not be refreshed
+    """
+
+    def ensure(repository_record):
+        try:
+            ensure_git_repository(repository_record, head=repository_record.current_head, logger=logger)
+        except Exception as exc:
+            return exc
+        finally:
+            if parallel:
+                # Each thread has its own database connection(s)
+                connections.close_all()
+        return None
+
+    repository_records = list(repository_records)
+    parallel = len(repository_records) > 1 and settings.GIT_SYNC_MAX_WORKERS > 1
+    if parallel:
+        with ThreadPoolExecutor(max_workers=settings.GIT_SYNC_MAX_WORKERS) as executor:
+            results = list(executor.map(ensure, repository_records))
+    else:
+        results = [ensure(repository_record) for repository_record in repository_records]
+
+    return {repository_record.pk: exc for repository_record, exc in zip(repository_records, results) if exc is not None}
+
+
 #
 # Config context handling
 #
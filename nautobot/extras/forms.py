@@ -42,6 +42,7 @@ from .choices import (
     RelationshipSideChoices,
     RelationshipTypeChoices,
 )
+from .custom_fields import get_custom_fields_for_model
 from .datasources import get_datasource_content_choices
 from .models import (
     ComputedField,
@@ -514,7 +515,7 @@ class CustomFieldModelForm(forms.ModelForm):
         Append form fields for all CustomFields assigned to this model.
         """
         # Append form fields; assign initial values if modifying and existing object
-        for cf in CustomField.objects.filter(content_types=self.obj_type):
+        for cf in get_custom_fields_for_model(self._meta.model):
             field_name = "cf_{}".format(cf.name)
             if self.instance.present_in_database:
                 self.fields[field_name] = cf.to_form_field(set_initial=False)
@@ -538,7 +539,7 @@ class CustomFieldModelCSVForm(CSVModelForm, CustomFieldModelForm):
     def _append_customfield_fields(self):
 
         # Append form fields
-        for cf in CustomField.objects.filter(content_types=self.obj_type):
+        for cf in get_custom_fields_for_model(self._meta.model):
             field_name = "cf_{}".format(cf.name)
             self.fields[field_name] = cf.to_form_field(for_csv_import=True)
 
@@ -554,8 +555,7 @@ class CustomFieldBulkEditForm(BulkEditForm):
         self.obj_type = ContentType.objects.get_for_model(self.model)
 
         # Add all applicable CustomFields to the form
-        custom_fields = CustomField.objects.filter(content_types=self.obj_type)
-        for cf in custom_fields:
+        for cf in get_custom_fields_for_model(self.model):
             name = self._get_field_name(cf.name)
             # Annotate non-required custom fields as nullable
             if not cf.required:
@@ -589,10 +589,9 @@ class CustomFieldFilterForm(forms.Form):
         super().__init__(*args, **kwargs)
 
         # Add all applicable CustomFields to the form
-        custom_fields = CustomField.objects.filter(content_types=self.obj_type).exclude(
-            filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED
-        )
-        for cf in custom_fields:
+        for cf in get_custom_fields_for_model(self.model):
+            if cf.filter_logic == CustomFieldFilterLogicChoices.FILTER_DISABLED:
+                continue
             field_name = "cf_{}".format(cf.name)
             self.fields[field_name] = cf.to_form_field(set_initial=True, enforce_required=False)
 
@@ -1314,6 +1313,7 @@ class WebhookForm(BootstrapMixin, forms.ModelForm):
             "secret",
             "ssl_verification",
             "ca_file_path",
+            "batch_payload",
         )
 
 
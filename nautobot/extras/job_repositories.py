@@ -0,0 +1,20 @@
+from nautobot.utilities.caching import VersionedCache
+
+
+def _load_job_repositories(key=None):
+    """
+    Load the primary key, slug, filesystem path and current head of each GitRepository which provides jobs.
+    """
+    # Import added here to avoid circular imports with GitRepository.
+    from nautobot.extras.models import GitRepository
+
+    return [
+        (repository.pk, repository.slug, repository.filesystem_path, repository.current_head)
+        for repository in GitRepository.objects.all()
+        if "extras.job" in repository.provided_contents
+    ]
+
+
+# The GitRepositories providing jobs, as a manifest shared by all processes which discover jobs (see `get_jobs()`);
+# invalidated by signal handlers when GitRepositories change
+job_repository_cache = VersionedCache("extras.job_repository", _load_job_repositories)
@@ -7,6 +7,7 @@ import os
 import pkgutil
 import sys
 import shutil
+import threading
 import traceback
 import warnings
 
@@ -31,8 +32,9 @@ import yaml
 
 from .choices import JobResultStatusChoices, LogLevelChoices
 from .context_managers import change_logging
-from .datasources.git import ensure_git_repository
+from .datasources.git import ensure_git_repositories
 from .forms import JobForm
+from .job_repositories import job_repository_cache
 from .models import FileProxy, GitRepository, ScheduledJob
 from .registry import registry
 
@@ -791,6 +793,10 @@ def get_jobs():
     """
     Compile a dictionary of all jobs available across all modules in the jobs path(s).
 
+    The jobs of each module are cached by each process, and a module is only imported again once its file(s) have
+    changed (or, for a Git repository, once a different commit has been checked out). Git repositories are only
+    refreshed when their `current_head` differs from the commit last checked out by this process.
+
     Returns an OrderedDict:
 
     {
@@ -817,35 +823,40 @@ def get_jobs():
     """
     jobs = OrderedDict()
 
-    paths = _get_job_source_paths()
-
-    # Iterate over all groupings (local, git.<slug1>, git.<slug2>, etc.)
-    for grouping, path_list in paths.items():
-        # Iterate over all modules (Python files) found in any of the directory paths identified for the given grouping
-        for importer, module_name, _ in pkgutil.iter_modules(path_list):
-            try:
-                # Remove cached module to ensure consistency with filesystem
-                if module_name in sys.modules:
-                    del sys.modules[module_name]
-
-                # Dynamically import this module to make its contents (job(s)) available to Python
-                module = importer.find_module(module_name).load_module(module_name)
-            except Exception as exc:
-                logger.error(f"Unable to load job {module_name}: {exc}")
-                continue
-
-            # For each module, we construct a dict {"name": module_name, "jobs": {"job_name": job_class, ...}}
-            human_readable_name = module.name if hasattr(module, "name") else module_name
-            module_jobs = {"name": human_readable_name, "jobs": OrderedDict()}
-            # Get all Job subclasses (which includes Script and Report subclasses as well) in this module,
-            # and add them to the dict
-            for name, cls in inspect.getmembers(module, is_job):
-                module_jobs["jobs"][name] = cls
+    with _job_modules_lock:
+        paths = _get_job_source_paths()
+
+        # Iterate over all groupings (local, git.<slug1>, git.<slug2>, etc.)
+        loaded_modules = {}
+        for grouping, path_list in paths.items():
+            # Iterate over all modules (Python files) found in any of the directory paths identified for the given
+            # grouping, importing only those which are new or have changed since they were last imported
+            for importer, module_name, is_package in pkgutil.iter_modules(path_list):
+                key = (grouping, module_name)
+                module_path = os.path.join(importer.path, module_name)
+                stamp = (module_path, _job_repository_heads.get(grouping), _get_module_stamp(module_path, is_package))
+                if key in _job_modules and _job_modules[key][0] == stamp:
+                    loaded_modules[key] = _job_modules[key][1]
+                    continue
 
-            # If there were any Job subclasses found, add the module_jobs dict to the overall jobs dict
-            # (otherwise skip it since there aren't any jobs in this module to report)
-            if module_jobs["jobs"]:
-                jobs.setdefault(grouping, {})[module_name] = module_jobs
+                module_jobs = _load_job_module(importer, module_name)
+                if module_jobs is not None:
+                    # Modules which failed to import are retried on the next call
+                    _job_modules[key] = (stamp, module_jobs)
+                loaded_modules[key] = module_jobs
+
+        # Forget modules which no longer exist
+        for key in set(_job_modules) - set(loaded_modules):
+            del _job_modules[key]
+
+    for (grouping, module_name), module_jobs in loaded_modules.items():
+        # If there were any Job subclasses found, add the module_jobs dict to the overall jobs dict
+        # (otherwise skip it since there aren't any jobs in this module to report)
+        if module_jobs and module_jobs["jobs"]:
+            jobs.setdefault(grouping, {})[module_name] = {
+                "name": module_jobs["name"],
+                "jobs": OrderedDict(module_jobs["jobs"]),
+            }
 
     # Add jobs from plugins (which were already imported at startup)
     for cls in registry["plugin_jobs"]:
@@ -857,6 +868,64 @@ def get_jobs():
     return jobs
 
 
+# Lock protecting the state below, which caches the results of job discovery for each process
+_job_modules_lock = threading.RLock()
+# (grouping, module name) -> (stamp, module_jobs dict) for each job module imported by get_jobs()
+_job_modules = {}
+# Git repository grouping -> the `current_head` checked out locally, for repositories providing jobs
+_job_repository_heads = {}
+# Version of job_repository_cache at which GIT_ROOT was last checked for leftover repositories
+_git_root_checked_version = None
+
+
+def _get_module_stamp(path, is_package):
+    """
+    Helper function to get_jobs().
+
+    Return the modification time and size of the file of the module at the given path (without its ".py" extension),
+    or of each Python file within it if it's a package, so that a module is only imported again once it has changed.
+    """
+    if not is_package:
+        stat = os.stat(f"{path}.py")
+        return (stat.st_mtime_ns, stat.st_size)
+
+    stamps = []
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            if file_name.endswith(".py"):
+                stat = os.stat(os.path.join(dir_path, file_name))
+                stamps.append((os.path.join(dir_path, file_name), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(stamps))
+
+
+def _load_job_module(importer, module_name):
+    """
+    Helper function to get_jobs().
+
+    Import the given module, returning a dict {"name": <human-readable module name>, "jobs": {<class_name>: <job_class>}},
+    or None if the module can't be imported.
+    """
+    try:
+        # Remove cached module to ensure consistency with filesystem
+        if module_name in sys.modules:
+            del sys.modules[module_name]
+
+        # Dynamically import this module to make its contents (job(s)) available to Python
+        module = importer.find_module(module_name).load_module(module_name)
+    except Exception as exc:
+        logger.error(f"Unable to load job {module_name}: {exc}")
+        return None
+
+    # For each module, we construct a dict {"name": module_name, "jobs": {"job_name": job_class, ...}}
+    human_readable_name = module.name if hasattr(module, "name") else module_name
+    module_jobs = {"name": human_readable_name, "jobs": OrderedDict()}
+    # Get all Job subclasses (which includes Script and Report subclasses as well) in this module,
+    # and add them to the dict
+    for name, cls in inspect.getmembers(module, is_job):
+        module_jobs["jobs"][name] = cls
+    return module_jobs
+
+
 def _get_job_source_paths():
     """
     Helper function to get_jobs().
@@ -865,6 +934,8 @@ def _get_job_source_paths():
     Current groupings are "local", "git.<repository_slug>".
     Plugin jobs aren't loaded dynamically from a source_path and so are not included in this function
     """
+    global _git_root_checked_version
+
     paths = {}
     # Locally installed jobs
     if settings.JOBS_ROOT and os.path.exists(settings.JOBS_ROOT):
@@ -872,45 +943,62 @@ def _get_job_source_paths():
 
     # Jobs derived from Git repositories
     if settings.GIT_ROOT and os.path.isdir(settings.GIT_ROOT):
-        for repository_record in GitRepository.objects.all():
-            if "extras.job" not in repository_record.provided_contents:
-                # This repository isn't marked as containing jobs that we should use.
+        version = job_repository_cache.get_version()
+        repositories = job_repository_cache.get(None, version=version)
+
+        # In the case where we have multiple Nautobot instances, or multiple RQ worker instances,
+        # they are not required to share a common filesystem; therefore, we may need to refresh our local clone
+        # of the Git repository to ensure that it is in sync with the latest repository clone from any instance.
+        # This is only needed when the repository's head differs from that last checked out by this process.
+        stale_pks = [
+            pk
+            for pk, slug, filesystem_path, current_head in repositories
+            if not current_head
+            or current_head != _job_repository_heads.get(f"git.{slug}")
+            or not os.path.isdir(filesystem_path)
+        ]
+        errors = {}
+        if stale_pks:
+            stale_records = list(GitRepository.objects.filter(pk__in=stale_pks))
+            errors = ensure_git_repositories(stale_records, logger=logger)
+            for repository_record in stale_records:
+                if repository_record.pk not in errors:
+                    _job_repository_heads[f"git.{repository_record.slug}"] = repository_record.current_head
+
+        for pk, slug, filesystem_path, current_head in repositories:
+            grouping = f"git.{slug}"
+            if pk in errors:
+                logger.error(f"Error during local clone of Git repository {slug}: {errors[pk]}")
+                _job_repository_heads.pop(grouping, None)
                 continue
 
-            try:
-                # In the case where we have multiple Nautobot instances, or multiple RQ worker instances,
-                # they are not required to share a common filesystem; therefore, we may need to refresh our local clone
-                # of the Git repository to ensure that it is in sync with the latest repository clone from any instance.
-                ensure_git_repository(
-                    repository_record,
-                    head=repository_record.current_head,
-                    logger=logger,
-                )
-            except Exception as exc:
-                logger.error(f"Error during local clone of Git repository {repository_record}: {exc}")
-                continue
-
-            jobs_path = os.path.join(repository_record.filesystem_path, "jobs")
+            jobs_path = os.path.join(filesystem_path, "jobs")
             if os.path.isdir(jobs_path):
-                paths[f"git.{repository_record.slug}"] = [jobs_path]
+                paths[grouping] = [jobs_path]
             else:
-                logger.warning(f"Git repository {repository_record} is configured to provide jobs, but none are found!")
+                logger.warning(f"Git repository {slug} is configured to provide jobs, but none are found!")
 
         # TODO: when a Git repo is deleted or its slug is changed, we update the local filesystem
         # (see extras/signals.py, extras/models/datasources.py), but as noted above, there may be multiple filesystems
         # involved, so not all local clones of deleted Git repositories may have been deleted yet.
-        # For now, if we encounter a "leftover" Git repo here, we delete it now.
-        for git_slug in os.listdir(settings.GIT_ROOT):
-            git_path = os.path.join(settings.GIT_ROOT, git_slug)
-            if not os.path.isdir(git_path):
-                logger.warning(
-                    f"Found non-directory {git_slug} in {settings.GIT_ROOT}. Only Git repositories should exist here."
-                )
-            elif not os.path.isdir(os.path.join(git_path, ".git")):
-                logger.warning(f"Directory {git_slug} in {settings.GIT_ROOT} does not appear to be a Git repository.")
-            elif not GitRepository.objects.filter(slug=git_slug):
-                logger.warning(f"Deleting unmanaged (leftover?) repository at {git_path}")
-                shutil.rmtree(git_path)
+        # For now, if we encounter a "leftover" Git repo here, we delete it now. This is only checked once the
+        # GitRepositories have changed.
+        if version != _git_root_checked_version:
+            for git_slug in os.listdir(settings.GIT_ROOT):
+                git_path = os.path.join(settings.GIT_ROOT, git_slug)
+                if not os.path.isdir(git_path):
+                    logger.warning(
+                        f"Found non-directory {git_slug} in {settings.GIT_ROOT}. "
+                        "Only Git repositories should exist here."
+                    )
+                elif not os.path.isdir(os.path.join(git_path, ".git")):
+                    logger.warning(
+                        f"Directory {git_slug} in {settings.GIT_ROOT} does not appear to be a Git repository."
+                    )
+                elif not GitRepository.objects.filter(slug=git_slug):
+                    logger.warning(f"Deleting unmanaged (leftover?) repository at {git_path}")
+                    shutil.rmtree(git_path)
+            _git_root_checked_version = version
 
     return paths
 
@@ -1108,12 +1196,13 @@ def run_job(data, request, job_result_pk, commit=True, *args, **kwargs):
         job.logger.info(f"Job completed in {job_result.duration}")
 
     # Execute the job. If commit == True, wrap it with the change_logging context manager to ensure we
-    # process change logs, webhooks, etc.
-    if commit:
-        with change_logging(request):
+    # process change logs, webhooks, etc. Its log entries are written in batches rather than one at a time.
+    with job_result.buffered_logs():
+        if commit:
+            with change_logging(request):
+                _run_job()
+        else:
             _run_job()
-    else:
-        _run_job()
 
 
 @nautobot_task
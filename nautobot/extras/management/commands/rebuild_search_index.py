@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from nautobot.extras.search import get_indexed_models, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search index, such as after objects have been imported or updated in bulk."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.model_name",
+            help="Only rebuild the index entries of these models (default: all searchable models)",
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only index objects which are missing from the index, leaving existing entries as they are",
+        )
+
+    def handle(self, *args, **options):
+        models = sorted(get_indexed_models(), key=lambda model: model._meta.label_lower)
+        if options["models"]:
+            labels = {label.lower() for label in options["models"]}
+            models = [model for model in models if model._meta.label_lower in labels]
+            for label in labels - {model._meta.label_lower for model in models}:
+                self.stderr.write(self.style.WARNING(f"{label} is not a searchable model, skipping"))
+
+        for model in models:
+            count = rebuild_search_index(model, missing_only=options["missing"])
+            self.stdout.write(self.style.SUCCESS(f"Indexed {count} {model._meta.verbose_name_plural}"))
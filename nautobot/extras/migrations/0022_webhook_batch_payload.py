@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("extras", "0021_customfield_changelog_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_payload",
+            field=models.BooleanField(
+                default=False,
+                help_text="Send all events resulting from a single request in one HTTP request. If no body template is defined, the body will be a JSON array of events; otherwise the template is rendered with a list of event contexts available as <code>events</code>.",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("extras", "0022_webhook_batch_payload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fileproxy",
+            name="job_result",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The job result which produced this file, if any",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="files",
+                to="extras.jobresult",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+import logging
+import uuid
+
+from django.db import DatabaseError, migrations, models, transaction
+import django.db.models.deletion
+
+
+logger = logging.getLogger("nautobot.extras.migrations")
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    On PostgreSQL, index the search text with trigrams, so that substring searches (`LIKE '%...%'`) use the index.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        # The pg_trgm extension is a trusted extension as of PostgreSQL 13; on older versions it can only be created
+        # by a superuser, so if this fails, the search index is used without the trigram index.
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as exc:
+        logger.warning(f"Unable to create the pg_trgm extension, search will not use a trigram index: {exc}")
+        return
+    schema_editor.execute(
+        "CREATE INDEX extras_searchindexentry_text_trgm ON extras_searchindexentry USING gin (text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS extras_searchindexentry_text_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0023_fileproxy_job_result"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchIndexEntry",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("object_id", models.UUIDField()),
+                ("name", models.CharField(max_length=255)),
+                ("text", models.TextField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "search index entries",
+                "ordering": ["name"],
+                "unique_together": {("content_type", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -21,6 +21,7 @@ from .models import (
     Webhook,
 )
 from .relationships import Relationship, RelationshipModel, RelationshipAssociation
+from .search import SearchIndexEntry
 from .secrets import Secret, SecretsGroup, SecretsGroupAssociation
 from .tags import Tag, TaggedItem
 
@@ -50,6 +51,7 @@ __all__ = (
     "RelationshipAssociation",
     "ScheduledJob",
     "ScheduledJobs",
+    "SearchIndexEntry",
     "Secret",
     "SecretsGroup",
     "SecretsGroupAssociation",
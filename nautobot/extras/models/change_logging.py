@@ -101,8 +101,15 @@ class ObjectChange(BaseModel):
         )
 
     def save(self, *args, **kwargs):
+        self.populate_static_fields()
+        return super().save(*args, **kwargs)
+
+    def populate_static_fields(self):
+        """
+        Record the user's name and the object's representation as static strings.
 
-        # Record the user's name and the object's representation as static strings
+        This is done automatically by `save()`, but must be called explicitly before using `bulk_create()`.
+        """
         if not self.user_name:
             if self.user:
                 self.user_name = self.user.username
@@ -112,8 +119,6 @@ class ObjectChange(BaseModel):
         if not self.object_repr:
             self.object_repr = str(self.changed_object)
 
-        return super().save(*args, **kwargs)
-
     def get_absolute_url(self):
         return reverse("extras:objectchange", args=[self.pk])
 
@@ -14,8 +14,14 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
+from nautobot.extras.computed_fields import get_computed_fields_for_model, render_computed_fields
+from nautobot.extras.custom_fields import get_custom_fields_for_model
 from nautobot.extras.models import ChangeLoggedModel, ObjectChange
-from nautobot.extras.tasks import delete_custom_field_data, update_custom_field_choice_data
+from nautobot.extras.tasks import (
+    delete_custom_field_data,
+    enqueue_custom_field_task,
+    update_custom_field_choice_data,
+)
 from nautobot.extras.utils import FeatureQuery, extras_features
 from nautobot.core.fields import AutoSlugField
 from nautobot.core.models import BaseModel
@@ -128,13 +134,13 @@ class CustomFieldModel(models.Model):
         """
         Return a dictionary of custom fields for a single object in the form {<field>: value}.
         """
-        fields = CustomField.objects.get_for_model(self)
+        fields = get_custom_fields_for_model(self)
         return OrderedDict([(field, self.cf.get(field.name)) for field in fields])
 
     def clean(self):
         super().clean()
 
-        custom_fields = {cf.name: cf for cf in CustomField.objects.get_for_model(self)}
+        custom_fields = {cf.name: cf for cf in get_custom_fields_for_model(self)}
 
         # Validate all field values
         for field_name, value in self._custom_field_data.items():
@@ -155,16 +161,17 @@ class CustomFieldModel(models.Model):
         """
         Return a boolean indicating whether or not this content type has computed fields associated with it.
         """
-        return ComputedField.objects.get_for_model(self).exists()
+        return bool(get_computed_fields_for_model(self))
 
     def get_computed_field(self, slug, render=True):
         """
         Get a computed field for this model, lookup via slug.
         Returns the template of this field if render is False, otherwise returns the rendered value.
         """
-        try:
-            computed_field = ComputedField.objects.get_for_model(self).get(slug=slug)
-        except ComputedField.DoesNotExist:
+        for computed_field in get_computed_fields_for_model(self):
+            if computed_field.slug == slug:
+                break
+        else:
             logger.warning("Computed Field with slug %s does not exist for model %s", slug, self._meta.verbose_name)
             return None
         if render:
@@ -175,14 +182,10 @@ class CustomFieldModel(models.Model):
         """
         Return a dictionary of all computed fields and their rendered values for this model.
         Keys are the `slug` value of each field. If label_as_key is True, `label` values of each field are used as keys.
+
+        To render the computed fields of many objects, use `nautobot.extras.computed_fields.render_computed_fields()`.
         """
-        computed_fields_dict = {}
-        computed_fields = ComputedField.objects.get_for_model(self)
-        if not computed_fields:
-            return {}
-        for cf in computed_fields:
-            computed_fields_dict[cf.label if label_as_key else cf.slug] = cf.render(context={"obj": self})
-        return computed_fields_dict
+        return render_computed_fields([self], label_as_key=label_as_key)[0]
 
 
 class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
@@ -331,6 +334,14 @@ class CustomField(BaseModel, ChangeLoggedModel):
                 {"default": f"The specified default value ({self.default}) is not listed as an available choice."}
             )
 
+    def get_choice_values(self):
+        """
+        Return the list of values of this field's choices, in order of weight.
+
+        Uses the prefetched choices, if any (as with the CustomFields returned by `get_custom_fields_for_model()`).
+        """
+        return [choice.value for choice in self.choices.all()]
+
     def to_form_field(self, set_initial=True, enforce_required=True, for_csv_import=False):
         """
         Return a form field suitable for setting a CustomField's value for an object.
@@ -385,15 +396,16 @@ class CustomField(BaseModel, ChangeLoggedModel):
 
         # Select or Multi-select
         else:
-            choices = [(cfc.value, cfc.value) for cfc in self.choices.all()]
-            default_choice = self.choices.filter(value=self.default).first()
+            choice_values = self.get_choice_values()
+            choices = [(value, value) for value in choice_values]
+            has_default_choice = self.default in choice_values
 
-            if not required or default_choice is None:
+            if not required or not has_default_choice:
                 choices = add_blank_choice(choices)
 
             # Set the initial value to the first available choice (if any)
-            if set_initial and default_choice:
-                initial = default_choice.value
+            if set_initial and has_default_choice:
+                initial = self.default
 
             if self.type == CustomFieldTypeChoices.TYPE_SELECT:
                 field_class = CSVChoiceField if for_csv_import else forms.ChoiceField
@@ -461,15 +473,15 @@ class CustomField(BaseModel, ChangeLoggedModel):
 
             # Validate selected choice
             if self.type == CustomFieldTypeChoices.TYPE_SELECT:
-                if value not in self.choices.values_list("value", flat=True):
+                if value not in self.get_choice_values():
                     raise ValidationError(
-                        f"Invalid choice ({value}). Available choices are: {', '.join(self.choices.values_list('value', flat=True))}"
+                        f"Invalid choice ({value}). Available choices are: {', '.join(self.get_choice_values())}"
                     )
 
             if self.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-                if not set(value).issubset(self.choices.values_list("value", flat=True)):
+                if not set(value).issubset(self.get_choice_values()):
                     raise ValidationError(
-                        f"Invalid choice(s) ({value}). Available choices are: {', '.join(self.choices.values_list('value', flat=True))}"
+                        f"Invalid choice(s) ({value}). Available choices are: {', '.join(self.get_choice_values())}"
                     )
 
         elif self.required:
@@ -479,11 +491,15 @@ class CustomField(BaseModel, ChangeLoggedModel):
         """
         Handle the cleanup of old custom field data when a CustomField is deleted.
         """
-        content_types = set(self.content_types.values_list("pk", flat=True))
+        content_types = list(self.content_types.values_list("pk", flat=True))
 
         super().delete(*args, **kwargs)
 
-        delete_custom_field_data.delay(self.name, content_types)
+        transaction.on_commit(
+            lambda: enqueue_custom_field_task(
+                delete_custom_field_data, self.name, field_name=self.name, content_type_pk_set=content_types
+            )
+        )
 
     def get_absolute_url(self):
         return reverse("extras:customfield", args=[self.name])
@@ -536,7 +552,13 @@ class CustomFieldChoice(BaseModel, ChangeLoggedModel):
 
         if self.value != database_object.value:
             transaction.on_commit(
-                lambda: update_custom_field_choice_data.delay(self.field.pk, database_object.value, self.value)
+                lambda: enqueue_custom_field_task(
+                    update_custom_field_choice_data,
+                    self.field.name,
+                    field_id=self.field.pk,
+                    old_value=database_object.value,
+                    new_value=self.value,
+                )
             )
 
     def delete(self, *args, **kwargs):
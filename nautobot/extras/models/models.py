@@ -1,7 +1,10 @@
+from contextlib import contextmanager
+import itertools
 import json
 import logging
+import threading
+import time
 import uuid
-from collections import OrderedDict
 from datetime import timedelta
 
 from celery import schedules
@@ -12,9 +15,9 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connections, models
 from django.db.models import signals
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from django_celery_beat.clockedschedule import clocked
@@ -39,6 +42,7 @@ from nautobot.extras.choices import (
     JobResultStatusChoices,
     WebhookHttpMethodChoices,
 )
+from nautobot.extras.config_contexts import get_config_context_index
 from nautobot.extras.constants import (
     HTTP_CONTENT_TYPE_JSON,
     JOB_LOG_MAX_ABSOLUTE_URL_LENGTH,
@@ -50,7 +54,7 @@ from nautobot.extras.models.customfields import CustomFieldModel
 from nautobot.extras.models.relationships import RelationshipModel
 from nautobot.extras.querysets import ConfigContextQuerySet, ScheduledJobExtendedQuerySet
 from nautobot.extras.utils import extras_features, FeatureQuery, image_upload
-from nautobot.utilities.utils import deepmerge, render_jinja2
+from nautobot.utilities.utils import buffer_chunks, deepmerge, jinja2_template_cache, QuerySetStream, render_jinja2
 
 
 # The JOB_LOGS variable is used to tell the JobLogEntry model the database to store to.
@@ -209,13 +213,10 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
         Return the rendered configuration context for a device or VM.
         """
 
-        # always manually query for config contexts
-        config_context_data = ConfigContext.objects.get_for_object(self).values_list("data", flat=True)
-
-        # Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs
-        data = OrderedDict()
-        for context in config_context_data:
-            data = deepmerge(data, context)
+        # Use the data attached by `annotate_config_context_data()`, if any
+        data = getattr(self, "config_context_data", None)
+        if data is None:
+            data = get_config_context_index().get_context_data(self)
 
         # If the object has local config context data defined, merge it last
         if self.local_context_data:
@@ -223,6 +224,12 @@ class ConfigContextModel(models.Model, ConfigContextSchemaValidationMixin):
 
         return data
 
+    def save(self, *args, **kwargs):
+        # The data attached by `annotate_config_context_data()` may no longer apply to the object as saved
+        self.__dict__.pop("config_context_data", None)
+
+        super().save(*args, **kwargs)
+
     def clean(self):
         super().clean()
 
@@ -420,15 +427,39 @@ class ExportTemplate(BaseModel, ChangeLoggedModel, RelationshipModel):
 
         return output
 
+    def iter_render(self, queryset):
+        """
+        Render the contents of the template incrementally, yielding the output in chunks.
+
+        The queryset is iterated over in chunks as well (see `QuerySetStream`), so that neither it nor the output need
+        be held in memory in their entirety.
+        """
+        template = jinja2_template_cache.get(self.template_code)
+        carry = ""
+        for chunk in buffer_chunks(template.stream(context={"queryset": QuerySetStream(queryset)})):
+            chunk = carry + chunk
+            # A CRLF-style line terminator may be split across two chunks
+            if chunk.endswith("\r"):
+                chunk, carry = chunk[:-1], "\r"
+            else:
+                carry = ""
+            # Replace CRLF-style line terminators
+            yield chunk.replace("\r\n", "\n")
+        if carry:
+            yield carry
+
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to a streaming HTTP response, delivered as a named file attachment
         """
-        output = self.render(queryset)
+        chunks = self.iter_render(queryset)
+        # Render the first chunk up front, so that errors in the template are raised to the caller rather than
+        # interrupting the response
+        first_chunk = next(chunks, "")
         mime_type = "text/plain" if not self.mime_type else self.mime_type
 
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = StreamingHttpResponse(itertools.chain([first_chunk], chunks), content_type=mime_type)
         filename = "nautobot_{}{}".format(
             queryset.model._meta.verbose_name_plural,
             ".{}".format(self.file_extension) if self.file_extension else "",
@@ -508,6 +539,14 @@ class FileProxy(BaseModel):
         storage=database_storage,  # Use only this backend
     )
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    job_result = models.ForeignKey(
+        to="extras.JobResult",
+        on_delete=models.CASCADE,
+        related_name="files",
+        blank=True,
+        null=True,
+        help_text="The job result which produced this file, if any",
+    )
 
     def __str__(self):
         return self.name
@@ -743,6 +782,10 @@ class JobResult(BaseModel, CustomFieldModel):
 
     job_id = models.UUIDField(unique=True)
 
+    # Unsaved JobLogEntries, while log() is buffering them (see buffered_logs())
+    _log_buffer = None
+    _log_flush_timer = None
+
     class Meta:
         ordering = ["-created"]
         get_latest_by = "created"
@@ -750,6 +793,11 @@ class JobResult(BaseModel, CustomFieldModel):
     def __str__(self):
         return str(self.job_id)
 
+    def save(self, *args, **kwargs):
+        # Any status change is only visible along with the log entries which preceded it
+        self.flush_logs()
+        super().save(*args, **kwargs)
+
     @property
     def duration(self):
         if not self.completed:
@@ -889,7 +937,24 @@ class JobResult(BaseModel, CustomFieldModel):
         # Otherwise we want to use a separate database here so that the logs are created immediately
         # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
         # are running, and allow us to rollback the database without losing the log entries.
-        if use_default_db or not JOB_LOGS:
+        if use_default_db:
+            log.save()
+        elif self._log_buffer is not None:
+            with self._log_buffer_lock:
+                self._log_buffer.append(log)
+                flush = (
+                    len(self._log_buffer) >= settings.JOB_LOG_BUFFER_SIZE
+                    or time.monotonic() - self._log_buffer_flushed >= settings.JOB_LOG_FLUSH_INTERVAL
+                )
+                # Entries for the default database have to be written by this thread, within its transaction, so
+                # they can only be flushed from a timer when they have a database connection of their own.
+                if not flush and JOB_LOGS and self._log_flush_timer is None:
+                    self._log_flush_timer = threading.Timer(settings.JOB_LOG_FLUSH_INTERVAL, self._flush_logs_on_timer)
+                    self._log_flush_timer.daemon = True
+                    self._log_flush_timer.start()
+            if flush:
+                self.flush_logs()
+        elif not JOB_LOGS:
             log.save()
         else:
             log.save(using=JOB_LOGS)
@@ -903,6 +968,60 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_level = logging.INFO
             logger.log(log_level, str(message))
 
+    @contextmanager
+    def buffered_logs(self):
+        """
+        Buffer the log entries created by `log()` for the duration of the context, rather than saving each one as it
+        is logged, and write them in bulk: once `JOB_LOG_BUFFER_SIZE` entries have accumulated or
+        `JOB_LOG_FLUSH_INTERVAL` seconds have passed since the first of them was logged (checked by a timer thread when
+        they are stored in the `JOB_LOGS` database, otherwise whenever another entry is logged), whenever the JobResult
+        is saved, and on exit.
+
+        Entries logged with `use_default_db` are not buffered, but still saved immediately, within the current
+        transaction.
+        """
+        if self._log_buffer is not None:
+            # Already buffering
+            yield
+            return
+
+        self._log_buffer_lock = threading.Lock()
+        self._log_buffer = []
+        self._log_buffer_flushed = time.monotonic()
+        try:
+            yield
+        finally:
+            self.flush_logs()
+            self._log_buffer = None
+
+    def flush_logs(self):
+        """
+        Write any log entries buffered by `buffered_logs()`.
+        """
+        if self._log_buffer is None:
+            return
+
+        with self._log_buffer_lock:
+            if self._log_flush_timer is not None:
+                self._log_flush_timer.cancel()
+                self._log_flush_timer = None
+            if self._log_buffer:
+                entries, self._log_buffer = self._log_buffer, []
+                # If JOB_LOGS is None, using() selects the default database
+                JobLogEntry.objects.using(JOB_LOGS).bulk_create(entries)
+            self._log_buffer_flushed = time.monotonic()
+
+    def _flush_logs_on_timer(self):
+        """
+        Write the buffered log entries from the timer thread started by `log()`, so that they become visible even when
+        the job logs nothing further for a while.
+        """
+        try:
+            self.flush_logs()
+        finally:
+            # Django opens a connection per thread; don't leave this one behind once the thread ends
+            connections[JOB_LOGS].close()
+
 
 class ScheduledJobs(models.Model):
     """Helper table for tracking updates to scheduled tasks.
@@ -1171,6 +1290,12 @@ class Webhook(BaseModel, ChangeLoggedModel):
         help_text="The specific CA certificate file to use for SSL verification. "
         "Leave blank to use the system defaults.",
     )
+    batch_payload = models.BooleanField(
+        default=False,
+        help_text="Send all events resulting from a single request in one HTTP request. If no body template is "
+        "defined, the body will be a JSON array of events; otherwise the template is rendered with a list of event "
+        "contexts available as <code>events</code>.",
+    )
 
     class Meta:
         ordering = ("name",)
@@ -1213,9 +1338,13 @@ class Webhook(BaseModel, ChangeLoggedModel):
     def render_body(self, context):
         """
         Render the body template, if defined. Otherwise, jump the context as a JSON object.
+
+        For a batch payload (a context containing a list of `events`), the default body is a JSON array of events.
         """
         if self.body_template:
             return render_jinja2(self.body_template, context)
+        elif "events" in context:
+            return json.dumps(context["events"], cls=JSONEncoder)
         else:
             return json.dumps(context, cls=JSONEncoder)
 
@@ -0,0 +1,30 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+from nautobot.core.models import BaseModel
+
+
+class SearchIndexEntry(BaseModel):
+    """
+    The searchable text of a single object, by which objects of all searchable types are found by one query.
+
+    Entries are maintained by signal handlers as objects are saved and deleted (see `nautobot.extras.search`), and
+    can be rebuilt with the `rebuild_search_index` management command.
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    object_id = models.UUIDField()
+    object = GenericForeignKey(ct_field="content_type", fk_field="object_id")
+    # The string representation of the object, for display and ranking
+    name = models.CharField(max_length=255)
+    # The lowercased, newline-separated values of all of the object's searchable fields
+    text = models.TextField()
+
+    class Meta:
+        ordering = ["name"]
+        unique_together = [["content_type", "object_id"]]
+        verbose_name_plural = "search index entries"
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,162 @@
+from functools import lru_cache
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Case, CharField, IntegerField, Q, TextField, Value, When
+
+from nautobot.utilities.utils import iter_queryset
+
+
+@lru_cache(maxsize=None)
+def get_indexed_models():
+    """
+    Return the set of models whose objects are included in the search index, i.e. those of `SEARCH_TYPES`.
+    """
+    # Import added here to avoid circular imports with the tables of each app.
+    from nautobot.core.constants import SEARCH_TYPES
+
+    return frozenset(search_type["queryset"].model for search_type in SEARCH_TYPES.values())
+
+
+def get_search_text(instance):
+    """
+    Return the searchable text of the given object: its string representation, the values of its (non-choice) text
+    fields, such as name, slug, description, serial number and asset tag, and the values of its text custom fields.
+    """
+    values = [str(instance)]
+    for field in instance._meta.concrete_fields:
+        if isinstance(field, (CharField, TextField)) and not field.choices and field.name[0] != "_":
+            values.append(getattr(instance, field.attname))
+    values.extend(getattr(instance, "_custom_field_data", {}).values())
+    return "\n".join(value for value in values if value and isinstance(value, str)).lower()
+
+
+def _get_entry(instance, content_type):
+    from nautobot.extras.models import SearchIndexEntry  # avoiding circular import
+
+    return SearchIndexEntry(
+        content_type=content_type,
+        object_id=instance.pk,
+        name=str(instance)[:255],
+        text=get_search_text(instance),
+    )
+
+
+def update_search_index(instance):
+    """
+    Add or update the search index entry of the given object.
+    """
+    from nautobot.extras.models import SearchIndexEntry  # avoiding circular import
+
+    entry = _get_entry(instance, ContentType.objects.get_for_model(instance))
+    SearchIndexEntry.objects.update_or_create(
+        content_type=entry.content_type,
+        object_id=entry.object_id,
+        defaults={"name": entry.name, "text": entry.text},
+    )
+
+
+def remove_from_search_index(instance):
+    """
+    Remove the search index entry of the given object.
+    """
+    from nautobot.extras.models import SearchIndexEntry  # avoiding circular import
+
+    SearchIndexEntry.objects.filter(
+        content_type=ContentType.objects.get_for_model(instance), object_id=instance.pk
+    ).delete()
+
+
+def rebuild_search_index(model, pks=None, missing_only=False, batch_size=1000):
+    """
+    Replace the search index entries of all objects of the given model, or only those with the given primary keys,
+    such as after they have been updated in bulk (bypassing the signal handlers which maintain the index). If
+    `missing_only` is set, only objects which have no entry are indexed, and existing entries are left as they are.
+
+    Returns:
+        int: The number of entries created
+    """
+    from nautobot.extras.models import SearchIndexEntry  # avoiding circular import
+
+    content_type = ContentType.objects.get_for_model(model)
+    queryset = model.objects.all()
+    entries = SearchIndexEntry.objects.filter(content_type=content_type)
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+        entries = entries.filter(object_id__in=pks)
+    if missing_only:
+        queryset = queryset.exclude(pk__in=entries.values("object_id"))
+        entries = entries.none()
+
+    count = 0
+    # Searches never see the index without the model's entries
+    with transaction.atomic():
+        entries.delete()
+        batch = []
+        for instance in iter_queryset(queryset.nocache(), chunk_size=batch_size):
+            batch.append(_get_entry(instance, content_type))
+            if len(batch) >= batch_size:
+                count += len(SearchIndexEntry.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            count += len(SearchIndexEntry.objects.bulk_create(batch))
+    return count
+
+
+def filter_search_index(query, user, models=None):
+    """
+    Return the search index entries of the objects whose searchable text contains the given query, among the objects
+    which the user is permitted to view.
+
+    Args:
+        query (str): The text to search for
+        user (User): The user performing the search
+        models (list): The models to search (default: all indexed models)
+    """
+    from nautobot.extras.models import SearchIndexEntry  # avoiding circular import
+
+    query = query.strip()
+    if models is None:
+        models = get_indexed_models()
+
+    # Restrict each model to the objects the user may view, within the same query
+    permitted = Q()
+    for model in models:
+        queryset = model.objects.restrict(user, "view")
+        if queryset.query.is_empty():
+            continue
+        condition = Q(content_type=ContentType.objects.get_for_model(model))
+        if queryset.query.where:
+            condition &= Q(object_id__in=queryset.values("pk"))
+        permitted |= condition
+    if not permitted or not query:
+        return SearchIndexEntry.objects.none()
+
+    return SearchIndexEntry.objects.filter(permitted, text__contains=query.lower())
+
+
+def get_search_rank(query, name_field="name"):
+    """
+    Return an expression ranking a search result by how well the query matches its name: exactly (3), as a prefix
+    (2), anywhere else (1), or not at all, i.e. it matches another of its fields (0).
+    """
+    query = query.strip()
+    return Case(
+        When(**{f"{name_field}__iexact": query}, then=Value(3)),
+        When(**{f"{name_field}__istartswith": query}, then=Value(2)),
+        When(**{f"{name_field}__icontains": query}, then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def search(query, user, models=None):
+    """
+    Search the index as `filter_search_index()` does, ranking the results by `get_search_rank()` and then by name.
+
+    Returns:
+        QuerySet: SearchIndexEntries annotated with their `rank`, best matches first
+    """
+    return (
+        filter_search_index(query, user, models=models).annotate(rank=get_search_rank(query)).order_by("-rank", "name")
+    )
@@ -1,24 +1,25 @@
 import os
-import random
 import shutil
 import uuid
 import logging
-from datetime import timedelta
 
 from cacheops.signals import cache_invalidated, cache_read
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import m2m_changed, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from django.utils import timezone
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 from prometheus_client import Counter
 
-from nautobot.extras.tasks import delete_custom_field_data, provision_field
-from nautobot.utilities.config import get_settings_or_config
+from nautobot.extras.tasks import delete_custom_field_data, enqueue_custom_field_task, provision_field
 from .choices import JobResultStatusChoices, ObjectChangeActionChoices
-from .models import CustomField, GitRepository, JobResult, ObjectChange
-from .webhooks import enqueue_webhooks
+from .computed_fields import computed_field_cache
+from .config_contexts import config_context_cache, SCOPE_FIELDS
+from .custom_fields import custom_field_cache
+from .job_repositories import job_repository_cache
+from .models import ComputedField, ConfigContext, CustomField, CustomFieldChoice, GitRepository, JobResult, Webhook
+from .search import get_indexed_models, remove_from_search_index, update_search_index
+from .webhooks import webhook_cache
 
 logger = logging.getLogger("nautobot.extras.signals")
 
@@ -41,9 +42,12 @@ def _get_user_if_authenticated(request, objectchange):
         logger.warning(f"Unable to retrieve the user while creating the changelog for {objectchange.changed_object}")
 
 
-def _handle_changed_object(request, sender, instance, **kwargs):
+def _handle_changed_object(request, sender, instance, objectchange_buffer, webhook_queue, **kwargs):
     """
     Fires when an object is created or updated.
+
+    ObjectChange records are added to `objectchange_buffer` (an `ObjectChangeBuffer`) for writing in bulk, and
+    webhook events to `webhook_queue` (a `WebhookQueue`) for batched processing.
     """
     m2m_changed = False
 
@@ -62,19 +66,15 @@ def _handle_changed_object(request, sender, instance, **kwargs):
     # Record an ObjectChange if applicable
     if hasattr(instance, "to_objectchange"):
         if m2m_changed:
-            ObjectChange.objects.filter(
-                changed_object_type=ContentType.objects.get_for_model(instance),
-                changed_object_id=instance.pk,
-                request_id=request.id,
-            ).update(object_data=instance.to_objectchange(action).object_data)
+            objectchange_buffer.update_object_data(instance, instance.to_objectchange(action).object_data)
         else:
             objectchange = instance.to_objectchange(action)
             objectchange.user = _get_user_if_authenticated(request, objectchange)
             objectchange.request_id = request.id
-            objectchange.save()
+            objectchange_buffer.add(objectchange)
 
     # Enqueue webhooks
-    enqueue_webhooks(instance, request.user, request.id, action)
+    webhook_queue.add(instance, request.user, action)
 
     # Increment metric counters
     if action == ObjectChangeActionChoices.ACTION_CREATE:
@@ -82,14 +82,8 @@ def _handle_changed_object(request, sender, instance, **kwargs):
     elif action == ObjectChangeActionChoices.ACTION_UPDATE:
         model_updates.labels(instance._meta.model_name).inc()
 
-    # Housekeeping: 0.1% chance of clearing out expired ObjectChanges
-    changelog_retention = get_settings_or_config("CHANGELOG_RETENTION")
-    if changelog_retention and random.randint(1, 1000) == 1:
-        cutoff = timezone.now() - timedelta(days=changelog_retention)
-        ObjectChange.objects.filter(time__lt=cutoff).delete()
-
 
-def _handle_deleted_object(request, sender, instance, **kwargs):
+def _handle_deleted_object(request, sender, instance, objectchange_buffer, webhook_queue, **kwargs):
     """
     Fires when an object is deleted.
     """
@@ -98,10 +92,10 @@ def _handle_deleted_object(request, sender, instance, **kwargs):
         objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
         objectchange.user = _get_user_if_authenticated(request, objectchange)
         objectchange.request_id = request.id
-        objectchange.save()
+        objectchange_buffer.add(objectchange)
 
     # Enqueue webhooks
-    enqueue_webhooks(instance, request.user, request.id, ObjectChangeActionChoices.ACTION_DELETE)
+    webhook_queue.add(instance, request.user, ObjectChangeActionChoices.ACTION_DELETE)
 
     # Increment metric counters
     model_deletes.labels(instance._meta.model_name).inc()
@@ -118,15 +112,65 @@ def handle_cf_removed_obj_types(instance, action, pk_set, **kwargs):
     """
     if action == "post_remove":
         # Existing content types have been removed from the custom field, delete their data
-        transaction.on_commit(lambda: delete_custom_field_data.delay(instance.name, pk_set))
+        transaction.on_commit(
+            lambda: enqueue_custom_field_task(
+                delete_custom_field_data, instance.name, field_name=instance.name, content_type_pk_set=list(pk_set)
+            )
+        )
 
     elif action == "post_add":
         # New content types have been added to the custom field, provision them
-        transaction.on_commit(lambda: provision_field.delay(instance.pk, pk_set))
+        transaction.on_commit(
+            lambda: enqueue_custom_field_task(
+                provision_field, instance.name, field_id=instance.pk, content_type_pk_set=list(pk_set)
+            )
+        )
 
 
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.content_types.through)
 
+post_save.connect(custom_field_cache.invalidate, sender=CustomField)
+post_delete.connect(custom_field_cache.invalidate, sender=CustomField)
+m2m_changed.connect(custom_field_cache.invalidate, sender=CustomField.content_types.through)
+post_save.connect(custom_field_cache.invalidate, sender=CustomFieldChoice)
+post_delete.connect(custom_field_cache.invalidate, sender=CustomFieldChoice)
+
+
+#
+# Computed fields
+#
+
+
+post_save.connect(computed_field_cache.invalidate, sender=ComputedField)
+post_delete.connect(computed_field_cache.invalidate, sender=ComputedField)
+
+
+#
+# Config contexts
+#
+
+
+post_save.connect(config_context_cache.invalidate, sender=ConfigContext)
+post_delete.connect(config_context_cache.invalidate, sender=ConfigContext)
+for field_name in SCOPE_FIELDS:
+    m2m_changed.connect(config_context_cache.invalidate, sender=getattr(ConfigContext, field_name).through)
+
+# The ConfigContextIndex also records the hierarchy of regions, and the sites, clusters and tenant groups to which
+# objects belong
+for field_name in ("regions", "sites", "clusters", "tenants"):
+    post_save.connect(config_context_cache.invalidate, sender=ConfigContext._meta.get_field(field_name).related_model)
+    post_delete.connect(config_context_cache.invalidate, sender=ConfigContext._meta.get_field(field_name).related_model)
+
+
+#
+# Webhooks
+#
+
+
+post_save.connect(webhook_cache.invalidate, sender=Webhook)
+post_delete.connect(webhook_cache.invalidate, sender=Webhook)
+m2m_changed.connect(webhook_cache.invalidate, sender=Webhook.content_types.through)
+
 
 #
 # Caching
@@ -152,11 +196,55 @@ cache_read.connect(cache_read_collector)
 cache_invalidated.connect(cache_invalidated_collector)
 
 
+#
+# Search index
+#
+
+
+def search_index_post_save(sender, instance, raw=False, **kwargs):
+    """
+    Update the search index entry of each searchable object when it is saved.
+    """
+    if not raw:
+        update_search_index(instance)
+
+
+def search_index_post_delete(sender, instance, **kwargs):
+    """
+    Remove the search index entry of each searchable object when it is deleted.
+    """
+    remove_from_search_index(instance)
+
+
+# Connected for each searchable model only, so that deletions of other models can still be fast-deleted
+for model in get_indexed_models():
+    post_save.connect(search_index_post_save, sender=model)
+    post_delete.connect(search_index_post_delete, sender=model)
+
+
+#
+# Job results
+#
+
+
+@receiver(pre_delete, sender=JobResult)
+def job_result_pre_delete(instance, **kwargs):
+    """
+    When a JobResult is deleted, delete any files it produced, including their contents (see `FileProxy.delete()`).
+    """
+    for file_proxy in instance.files.all():
+        file_proxy.delete()
+
+
 #
 # Datasources
 #
 
 
+post_save.connect(job_repository_cache.invalidate, sender=GitRepository)
+post_delete.connect(job_repository_cache.invalidate, sender=GitRepository)
+
+
 @receiver(pre_delete, sender=GitRepository)
 def git_repository_pre_delete(instance, **kwargs):
     """
@@ -1,21 +1,146 @@
+import csv
+import io
+import tempfile
+import time
+from datetime import timedelta
 from logging import getLogger
 
 import requests
+from cacheops import invalidate_model
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
-from jinja2.exceptions import TemplateError
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import QueryDict
+from django.test.client import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
 
 from nautobot.core.celery import nautobot_task
-from nautobot.extras.choices import CustomFieldTypeChoices, ObjectChangeActionChoices
-from nautobot.extras.utils import generate_signature
+from nautobot.extras.choices import (
+    CustomFieldTypeChoices,
+    JobResultStatusChoices,
+    LogLevelChoices,
+    ObjectChangeActionChoices,
+)
+from nautobot.extras.search import get_indexed_models, rebuild_search_index
+from nautobot.utilities.config import get_settings_or_config
+from nautobot.utilities.forms.utils import (
+    cache_related_object_lookups,
+    iter_csv_records,
+    parse_csv_headers,
+    restrict_form_fields,
+    validate_csv,
+)
+from nautobot.utilities.permissions import get_permission_for_model
+from nautobot.utilities.query_functions import JSONRemoveKey, JSONReplaceArrayElement, JSONSetKey
+from nautobot.extras.webhook_delivery import deliver_webhook, deliver_webhooks
 
 
 logger = getLogger("nautobot.extras.tasks")
 
 
+def enqueue_custom_field_task(task, field_name, **kwargs):
+    """
+    Enqueue one of the custom field data tasks below, creating a JobResult (related to the CustomField by name) to which
+    the task reports its progress.
+    """
+    from nautobot.extras.models import CustomField, JobResult  # avoiding circular import
+
+    return JobResult.enqueue_job(task, field_name, ContentType.objects.get_for_model(CustomField), None, **kwargs)
+
+
+def _get_job_result(job_result_pk):
+    from nautobot.extras.models import JobResult  # avoiding circular import
+
+    if job_result_pk is None:
+        return None
+    job_result = JobResult.objects.get(pk=job_result_pk)
+    job_result.set_status(JobResultStatusChoices.STATUS_RUNNING)
+    job_result.save()
+    return job_result
+
+
+def _fail_job_result(job_result, message):
+    logger.error(message)
+    if job_result is not None:
+        job_result.log(message, level_choice=LogLevelChoices.LOG_FAILURE)
+        job_result.set_status(JobResultStatusChoices.STATUS_FAILED)
+        job_result.save()
+    return False
+
+
+def _update_custom_field_data(content_types, condition, expression, job_result=None):
+    """
+    Update the `_custom_field_data` of all objects of the given content types which match `condition`.
+
+    Rather than saving each object, the objects are updated in place by the database, by one `UPDATE` query per batch
+    of up to CUSTOM_FIELD_DATA_BATCH_SIZE objects. Each batch is committed separately, so that no rows are locked for
+    long; the `expression` must therefore ensure that updated objects no longer match the `condition`. As `save()` is
+    bypassed, no signals are sent and no changes are logged for the updated objects.
+
+    Args:
+        content_types (QuerySet): ContentTypes of the models to update
+        condition (Q): Filter matching the objects to be updated
+        expression (Expression): New value of `_custom_field_data`, e.g. `JSONSetKey("_custom_field_data", ...)`
+        job_result (JobResult): Optional JobResult to which progress is reported
+
+    Returns:
+        int: The number of objects updated
+    """
+    batch_size = settings.CUSTOM_FIELD_DATA_BATCH_SIZE
+    total_updated = 0
+
+    try:
+        for ct in content_types:
+            model = ct.model_class()
+            if model is None:
+                continue
+            # The results of each query differ after each update, which cacheops isn't aware of
+            queryset = model.objects.filter(condition).nocache()
+            total = queryset.count() if job_result is not None else None
+            updated = 0
+            try:
+                while True:
+                    pks = list(queryset.values_list("pk", flat=True)[:batch_size])
+                    if not pks:
+                        break
+                    updated += model.objects.filter(pk__in=pks).update(_custom_field_data=expression)
+                    if model in get_indexed_models():
+                        rebuild_search_index(model, pks=pks)
+                    if job_result is not None:
+                        job_result.data = {"output": f"Updated {updated} of {total} {model._meta.verbose_name_plural}"}
+                        job_result.save()
+                    if len(pks) < batch_size:
+                        break
+            finally:
+                # Bulk updates aren't seen by cacheops
+                invalidate_model(model)
+
+            total_updated += updated
+            if job_result is not None:
+                job_result.log(
+                    f"Updated {updated} {model._meta.verbose_name_plural}", level_choice=LogLevelChoices.LOG_INFO
+                )
+
+    except Exception as exc:
+        if job_result is not None:
+            job_result.log(f"Error while updating custom field data: {exc}", level_choice=LogLevelChoices.LOG_FAILURE)
+            job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+            job_result.save()
+        raise
+
+    if job_result is not None:
+        job_result.set_status(JobResultStatusChoices.STATUS_COMPLETED)
+        job_result.save()
+    return total_updated
+
+
 @nautobot_task
-def update_custom_field_choice_data(field_id, old_value, new_value):
+def update_custom_field_choice_data(field_id, old_value, new_value, job_result_pk=None):
     """
     Update the values for a custom field choice used in objects' _custom_field_data for the given field.
 
@@ -23,90 +148,400 @@ def update_custom_field_choice_data(field_id, old_value, new_value):
         field_id (uuid4): The PK of the custom field to which this choice value relates
         old_value (str): The existing value of the choice
         new_value (str): The value which will be used as replacement
+        job_result_pk (uuid4): The PK of the JobResult to which progress is reported, if any
     """
     from nautobot.extras.models import CustomField
 
+    job_result = _get_job_result(job_result_pk)
+
     try:
         field = CustomField.objects.get(pk=field_id)
     except CustomField.DoesNotExist:
-        logger.error(f"Custom field with ID {field_id} not found, failing to act on choice data.")
-        return False
+        return _fail_job_result(
+            job_result, f"Custom field with ID {field_id} not found, failing to act on choice data."
+        )
 
     if field.type == CustomFieldTypeChoices.TYPE_SELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            for obj in model.objects.filter(**{f"_custom_field_data__{field.name}": old_value}):
-                obj._custom_field_data[field.name] = new_value
-                obj.save()
+        condition = Q(**{f"_custom_field_data__{field.name}": old_value})
+        expression = JSONSetKey("_custom_field_data", field.name, new_value)
 
     elif field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            for obj in model.objects.filter(**{f"_custom_field_data__{field.name}__contains": old_value}):
-                old_list = obj._custom_field_data[field.name]
-                new_list = [new_value if e == old_value else e for e in old_list]
-                obj._custom_field_data[field.name] = new_list
-                obj.save()
+        condition = Q(**{f"_custom_field_data__{field.name}__contains": old_value})
+        expression = JSONReplaceArrayElement("_custom_field_data", field.name, old_value, new_value)
 
     else:
-        logger.error(f"Unknown field type, failing to act on choice data for this field {field.name}.")
-        return False
+        return _fail_job_result(
+            job_result, f"Unknown field type, failing to act on choice data for this field {field.name}."
+        )
+
+    return _update_custom_field_data(field.content_types.all(), condition, expression, job_result=job_result)
 
 
 @nautobot_task
-def delete_custom_field_data(field_name, content_type_pk_set):
+def delete_custom_field_data(field_name, content_type_pk_set, job_result_pk=None):
     """
     Delete the values for a custom field
 
     Args:
         field_name (str): The name of the custom field which is being deleted
         content_type_pk_set (list): List of PKs for content types to act upon
+        job_result_pk (uuid4): The PK of the JobResult to which progress is reported, if any
     """
-    with transaction.atomic():
-        for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
-            model = ct.model_class()
-            for obj in model.objects.filter(**{f"_custom_field_data__{field_name}__isnull": False}):
-                del obj._custom_field_data[field_name]
-                obj.save()
+    return _update_custom_field_data(
+        ContentType.objects.filter(pk__in=content_type_pk_set),
+        Q(_custom_field_data__has_key=field_name),
+        JSONRemoveKey("_custom_field_data", field_name),
+        job_result=_get_job_result(job_result_pk),
+    )
 
 
 @nautobot_task
-def provision_field(field_id, content_type_pk_set):
+def provision_field(field_id, content_type_pk_set, job_result_pk=None):
     """
     Provision a new custom field on all relevant content type object instances.
 
     Args:
         field_id (uuid4): The PK of the custom field being provisioned
         content_type_pk_set (list): List of PKs for content types to act upon
+        job_result_pk (uuid4): The PK of the JobResult to which progress is reported, if any
     """
     from nautobot.extras.models import CustomField
 
+    job_result = _get_job_result(job_result_pk)
+
     try:
         field = CustomField.objects.get(pk=field_id)
     except CustomField.DoesNotExist:
-        logger.error(f"Custom field with ID {field_id} not found, failing to provision.")
-        return False
+        return _fail_job_result(job_result, f"Custom field with ID {field_id} not found, failing to provision.")
+
+    return _update_custom_field_data(
+        ContentType.objects.filter(pk__in=content_type_pk_set),
+        ~Q(_custom_field_data__has_key=field.name),
+        JSONSetKey("_custom_field_data", field.name, field.default),
+        job_result=job_result,
+    )
 
-    with transaction.atomic():
-        for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
-            model = ct.model_class()
-            for obj in model.objects.all():
-                obj._custom_field_data.setdefault(field.name, field.default)
-                obj.save()
+
+def get_export_file_details(model, export_template=None):
+    """
+    Return the file name and MIME type of an export of the given model, using the given ExportTemplate if any, or else
+    its built-in YAML or CSV export.
+    """
+    if export_template is not None:
+        extension = export_template.file_extension
+        mime_type = export_template.mime_type or "text/plain"
+    else:
+        extension = "yaml" if hasattr(model, "to_yaml") else "csv"
+        mime_type = f"text/{extension}"
+    filename = "nautobot_{}{}".format(model._meta.verbose_name_plural, f".{extension}" if extension else "")
+    return filename, mime_type
+
+
+def enqueue_export_task(model, view_name, query_string, user, export_template=None):
+    """
+    Enqueue the export_objects task below, creating a JobResult (related to the exported model, and named after the
+    exported file) to which the task attaches the exported file.
+
+    Args:
+        model (Model): The model whose objects are to be exported
+        view_name (str): The URL name of the list view (an `ObjectListView`) by which the objects are retrieved
+        query_string (str): The filter parameters of the export, as URL-encoded by `QueryDict.urlencode()`
+        user (User): The user requesting the export, whose permissions determine which objects are exported
+        export_template (ExportTemplate): The ExportTemplate to render, if any
+    """
+    from nautobot.extras.models import JobResult  # avoiding circular import
+
+    content_type = ContentType.objects.get_for_model(model)
+    filename, _ = get_export_file_details(model, export_template)
+    return JobResult.enqueue_job(
+        export_objects,
+        filename,
+        content_type,
+        user,
+        content_type_pk=content_type.pk,
+        view_name=view_name,
+        query_string=query_string,
+        export_template_pk=export_template.pk if export_template is not None else None,
+    )
 
 
 @nautobot_task
-def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id):
+def export_objects(content_type_pk, view_name, query_string, export_template_pk=None, job_result_pk=None):
     """
-    Make a POST request to the defined Webhook
+    Export the objects of the given content type to a FileProxy attached to the JobResult.
+
+    The objects are retrieved and exported exactly as by the given list view (an `ObjectListView`) for the user who
+    requested the export, and the export is written to a temporary file as it is generated rather than held in memory.
+
+    Args:
+        content_type_pk (int): The PK of the content type of the objects to export
+        view_name (str): The URL name of the list view by which the objects are retrieved
+        query_string (str): The filter parameters of the export, as URL-encoded by `QueryDict.urlencode()`
+        export_template_pk (uuid4): The PK of the ExportTemplate to render, if any
+        job_result_pk (uuid4): The PK of the JobResult to which the exported file is attached
     """
-    from nautobot.extras.models import Webhook  # avoiding circular import
+    from nautobot.extras.models import ExportTemplate, FileProxy  # avoiding circular import
+
+    job_result = _get_job_result(job_result_pk)
+    model = ContentType.objects.get_for_id(content_type_pk).model_class()
+    user = job_result.user
+
+    if user is None or not user.has_perm(get_permission_for_model(model, "view")):
+        return _fail_job_result(
+            job_result, f"User {user} does not have permission to view {model._meta.verbose_name_plural}."
+        )
+
+    try:
+        export_template = None
+        if export_template_pk is not None:
+            export_template = ExportTemplate.objects.get(pk=export_template_pk)
+        filename, mime_type = get_export_file_details(model, export_template)
+
+        # Retrieve the objects as the list view would do
+        view = resolve(reverse(view_name)).func.view_class()
+        view.queryset = view.queryset.restrict(user, "view")
+        if view.filterset is not None:
+            view.queryset = view.filterset(QueryDict(query_string), view.queryset).qs
+
+        if export_template is not None:
+            chunks = export_template.iter_render(view.queryset)
+        else:
+            chunks = view.iter_export("yaml" if hasattr(model, "to_yaml") else "csv")
+
+        with tempfile.TemporaryFile() as export_file:
+            for chunk in chunks:
+                export_file.write(chunk.encode("utf-8"))
+            size = export_file.tell()
+            export_file.seek(0)
+            FileProxy.objects.create(
+                name=filename,
+                job_result=job_result,
+                file=InMemoryUploadedFile(export_file, None, filename, mime_type, size, "utf-8"),
+            )
+
+    except Exception as exc:
+        job_result.log(
+            f"Error while exporting {model._meta.verbose_name_plural}: {exc}", level_choice=LogLevelChoices.LOG_FAILURE
+        )
+        job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+        job_result.save()
+        raise
+
+    job_result.log(f"Exported {filename} ({size} bytes)", level_choice=LogLevelChoices.LOG_SUCCESS)
+    job_result.set_status(JobResultStatusChoices.STATUS_COMPLETED)
+    job_result.save()
+    return True
 
-    webhook = Webhook.objects.get(pk=webhook_pk)
 
-    context = {
+def enqueue_import_task(model, view_name, csv_file, user, sniff_dialect=False):
+    """
+    Enqueue the import_objects task below, creating a JobResult (related to the imported model, and named after the
+    CSV file) to which the task reports its progress. The CSV data is stored in a FileProxy attached to the JobResult,
+    from which the task reads it.
+
+    Args:
+        model (Model): The model whose objects are to be imported
+        view_name (str): The URL name of the import view (a `BulkImportView`) whose form validates each row
+        csv_file (File): The CSV data to import
+        user (User): The user requesting the import, whose permissions determine which objects may be imported
+        sniff_dialect (bool): Whether to detect the CSV dialect from the data (as for uploaded files)
+    """
+    from nautobot.extras.models import FileProxy, JobResult  # avoiding circular import
+
+    file_proxy = FileProxy.objects.create(name=csv_file.name, file=csv_file)
+    job_result = JobResult.enqueue_job(
+        import_objects,
+        csv_file.name,
+        ContentType.objects.get_for_model(model),
+        user,
+        view_name=view_name,
+        file_proxy_pk=file_proxy.pk,
+        sniff_dialect=sniff_dialect,
+    )
+    file_proxy.job_result = job_result
+    file_proxy.save()
+    return job_result
+
+
+def _iter_chunks(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+@nautobot_task
+def import_objects(view_name, file_proxy_pk, sniff_dialect=False, chunk_size=500, job_result_pk=None):
+    """
+    Import objects from CSV data stored in a FileProxy, validating each row with the form of the given import view
+    (a `BulkImportView`) and saving it as that view would do, on behalf of the user who requested the import.
+
+    The data is read as it is imported, in chunks of `chunk_size` rows. Each chunk is saved in its own
+    transaction, so that no transaction holds locks for the whole import. Rows which fail validation are reported to
+    the JobResult and skipped; if any object of a chunk violates the user's object-level permissions, the whole chunk
+    is rolled back. Related objects referenced by the rows (such as sites, device types and statuses) are only looked
+    up once per distinct value. The FileProxy is deleted once the import is finished.
+
+    Args:
+        view_name (str): The URL name of the import view by which the objects are imported
+        file_proxy_pk (uuid4): The PK of the FileProxy containing the CSV data
+        sniff_dialect (bool): Whether to detect the CSV dialect from the data (as for uploaded files)
+        chunk_size (int): The number of rows to save in each transaction
+        job_result_pk (uuid4): The PK of the JobResult to which progress is reported
+    """
+    from nautobot.extras.context_managers import web_request_context  # avoiding circular import
+    from nautobot.extras.models import FileProxy  # avoiding circular import
+
+    job_result = _get_job_result(job_result_pk)
+    user = job_result.user
+    view = resolve(reverse(view_name)).func.view_class()
+    model = view.queryset.model
+    file_proxy = FileProxy.objects.get(pk=file_proxy_pk)
+
+    if user is None or not user.has_perm(get_permission_for_model(model, "add")):
+        file_proxy.delete()
+        return _fail_job_result(
+            job_result, f"User {user} does not have permission to add {model._meta.verbose_name_plural}."
+        )
+
+    queryset = view.queryset.restrict(user, "add")
+    # As for the change logging of jobs, saving the objects is attributed to an emulated request by the user
+    request = RequestFactory().request(SERVER_NAME="import_objects")
+    imported = failed = 0
+    start_time = time.monotonic()
+
+    try:
+        with file_proxy.file.open("rb") as raw_file, io.TextIOWrapper(
+            raw_file, encoding="utf-8-sig", newline=""
+        ) as csv_file:
+            dialect = "excel"
+            if sniff_dialect:
+                dialect = csv.Sniffer().sniff(csv_file.read(64 * 1024))
+                csv_file.seek(0)
+            reader = csv.reader(csv_file, dialect)
+            headers = parse_csv_headers(reader)
+            fields = view.model_form().fields
+            validate_csv(headers, fields, [name for name, field in fields.items() if field.required])
+
+            lookups = {}
+            rows = enumerate(iter_csv_records(reader, headers), start=1)
+            with web_request_context(user, request=request):
+                for chunk in _iter_chunks(rows, chunk_size):
+                    chunk_objs = {}
+                    # Logged once the chunk's transaction is finished, so that they're kept even if it's rolled back
+                    errors = []
+                    lookup_count = len(lookups)
+                    with transaction.atomic():
+                        for row, data in chunk:
+                            obj_form = view.model_form(data, headers=headers)
+                            restrict_form_fields(obj_form, user)
+                            cache_related_object_lookups(obj_form, lookups)
+                            if not obj_form.is_valid():
+                                errors.extend(f"Row {row} {field}: {err[0]}" for field, err in obj_form.errors.items())
+                                failed += 1
+                                continue
+                            try:
+                                with transaction.atomic():
+                                    obj = view._save_obj(obj_form, request)
+                            except (IntegrityError, ValidationError) as exc:
+                                errors.append(f"Row {row}: {exc}")
+                                failed += 1
+                                continue
+                            chunk_objs[obj.pk] = row
+
+                        # Enforce object-level permissions
+                        permitted_pks = set(queryset.filter(pk__in=chunk_objs).values_list("pk", flat=True))
+                        if len(permitted_pks) != len(chunk_objs):
+                            denied_rows = [str(row) for pk, row in chunk_objs.items() if pk not in permitted_pks]
+                            errors.append(
+                                f"Rows {chunk[0][0]}-{chunk[-1][0]} were not imported due to an object-level "
+                                f"permissions violation by rows {', '.join(denied_rows)}"
+                            )
+                            failed += len(chunk_objs)
+                            chunk_objs = {}
+                            transaction.set_rollback(True)
+                            # Rows of later chunks mustn't be matched to objects created by this one
+                            for key in list(lookups)[lookup_count:]:
+                                del lookups[key]
+
+                    for error in errors:
+                        job_result.log(error, level_choice=LogLevelChoices.LOG_FAILURE)
+                    imported += len(chunk_objs)
+                    job_result.log(
+                        f"Imported {imported} {model._meta.verbose_name_plural} ({failed} rows failed)",
+                        level_choice=LogLevelChoices.LOG_INFO,
+                    )
+                    job_result.save()
+
+    except Exception as exc:
+        job_result.log(
+            f"Error while importing {model._meta.verbose_name_plural}: {exc}", level_choice=LogLevelChoices.LOG_FAILURE
+        )
+        job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+        job_result.save()
+        raise
+
+    finally:
+        file_proxy.delete()
+
+    duration = time.monotonic() - start_time
+    job_result.log(
+        f"Imported {imported} {model._meta.verbose_name_plural} in {duration:.1f} seconds "
+        f"({(imported + failed) / duration if duration else 0:.0f} rows per second); {failed} rows failed",
+        level_choice=LogLevelChoices.LOG_SUCCESS if not failed else LogLevelChoices.LOG_WARNING,
+    )
+    job_result.set_status(JobResultStatusChoices.STATUS_FAILED if failed else JobResultStatusChoices.STATUS_COMPLETED)
+    job_result.save()
+    return imported
+
+
+@nautobot_task
+def prune_changelog(batch_size=None):
+    """
+    Delete ObjectChange records older than the configured CHANGELOG_RETENTION.
+
+    Records are deleted oldest first in batches of `batch_size` (default: CHANGELOG_PRUNE_BATCH_SIZE), pausing for
+    CHANGELOG_PRUNE_BATCH_DELAY seconds between batches, so that no single statement holds locks for long. If the task
+    reaches its time limit, the remaining records are left for the next run.
+
+    Returns:
+        int: The number of records deleted
+    """
+    from nautobot.extras.models import ObjectChange  # avoiding circular import
+
+    changelog_retention = get_settings_or_config("CHANGELOG_RETENTION")
+    if not changelog_retention:
+        return 0
+
+    batch_size = batch_size or settings.CHANGELOG_PRUNE_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(days=changelog_retention)
+    expired = ObjectChange.objects.filter(time__lt=cutoff).order_by("time")
+    deleted = 0
+
+    try:
+        while True:
+            pks = list(expired.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            ObjectChange.objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+            if len(pks) < batch_size:
+                break
+            if settings.CHANGELOG_PRUNE_BATCH_DELAY:
+                time.sleep(settings.CHANGELOG_PRUNE_BATCH_DELAY)
+    except SoftTimeLimitExceeded:
+        logger.warning("Time limit reached while pruning the changelog; the remainder will be pruned on the next run")
+
+    logger.info("Deleted %d changelog records older than %s", deleted, cutoff)
+    return deleted
+
+
+def _get_webhook_context(event, timestamp, model_name, username, request_id, data):
+    return {
         "event": dict(ObjectChangeActionChoices)[event].lower(),
         "timestamp": timestamp,
         "model": model_name,
@@ -115,56 +550,48 @@ def process_webhook(webhook_pk, data, model_name, event, timestamp, username, re
         "data": data,
     }
 
-    # Build the headers for the HTTP request
-    headers = {
-        "Content-Type": webhook.http_content_type,
-    }
-    try:
-        headers.update(webhook.render_headers(context))
-    except (TemplateError, ValueError) as e:
-        logger.error("Error parsing HTTP headers for webhook %s: %s", webhook, e)
-        raise
 
-    # Render the request body
-    try:
-        body = webhook.render_body(context)
-    except TemplateError as e:
-        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
-        raise
+@nautobot_task
+def process_webhook(webhook_pk, data, model_name, event, timestamp, username, request_id):
+    """
+    Make a POST request to the defined Webhook
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
+
+    webhook = Webhook.objects.get(pk=webhook_pk)
+    context = _get_webhook_context(event, timestamp, model_name, username, request_id, data)
+
+    return deliver_webhook(webhook, context)
+
+
+@nautobot_task
+def process_webhooks(webhook_pk, events):
+    """
+    Send a batch of events to the defined Webhook.
+
+    Each entry in `events` is a list of `[data, model_name, event, timestamp, username, request_id]`. If the Webhook
+    has `batch_payload` enabled, all events are sent in a single request; otherwise one request is sent per event,
+    concurrently and over pooled connections (see `nautobot.extras.webhook_delivery`).
+    """
+    from nautobot.extras.models import Webhook  # avoiding circular import
 
-    # Prepare the HTTP request
-    params = {
-        "method": webhook.http_method,
-        "url": webhook.payload_url,
-        "headers": headers,
-        "data": body.encode("utf8"),
-    }
-    logger.info("Sending %s request to %s (%s %s)", params["method"], params["url"], context["model"], context["event"])
-    logger.debug("%s", params)
     try:
-        prepared_request = requests.Request(**params).prepare()
-    except requests.exceptions.RequestException as e:
-        logger.error("Error forming HTTP request: %s", e)
-        raise
+        webhook = Webhook.objects.get(pk=webhook_pk)
+    except Webhook.DoesNotExist:
+        logger.error("Webhook with ID %s not found, discarding %d events.", webhook_pk, len(events))
+        return False
 
-    # If a secret key is defined, sign the request with a hash of the key and its content
-    if webhook.secret != "":
-        prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
+    contexts = [
+        _get_webhook_context(event, timestamp, model_name, username, request_id, data)
+        for data, model_name, event, timestamp, username, request_id in events
+    ]
 
-    # Send the request
-    with requests.Session() as session:
-        session.verify = webhook.ssl_verification
-        if webhook.ca_file_path:
-            session.verify = webhook.ca_file_path
-        response = session.send(prepared_request, proxies=settings.HTTP_PROXIES)
+    if webhook.batch_payload:
+        return deliver_webhook(webhook, {"events": contexts})
 
-    if response.ok:
-        logger.info("Request succeeded; response status %s", response.status_code)
-        return "Status {} returned, webhook successfully processed.".format(response.status_code)
-    else:
-        logger.warning("Request failed; response status %s: %s", response.status_code, response.content)
+    results, failures = deliver_webhooks(webhook, contexts)
+    if failures:
         raise requests.exceptions.RequestException(
-            "Status {} returned with content '{}', webhook FAILED to process.".format(
-                response.status_code, response.content
-            )
+            "{} of {} requests FAILED to process for webhook {}.".format(failures, len(contexts), webhook)
         )
+    return results
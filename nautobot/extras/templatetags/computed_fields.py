@@ -1,9 +1,8 @@
 from django import template
-from django.contrib.contenttypes.models import ContentType
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
 
-from nautobot.extras.models import ComputedField
+from nautobot.extras.computed_fields import get_computed_fields_for_model
 
 
 register = template.Library()
@@ -14,8 +13,7 @@ def has_computed_fields(context, obj):
     """
     Return a boolean value indicating if an object's content type has associated computed fields.
     """
-    content_type = ContentType.objects.get_for_model(obj)
-    return ComputedField.objects.filter(content_type=content_type).exists()
+    return bool(get_computed_fields_for_model(obj))
 
 
 @register.simple_tag(takes_context=True)
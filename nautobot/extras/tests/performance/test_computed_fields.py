@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.template import engines
+
+from nautobot.dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
+from nautobot.extras.models import ComputedField, Status
+from nautobot.utilities.testing.performance import PerformanceTestCase
+
+
+def render_jinja2_uncached(template_code, context):
+    """The previous implementation of `render_jinja2()`, which compiled the template on every call."""
+    return engines["jinja"].from_string(template_code).render(context=context)
+
+
+class ComputedFieldPerformanceTestCase(PerformanceTestCase):
+    """Compare rendering the computed fields of a page of devices with and without the compiled template cache."""
+
+    @classmethod
+    def setUpTestData(cls):
+        site = Site.objects.create(name="Site 1", slug="site-1")
+        manufacturer = Manufacturer.objects.create(name="Manufacturer 1", slug="manufacturer-1")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Device Type 1")
+        device_role = DeviceRole.objects.create(name="Device Role 1", slug="device-role-1")
+        status = Status.objects.get_for_model(Device).get(slug="active")
+        Device.objects.bulk_create(
+            [
+                Device(name=f"Device {i}", site=site, device_type=device_type, device_role=device_role, status=status)
+                for i in range(1000)
+            ]
+        )
+
+        content_type = ContentType.objects.get_for_model(Device)
+        for label, template in (
+            ("Hostname", "{{ obj.name | lower | replace(' ', '-') }}.{{ obj.site.slug }}.example.com"),
+            ("Summary", "{{ obj.device_type.manufacturer }} {{ obj.device_type.model }} ({{ obj.device_role }})"),
+            ("Label", "{% if obj.name %}{{ obj.name | upper }}{% else %}{{ obj.pk }}{% endif %}"),
+        ):
+            ComputedField.objects.create(content_type=content_type, label=label, template=template)
+
+        cls.devices = list(Device.objects.select_related("site", "device_type__manufacturer", "device_role"))
+        cls.computed_fields = list(ComputedField.objects.get_for_model(Device))
+
+    def render_computed_fields(self):
+        return [
+            [computed_field.render(context={"obj": device}) for computed_field in self.computed_fields]
+            for device in self.devices
+        ]
+
+    def test_render_computed_fields(self):
+        def render_uncached():
+            with mock.patch("nautobot.extras.models.customfields.render_jinja2", render_jinja2_uncached):
+                return self.render_computed_fields()
+
+        self.assertFasterThan(
+            "Computed fields of 1000 devices",
+            render_uncached,
+            self.render_computed_fields,
+        )
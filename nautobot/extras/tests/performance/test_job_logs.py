@@ -0,0 +1,46 @@
+import time
+import uuid
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
+
+from nautobot.extras.models import JobResult
+from nautobot.utilities.testing.performance import PerformanceTestCase
+
+
+@mock.patch("nautobot.extras.models.models.JOB_LOGS", None)
+@override_settings(JOB_LOG_BUFFER_SIZE=100, JOB_LOG_FLUSH_INTERVAL=1)
+class JobLogPerformanceTestCase(PerformanceTestCase):
+    """Compare logging many entries to a JobResult with and without buffering them."""
+
+    entry_count = 5000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.job_result = JobResult.objects.create(
+            name="test",
+            obj_type=ContentType.objects.get(app_label="extras", model="job"),
+            job_id=uuid.uuid4(),
+        )
+
+    def log_entries(self):
+        for i in range(self.entry_count):
+            self.job_result.log(f"Device {i} is valid")
+        return self.entry_count
+
+    def log_entries_buffered(self):
+        with self.job_result.buffered_logs():
+            return self.log_entries()
+
+    def test_log_entries(self):
+        for label, func in (("unbuffered", self.log_entries), ("buffered", self.log_entries_buffered)):
+            start = time.perf_counter()
+            func()
+            print(f"\nJob log throughput ({label}): {self.entry_count / (time.perf_counter() - start):.0f} entries/s")
+
+        self.assertFasterThan(
+            f"Logging {self.entry_count} job log entries",
+            self.log_entries,
+            self.log_entries_buffered,
+        )
@@ -6,6 +6,7 @@ from unittest import mock, skipIf
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import Http404
 from django.test import override_settings
 from django.urls import reverse
@@ -31,6 +32,7 @@ from nautobot.extras.models import (
     CustomField,
     CustomLink,
     ExportTemplate,
+    FileProxy,
     GitRepository,
     GraphQLQuery,
     ImageAttachment,
@@ -1175,6 +1177,58 @@ class JobResultTest(APITestCase):
         response = self.client.delete(url, **self.header)
         self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
 
+    def _create_export_job_result(self, user):
+        job_result = JobResult.objects.create(
+            name="nautobot_sites.csv",
+            job_id=uuid.uuid4(),
+            obj_type=ContentType.objects.get_for_model(Site),
+            user=user,
+        )
+        FileProxy.objects.create(
+            name="nautobot_sites.csv",
+            file=SimpleUploadedFile(name="nautobot_sites.csv", content=b"name\nSite 1\n"),
+            job_result=job_result,
+        )
+        return job_result
+
+    def test_download(self):
+        self.add_permissions("extras.view_jobresult")
+        job_result = self._create_export_job_result(self.user)
+
+        url = reverse("extras-api:jobresult-download", kwargs={"pk": job_result.pk})
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="nautobot_sites.csv"')
+        self.assertEqual(b"".join(response.streaming_content), b"name\nSite 1\n")
+
+    def test_download_of_other_users_file(self):
+        self.add_permissions("extras.view_jobresult")
+        job_result = self._create_export_job_result(get_user_model().objects.create(username="otheruser"))
+
+        # The file reflects the permissions of the user who requested it, so others may not download it...
+        url = reverse("extras-api:jobresult-download", kwargs={"pk": job_result.pk})
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        # ...unless they are a superuser
+        self.user.is_superuser = True
+        self.user.save()
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+    def test_download_without_files(self):
+        self.add_permissions("extras.view_jobresult")
+        job_result = JobResult.objects.create(
+            name="test",
+            job_id=uuid.uuid4(),
+            obj_type=ContentType.objects.get_for_model(GitRepository),
+            user=self.user,
+        )
+
+        url = reverse("extras-api:jobresult-download", kwargs={"pk": job_result.pk})
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
+
 
 class JobLogEntryTest(
     APIViewTestCases.GetObjectViewTestCase,
@@ -1,12 +1,17 @@
+import uuid
+from datetime import timedelta
+
 from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
-from django.test import override_settings
+from django.test import override_settings, TestCase
+from django.utils import timezone
 from rest_framework import status
 
 from nautobot.core.graphql import execute_query
 from nautobot.dcim.models import Site
 from nautobot.extras.choices import CustomFieldTypeChoices, ObjectChangeActionChoices
 from nautobot.extras.models import CustomField, CustomFieldChoice, ObjectChange, Status, Tag
+from nautobot.extras.tasks import prune_changelog
 from nautobot.utilities.testing import APITestCase
 from nautobot.utilities.testing.utils import post_data
 from nautobot.utilities.testing.views import ModelViewTestCase
@@ -313,3 +318,30 @@ class ChangeLogAPITest(APITestCase):
         resp = execute_query(gql_payload, user=self.user).to_dict()
         self.assertFalse(resp["data"].get("error"))
         self.assertEqual(first=site_payload["name"], second=resp["data"]["query"][0].get("object_repr", ""))
+
+
+class ChangeLogPruneTest(TestCase):
+    """Tests for the `prune_changelog` housekeeping task."""
+
+    def setUp(self):
+        for i in range(5):
+            site = Site.objects.create(name=f"Test Site {i}", slug=f"test-site-{i}")
+            oc = site.to_objectchange(ObjectChangeActionChoices.ACTION_CREATE)
+            oc.request_id = uuid.uuid4()
+            oc.save()
+        # Age three of the five records beyond the retention period
+        old_pks = ObjectChange.objects.order_by("object_repr").values_list("pk", flat=True)[:3]
+        ObjectChange.objects.filter(pk__in=list(old_pks)).update(time=timezone.now() - timedelta(days=100))
+
+    @override_settings(CHANGELOG_RETENTION=90)
+    def test_prune_changelog(self):
+        self.assertEqual(prune_changelog(batch_size=2), 3)
+        self.assertEqual(
+            list(ObjectChange.objects.order_by("object_repr").values_list("object_repr", flat=True)),
+            ["Test Site 3", "Test Site 4"],
+        )
+
+    @override_settings(CHANGELOG_RETENTION=0)
+    def test_prune_changelog_retention_disabled(self):
+        self.assertEqual(prune_changelog(), 0)
+        self.assertEqual(ObjectChange.objects.count(), 5)
@@ -1,12 +1,13 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.test import TestCase
 
 from nautobot.core.celery import app
 from nautobot.dcim.models import Site
 from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.context_managers import web_request_context
-from nautobot.extras.models import ObjectChange, Webhook
+from nautobot.extras.models import ObjectChange, Tag, Webhook
 
 
 # Use the proper swappable User model
@@ -65,6 +66,74 @@ class WebRequestContextTestCase(TestCase):
         self.assertEqual(oc_list[0].changed_object, site)
         self.assertEqual(oc_list[0].action, ObjectChangeActionChoices.ACTION_CREATE)
 
+    def test_change_log_buffered(self):
+        """ObjectChanges are buffered within the context and written on exit."""
+        site_ct = ContentType.objects.get_for_model(Site)
+
+        with web_request_context(self.user):
+            for i in range(3):
+                Site.objects.create(name=f"Test Site {i}", slug=f"test-site-{i}")
+            self.assertFalse(ObjectChange.objects.filter(changed_object_type=site_ct).exists())
+
+        self.assertEqual(ObjectChange.objects.filter(changed_object_type=site_ct).count(), 3)
+        self.assertEqual(ObjectChange.objects.filter(user_name=self.user.username).count(), 3)
+
+    def test_change_log_m2m_merged(self):
+        """Many-to-many changes are merged into the buffered ObjectChange."""
+        tag = Tag.objects.create(name="Tag 1", slug="tag-1")
+
+        with web_request_context(self.user):
+            site = Site.objects.create(name="Test Site 1", slug="test-site-1")
+            site.tags.add(tag)
+
+        oc = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            changed_object_id=site.pk,
+        )
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.object_data["tags"], ["Tag 1"])
+
+    def test_change_log_rolled_back(self):
+        """ObjectChanges for changes that were rolled back are discarded."""
+        with web_request_context(self.user):
+            Site.objects.create(name="Test Site 1", slug="test-site-1")
+            try:
+                with transaction.atomic():
+                    Site.objects.create(name="Test Site 2", slug="test-site-2")
+                    raise ValueError()
+            except ValueError:
+                pass
+
+        self.assertEqual(
+            list(
+                ObjectChange.objects.filter(changed_object_type=ContentType.objects.get_for_model(Site)).values_list(
+                    "object_repr", flat=True
+                )
+            ),
+            ["Test Site 1"],
+        )
+
+    def test_change_log_per_object_transactions(self):
+        """ObjectChanges are kept for each committed savepoint and discarded for each rolled-back one."""
+        with web_request_context(self.user):
+            for i in range(5):
+                try:
+                    with transaction.atomic():
+                        Site.objects.create(name=f"Test Site {i}", slug=f"test-site-{i}")
+                        if i % 2:
+                            raise ValueError()
+                except ValueError:
+                    pass
+
+        self.assertEqual(
+            sorted(
+                ObjectChange.objects.filter(changed_object_type=ContentType.objects.get_for_model(Site)).values_list(
+                    "object_repr", flat=True
+                )
+            ),
+            ["Test Site 0", "Test Site 2", "Test Site 4"],
+        )
+
     def test_change_webhook_enqueued(self):
         """Test that the webhook resides on the queue"""
         # TODO(john): come back to this with a way to actually do it without a running worker
@@ -1,7 +1,11 @@
+from unittest import mock
+import uuid
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models import ProtectedError
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
@@ -9,8 +13,10 @@ from nautobot.dcim.filters import SiteFilterSet
 from nautobot.dcim.forms import SiteCSVForm
 from nautobot.dcim.models import Site, Rack, Device
 from nautobot.dcim.tables import SiteTable
-from nautobot.extras.choices import CustomFieldTypeChoices, CustomFieldFilterLogicChoices
-from nautobot.extras.models import ComputedField, CustomField, CustomFieldChoice, Status
+from nautobot.extras.choices import CustomFieldTypeChoices, CustomFieldFilterLogicChoices, JobResultStatusChoices
+from nautobot.extras.custom_fields import get_custom_fields_for_model
+from nautobot.extras.models import ComputedField, CustomField, CustomFieldChoice, JobResult, Status
+from nautobot.extras.tasks import delete_custom_field_data, provision_field, update_custom_field_choice_data
 from nautobot.utilities.tables import CustomFieldColumn
 from nautobot.utilities.testing import APITestCase, CeleryTestCase, TestCase
 from nautobot.virtualization.models import VirtualMachine
@@ -212,6 +218,26 @@ class CustomFieldManagerTest(TestCase):
             self.assertEqual(CustomField.objects.get_for_model(Site).count(), 1)
         self.assertEqual(CustomField.objects.get_for_model(VirtualMachine).count(), 0)
 
+    def test_get_custom_fields_for_model(self):
+        content_type = ContentType.objects.get_for_model(Rack)
+        custom_field = CustomField.objects.create(type=CustomFieldTypeChoices.TYPE_SELECT, name="select_field")
+        custom_field.content_types.set([content_type])
+        CustomFieldChoice.objects.create(field=custom_field, value="Foo")
+
+        custom_fields = get_custom_fields_for_model(Rack)
+        self.assertEqual(custom_fields, list(CustomField.objects.get_for_model(Rack)))
+        self.assertIn(custom_field, custom_fields)
+        # Choices are prefetched
+        with self.assertNumQueries(0):
+            self.assertEqual(custom_fields[custom_fields.index(custom_field)].get_choice_values(), ["Foo"])
+
+        # Changes to CustomFields and their choices are reflected
+        CustomFieldChoice.objects.create(field=custom_field, value="Bar")
+        custom_fields = get_custom_fields_for_model(Rack)
+        self.assertEqual(custom_fields[custom_fields.index(custom_field)].get_choice_values(), ["Bar", "Foo"])
+        custom_field.content_types.clear()
+        self.assertNotIn(custom_field, get_custom_fields_for_model(Rack))
+
 
 class CustomFieldAPITest(APITestCase):
     @classmethod
@@ -1313,6 +1339,63 @@ class CustomFieldBackgroundTasks(CeleryTestCase):
         self.assertEqual(site.cf["cf1"], "Bar")
 
 
+# Override the JOB_LOGS to None so that the Log Objects are created in the default database.
+# This change is required as JOB_LOGS is a `fake` database pointed at the default. The django
+# database cleanup will fail and cause tests to fail as this is not a real database.
+@mock.patch("nautobot.extras.models.models.JOB_LOGS", None)
+class CustomFieldDataTasksTest(TestCase):
+    """
+    Test the custom field data tasks directly, using a small batch size so that each task performs several batches.
+    """
+
+    def setUp(self):
+        self.content_type = ContentType.objects.get_for_model(Site)
+        for i in range(1, 6):
+            Site.objects.create(name=f"Site {i}", slug=f"site-{i}")
+        self.job_result = JobResult.objects.create(
+            name="cf1", obj_type=ContentType.objects.get_for_model(CustomField), job_id=uuid.uuid4()
+        )
+
+    @override_settings(CUSTOM_FIELD_DATA_BATCH_SIZE=2)
+    def test_provision_and_delete_field(self):
+        cf = CustomField.objects.create(name="cf1", type=CustomFieldTypeChoices.TYPE_TEXT, default="Foo")
+        Site.objects.filter(slug="site-1").update(_custom_field_data={"cf1": "Bar", "other": 1})
+
+        self.assertEqual(provision_field(cf.pk, [self.content_type.pk], job_result_pk=self.job_result.pk), 4)
+        self.assertEqual(
+            sorted(Site.objects.values_list("_custom_field_data__cf1", flat=True)), ["Bar", "Foo", "Foo", "Foo", "Foo"]
+        )
+        self.job_result.refresh_from_db()
+        self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(self.job_result.data, {"output": "Updated 4 of 4 sites"})
+
+        self.assertEqual(delete_custom_field_data("cf1", [self.content_type.pk]), 5)
+        for custom_field_data in Site.objects.values_list("_custom_field_data", flat=True):
+            self.assertNotIn("cf1", custom_field_data)
+        self.assertEqual(Site.objects.get(slug="site-1").cf, {"other": 1})
+
+    @override_settings(CUSTOM_FIELD_DATA_BATCH_SIZE=2)
+    def test_update_choice_data(self):
+        select_cf = CustomField.objects.create(name="cf1", type=CustomFieldTypeChoices.TYPE_SELECT)
+        select_cf.content_types.set([self.content_type])
+        multiselect_cf = CustomField.objects.create(name="cf2", type=CustomFieldTypeChoices.TYPE_MULTISELECT)
+        multiselect_cf.content_types.set([self.content_type])
+        Site.objects.filter(slug__in=["site-1", "site-2", "site-3"]).update(
+            _custom_field_data={"cf1": "Foo", "cf2": ["Foo_1", "Bar"]}
+        )
+        Site.objects.filter(slug="site-4").update(_custom_field_data={"cf1": "Bar", "cf2": ["Bar", "Foo%1"]})
+
+        self.assertEqual(update_custom_field_choice_data(select_cf.pk, "Foo", "Baz"), 3)
+        self.assertEqual(update_custom_field_choice_data(multiselect_cf.pk, "Foo_1", "Baz"), 3)
+        self.assertEqual(Site.objects.get(slug="site-1").cf, {"cf1": "Baz", "cf2": ["Baz", "Bar"]})
+        self.assertEqual(Site.objects.get(slug="site-4").cf, {"cf1": "Bar", "cf2": ["Bar", "Foo%1"]})
+
+    def test_field_not_found(self):
+        self.assertFalse(provision_field(uuid.uuid4(), [self.content_type.pk], job_result_pk=self.job_result.pk))
+        self.job_result.refresh_from_db()
+        self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_FAILED)
+
+
 class CustomFieldTableTest(TestCase):
     def setUp(self):
         content_type = ContentType.objects.get_for_model(Site)
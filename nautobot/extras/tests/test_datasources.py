@@ -138,6 +138,56 @@ class GitTest(TestCase):
                 MockGitRepo.assert_called_with(os.path.join(tempdir, self.repo.slug), "http://localhost/git.git")
                 # TODO: inspect the logs in job_result.data?
 
+    def test_pull_git_repository_and_refresh_data_shallow_checkout(self, MockGitRepo):
+        """
+        With GIT_SHALLOW_CHECKOUT, only the latest commit and the directories of the provided contents are checked out.
+        """
+        with tempfile.TemporaryDirectory() as tempdir:
+            with self.settings(GIT_ROOT=tempdir, GIT_SHALLOW_CHECKOUT=True):
+
+                def create_empty_repo(path, url, **kwargs):
+                    os.makedirs(path, exist_ok=True)
+                    return mock.DEFAULT
+
+                MockGitRepo.side_effect = create_empty_repo
+                MockGitRepo.return_value.checkout.return_value = self.COMMIT_HEXSHA
+                path = os.path.join(tempdir, self.repo.slug)
+
+                # The dummy plugin provides content from a directory of its own
+                pull_git_repository_and_refresh_data(self.repo.pk, self.dummy_request, self.job_result.pk)
+                MockGitRepo.assert_called_with(path, "http://localhost/git.git", depth=1)
+
+                self.repo.provided_contents = ["extras.job", "extras.configcontext"]
+                self.repo.save(trigger_resync=False)
+                pull_git_repository_and_refresh_data(self.repo.pk, self.dummy_request, self.job_result.pk)
+                MockGitRepo.assert_called_with(
+                    path, "http://localhost/git.git", depth=1, sparse_paths=["config_contexts", "jobs"]
+                )
+
+    def test_pull_git_repository_and_refresh_data_unchanged(self, MockGitRepo):
+        """
+        The data of a repository isn't refreshed again if neither its head nor its content has changed.
+        """
+        with tempfile.TemporaryDirectory() as tempdir:
+            with self.settings(GIT_ROOT=tempdir):
+
+                def create_repo(path, url):
+                    os.makedirs(os.path.join(path, "jobs"), exist_ok=True)
+                    return mock.DEFAULT
+
+                MockGitRepo.side_effect = create_repo
+                MockGitRepo.return_value.checkout.return_value = self.COMMIT_HEXSHA
+
+                pull_git_repository_and_refresh_data(self.repo.pk, self.dummy_request, self.job_result.pk)
+                with mock.patch("nautobot.extras.datasources.git.refresh_datasource_content") as mock_refresh:
+                    pull_git_repository_and_refresh_data(self.repo.pk, self.dummy_request, self.job_result.pk)
+                    mock_refresh.assert_not_called()
+
+                    with open(os.path.join(tempdir, self.repo.slug, "jobs", "job.py"), "w") as fd:
+                        fd.write("")
+                    pull_git_repository_and_refresh_data(self.repo.pk, self.dummy_request, self.job_result.pk)
+                    mock_refresh.assert_called_once()
+
     def test_pull_git_repository_and_refresh_data_with_token(self, MockGitRepo):
         """
         The pull_git_repository_and_refresh_data job should correctly make use of a token.
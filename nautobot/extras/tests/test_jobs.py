@@ -1,6 +1,7 @@
 import json
 from io import StringIO
 import os
+import tempfile
 from unittest import mock
 import uuid
 
@@ -69,6 +70,31 @@ class JobTest(TestCase):
             job_result.refresh_from_db()
             self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
 
+    def test_get_jobs_only_imports_changed_modules(self):
+        """
+        Job modules are only imported again once they have changed.
+        """
+        job_code = "from nautobot.extras.jobs import Job\n\n\nclass {}(Job):\n    pass\n"
+        with tempfile.TemporaryDirectory() as jobs_root, self.settings(JOBS_ROOT=jobs_root):
+            module_path = os.path.join(jobs_root, "test_discovery.py")
+            with open(module_path, "w") as module_file:
+                module_file.write(job_code.format("TestDiscovery"))
+
+            job_class = get_job("local/test_discovery/TestDiscovery")
+            self.assertIsNotNone(job_class)
+            with mock.patch("nautobot.extras.jobs._load_job_module") as mock_load_job_module:
+                self.assertIs(get_job("local/test_discovery/TestDiscovery"), job_class)
+                mock_load_job_module.assert_not_called()
+
+            with open(module_path, "w") as module_file:
+                module_file.write(job_code.format("TestDiscoveryRenamed"))
+            # Ensure that the modification time differs even on filesystems with coarse timestamps
+            stat = os.stat(module_path)
+            os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            self.assertIsNone(get_job("local/test_discovery/TestDiscovery"))
+            self.assertIsNotNone(get_job("local/test_discovery/TestDiscoveryRenamed"))
+
     def test_job_fail(self):
         """
         Job test with fail result.
@@ -7,8 +7,11 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DEFAULT_DB_ALIAS
 from django.db.models import ProtectedError
+from django.db.models.deletion import Collector
 from django.db.utils import IntegrityError
+from django.test import override_settings
 
 from nautobot.dcim.models import (
     Device,
@@ -20,6 +23,8 @@ from nautobot.dcim.models import (
     Region,
 )
 from nautobot.extras.choices import LogLevelChoices, SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
+from nautobot.extras.computed_fields import render_computed_fields
+from nautobot.extras.config_contexts import ConfigContextIndex
 from nautobot.extras.jobs import get_job, Job
 from nautobot.extras.models import (
     ComputedField,
@@ -31,16 +36,19 @@ from nautobot.extras.models import (
     GitRepository,
     JobLogEntry,
     JobResult,
+    SearchIndexEntry,
     Secret,
     SecretsGroup,
     SecretsGroupAssociation,
     Status,
     Tag,
 )
+from nautobot.extras.search import rebuild_search_index, search
 from nautobot.extras.secrets.exceptions import SecretParametersError, SecretProviderError, SecretValueNotFoundError
 from nautobot.ipam.models import IPAddress
 from nautobot.tenancy.models import Tenant, TenantGroup
 from nautobot.utilities.choices import ColorChoices
+from nautobot.users.models import ObjectPermission
 from nautobot.utilities.testing import TestCase, TransactionTestCase
 from nautobot.virtualization.models import (
     Cluster,
@@ -93,6 +101,26 @@ class ComputedFieldTest(TestCase):
         rendered_value = self.bad_computed_field.render(context={"obj": self.site1})
         self.assertEqual(rendered_value, self.bad_computed_field.fallback_value)
 
+    def test_render_computed_fields(self):
+        site2 = Site.objects.create(name="LAX")
+        self.assertEqual(
+            render_computed_fields([self.site1, site2], label_as_key=True),
+            [
+                {
+                    "Bad Computed Field": self.bad_computed_field.fallback_value,
+                    "Blank Fallback Value": "",
+                    "Good Computed Field": f"{site.name} is awesome!",
+                }
+                for site in (self.site1, site2)
+            ],
+        )
+        self.assertEqual(site2.get_computed_fields(), render_computed_fields([site2])[0])
+        self.assertEqual(site2.get_computed_field("good_computed_field"), "LAX is awesome!")
+
+        self.good_computed_field.delete()
+        self.assertIsNone(site2.get_computed_field("good_computed_field"))
+        self.assertEqual(list(site2.get_computed_fields()), ["bad_computed_field", "blank_fallback_value"])
+
 
 class ConfigContextTest(TestCase):
     """
@@ -299,6 +327,55 @@ class ConfigContextTest(TestCase):
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
 
+    def test_parent_regions_and_inactive_contexts(self):
+        """
+        Config contexts assigned to any ancestor of the device's region apply to it, while inactive config contexts
+        never do.
+        """
+        parent_region = Region.objects.create(name="Parent Region")
+        self.region.parent = parent_region
+        self.region.save()
+        parent_region_context = ConfigContext.objects.create(name="parent region", weight=100, data={"a": 1})
+        parent_region_context.regions.add(parent_region)
+        other_region_context = ConfigContext.objects.create(name="other region", weight=100, data={"b": 1})
+        other_region_context.regions.add(Region.objects.create(name="Other Region"))
+        ConfigContext.objects.create(name="inactive", weight=100, data={"c": 1}, is_active=False)
+
+        self.assertEqual(list(ConfigContext.objects.get_for_object(self.device)), [parent_region_context])
+        annotated_queryset = Device.objects.filter(name=self.device.name).annotate_config_context_data()
+        self.assertEqual(annotated_queryset[0].get_config_context(), {"a": 1})
+
+        parent_region_context.is_active = False
+        parent_region_context.save()
+        annotated_queryset = Device.objects.filter(name=self.device.name).annotate_config_context_data()
+        self.assertEqual(annotated_queryset[0].get_config_context(), {})
+
+    def test_index_retained_within_transaction(self):
+        """
+        The ConfigContextIndex is loaded once for the remainder of a transaction, unless ConfigContexts change.
+        """
+        ConfigContext.objects.create(name="context 1", weight=100, data={"a": 1})
+
+        with mock.patch.object(ConfigContextIndex, "load", wraps=ConfigContextIndex.load) as load:
+            for _ in range(3):
+                self.assertEqual(self.device.get_config_context(), {"a": 1})
+            self.assertEqual(load.call_count, 1)
+
+            ConfigContext.objects.create(name="context 2", weight=200, data={"a": 2})
+            self.assertEqual(self.device.get_config_context(), {"a": 2})
+            self.assertEqual(load.call_count, 2)
+
+    def test_annotated_data_discarded_on_save(self):
+        site = Site.objects.create(name="Site-2", slug="site-2")
+        context = ConfigContext.objects.create(name="context 1", weight=100, data={"a": 1})
+        context.sites.add(site)
+
+        device = Device.objects.annotate_config_context_data().get(pk=self.device.pk)
+        self.assertEqual(device.get_config_context(), {})
+        device.site = site
+        device.save()
+        self.assertEqual(device.get_config_context(), {"a": 1})
+
 
 class ConfigContextSchemaTestCase(TestCase):
     """
@@ -576,6 +653,33 @@ class ExportTemplateTest(TestCase):
         )
         nonduplicate_template.validated_save()
 
+    def test_render_to_response(self):
+        """A streamed export produces the same output as `render()`."""
+        Site.objects.create(name="Site 1", slug="site-1")
+        Site.objects.create(name="Site 2", slug="site-2")
+        export_template = ExportTemplate.objects.create(
+            content_type=ContentType.objects.get_for_model(Site),
+            name="Export Template 1",
+            template_code="{% for site in queryset %}{{ site.name }}\r\n{% endfor %}{{ queryset | length }}",
+            file_extension="txt",
+        )
+        queryset = Site.objects.order_by("name")
+
+        response = export_template.render_to_response(queryset)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="nautobot_sites.txt"')
+        self.assertEqual(response.getvalue().decode(), "Site 1\nSite 2\n2")
+        self.assertEqual(export_template.render(queryset), "Site 1\nSite 2\n2")
+
+    def test_render_to_response_error(self):
+        """Errors in the template are raised before the response is returned."""
+        export_template = ExportTemplate(
+            content_type=ContentType.objects.get_for_model(Site),
+            name="Export Template 1",
+            template_code="{{ queryset.nonexistent() }}",
+        )
+        with self.assertRaises(Exception):
+            export_template.render_to_response(Site.objects.all())
+
 
 class FileProxyTest(TestCase):
     def setUp(self):
@@ -727,6 +831,70 @@ class JobResultTest(TestCase):
         self.assertIsNone(job_result.related_object)
 
 
+class SearchIndexEntryTest(TestCase):
+    """
+    Tests for the search index and its maintenance.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.tenants = (
+            Tenant.objects.create(name="Tenant Alpha", slug="tenant-alpha", description="Primary"),
+            Tenant.objects.create(name="Alpha", slug="alpha"),
+            Tenant.objects.create(name="Beta", slug="beta", description="Alpha site"),
+        )
+
+    def test_index_maintained_on_save_and_delete(self):
+        tenant = self.tenants[0]
+        entry = SearchIndexEntry.objects.get(object_id=tenant.pk)
+        self.assertEqual(entry.name, "Tenant Alpha")
+        self.assertIn("primary", entry.text)
+
+        tenant.description = "Secondary"
+        tenant.save()
+        entry.refresh_from_db()
+        self.assertIn("secondary", entry.text)
+        self.assertNotIn("primary", entry.text)
+
+        tenant.delete()
+        self.assertFalse(SearchIndexEntry.objects.filter(object_id=tenant.pk).exists())
+
+    def test_other_models_can_be_fast_deleted(self):
+        # The signal handlers maintaining the index aren't connected for models outside of it
+        self.assertTrue(Collector(using=DEFAULT_DB_ALIAS).can_fast_delete(SearchIndexEntry.objects.all()))
+        self.assertFalse(Collector(using=DEFAULT_DB_ALIAS).can_fast_delete(Tenant.objects.all()))
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["tenancy.tenant"])
+    def test_search_ranking(self):
+        results = search("alpha", self.user, models=[Tenant])
+        self.assertEqual(
+            [entry.object_id for entry in results],
+            [self.tenants[1].pk, self.tenants[0].pk, self.tenants[2].pk],
+        )
+        self.assertEqual([entry.rank for entry in results], [3, 1, 0])
+
+    def test_search_restricted(self):
+        self.assertFalse(search("alpha", self.user, models=[Tenant]).exists())
+
+        obj_perm = ObjectPermission(name="Test permission", constraints={"slug": "beta"}, actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Tenant))
+        self.assertEqual([entry.object_id for entry in search("alpha", self.user)], [self.tenants[2].pk])
+
+    def test_rebuild_search_index(self):
+        # Bulk updates bypass the signal handlers
+        Tenant.objects.filter(pk=self.tenants[0].pk).update(description="Updated")
+        SearchIndexEntry.objects.filter(object_id=self.tenants[1].pk).delete()
+
+        self.assertEqual(rebuild_search_index(Tenant, missing_only=True), 1)
+        self.assertTrue(SearchIndexEntry.objects.filter(object_id=self.tenants[1].pk).exists())
+        self.assertNotIn("updated", SearchIndexEntry.objects.get(object_id=self.tenants[0].pk).text)
+
+        self.assertEqual(rebuild_search_index(Tenant), 3)
+        self.assertIn("updated", SearchIndexEntry.objects.get(object_id=self.tenants[0].pk).text)
+
+
 class SecretTest(TestCase):
     """
     Tests for the `Secret` model class.
@@ -1079,3 +1247,92 @@ class JobLogEntryTest(TestCase):
             self.assertEqual(log_object.message, log.message)
             self.assertEqual(log_object.log_level, log.log_level)
             self.assertEqual(log_object.grouping, log.grouping)
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=3, JOB_LOG_FLUSH_INTERVAL=3600)
+    @mock.patch("nautobot.extras.models.models.JOB_LOGS", None)
+    def test_buffered_logs(self):
+        job_result = JobResult.objects.create(
+            name="test",
+            obj_type=ContentType.objects.get(app_label="extras", model="job"),
+            job_id=uuid.uuid4(),
+        )
+
+        with job_result.buffered_logs():
+            job_result.log("Message 1")
+            self.assertFalse(job_result.logs.exists())
+
+            # Entries logged to the default database are never buffered
+            job_result.log("Message 2", use_default_db=True)
+            self.assertEqual(job_result.logs.count(), 1)
+
+            # The buffer is flushed when it is full...
+            job_result.log("Message 3")
+            self.assertEqual(job_result.logs.count(), 1)
+            job_result.log("Message 4")
+            self.assertEqual(job_result.logs.count(), 4)
+
+            # ...when the JobResult is saved...
+            job_result.log("Message 5")
+            job_result.save()
+            self.assertEqual(job_result.logs.count(), 5)
+
+            # ...when it hasn't been flushed for JOB_LOG_FLUSH_INTERVAL seconds...
+            job_result.log("Message 6")
+            with override_settings(JOB_LOG_FLUSH_INTERVAL=0):
+                job_result.log("Message 7")
+            self.assertEqual(job_result.logs.count(), 7)
+
+            job_result.log("Message 8")
+            self.assertEqual(job_result.logs.count(), 7)
+
+        # ...and on exit
+        self.assertEqual(
+            sorted(job_result.logs.values_list("message", flat=True)),
+            [f"Message {i}" for i in range(1, 9)],
+        )
+
+        # Entries are saved immediately once buffering has ended
+        job_result.log("Message 9")
+        self.assertEqual(job_result.logs.count(), 9)
+
+
+class JobLogEntryFlushTimerTest(TransactionTestCase):
+    """
+    Tests for the timed flushing of buffered JobLogEntries.
+
+    Note: This is a TransactionTestCase, rather than a TestCase, because the entries are written by another thread, on
+    its own database connection, which can't see the uncommitted data of a normal TestCase.
+    """
+
+    @override_settings(JOB_LOG_BUFFER_SIZE=100, JOB_LOG_FLUSH_INTERVAL=0.5)
+    @mock.patch("nautobot.extras.models.models.JOB_LOGS", DEFAULT_DB_ALIAS)
+    def test_buffered_logs_flushed_on_timer(self):
+        job_result = JobResult.objects.create(
+            name="test",
+            obj_type=ContentType.objects.get(app_label="extras", model="job"),
+            job_id=uuid.uuid4(),
+        )
+
+        with job_result.buffered_logs():
+            job_result.log("Message 1")
+            job_result.log("Message 2")
+            timer = job_result._log_flush_timer
+            self.assertIsNotNone(timer)
+            self.assertFalse(job_result.logs.exists())
+
+            # Without anything further being logged, the entries are written once JOB_LOG_FLUSH_INTERVAL has passed
+            timer.join(timeout=10)
+            self.assertEqual(job_result.logs.count(), 2)
+            self.assertIsNone(job_result._log_flush_timer)
+
+            # The next entry starts a new timer, which is cancelled when the buffer is flushed on exit
+            job_result.log("Message 3")
+            timer = job_result._log_flush_timer
+            self.assertIsNotNone(timer)
+
+        timer.join(timeout=10)
+        self.assertIsNone(job_result._log_flush_timer)
+        self.assertEqual(
+            sorted(job_result.logs.values_list("message", flat=True)),
+            ["Message 1", "Message 2", "Message 3"],
+        )
@@ -6,16 +6,18 @@ import uuid
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.http import Http404
 from django.test import override_settings, SimpleTestCase
 from django.urls import reverse
 from django.utils import timezone
 from unittest import mock
 
-from nautobot.dcim.models import ConsolePort, Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
+from nautobot.dcim.models import ConsolePort, Device, DeviceRole, DeviceType, Interface, Manufacturer, Region, Site
 from nautobot.extras.choices import (
     CustomFieldTypeChoices,
     JobExecutionType,
+    JobResultStatusChoices,
     ObjectChangeActionChoices,
     SecretsGroupAccessTypeChoices,
     SecretsGroupSecretTypeChoices,
@@ -43,8 +45,10 @@ from nautobot.extras.models import (
     Webhook,
     ComputedField,
 )
+from nautobot.extras.tasks import enqueue_export_task, enqueue_import_task, export_objects, import_objects
 from nautobot.extras.views import JobView, ScheduledJobView
 from nautobot.ipam.models import VLAN
+from nautobot.users.models import ObjectPermission
 from nautobot.utilities.testing import ViewTestCases, TestCase, extract_page_body, extract_form_failures
 from nautobot.utilities.testing.utils import post_data
 
@@ -973,6 +977,194 @@ class JobResultTestCase(
         )
 
 
+@mock.patch("nautobot.extras.models.models.JOB_LOGS", None)
+class ExportJobTestCase(TestCase):
+    """
+    Test exports generated by a background job, and the download of the exported file.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.create(name="Site 1", slug="site-1")
+        Site.objects.create(name="Site 2", slug="site-2")
+
+    def run_export(self, query_string):
+        job_result = enqueue_export_task(Site, "dcim:site_list", query_string, self.user)
+        export_objects(
+            ContentType.objects.get_for_model(Site).pk, "dcim:site_list", query_string, job_result_pk=job_result.pk
+        )
+        job_result.refresh_from_db()
+        return job_result
+
+    @mock.patch("nautobot.extras.tasks.export_objects.apply_async")
+    def test_export_objects(self, mock_apply_async):
+        self.add_permissions("dcim.view_site", "extras.view_jobresult")
+
+        job_result = self.run_export("export&slug=site-1")
+        mock_apply_async.assert_called_once()
+        self.assertEqual(job_result.name, "nautobot_sites.csv")
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+
+        response = self.client.get(reverse("extras:jobresult_download", kwargs={"pk": job_result.pk}))
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="nautobot_sites.csv"')
+        content = b"".join(response.streaming_content).decode()
+        self.assertIn("Site 1", content)
+        self.assertNotIn("Site 2", content)
+
+        # Only the user who requested the export may download it
+        job_result.user = User.objects.create(username="otheruser")
+        job_result.save()
+        response = self.client.get(reverse("extras:jobresult_download", kwargs={"pk": job_result.pk}))
+        self.assertHttpStatus(response, 403)
+
+    @mock.patch("nautobot.extras.tasks.export_objects.apply_async")
+    def test_export_objects_without_permission(self, mock_apply_async):
+        job_result = self.run_export("export")
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertFalse(job_result.files.exists())
+
+    @override_settings(EXPORT_JOB_THRESHOLD=1)
+    @mock.patch("nautobot.core.views.generic.get_worker_count", return_value=1)
+    @mock.patch("nautobot.extras.tasks.export_objects.apply_async")
+    def test_list_view_export_in_background(self, mock_apply_async, mock_get_worker_count):
+        self.add_permissions("dcim.view_site")
+
+        response = self.client.get(f"{reverse('dcim:site_list')}?export")
+        job_result = JobResult.objects.get(name="nautobot_sites.csv")
+        self.assertRedirects(response, job_result.get_absolute_url(), fetch_redirect_response=False)
+        self.assertEqual(mock_apply_async.call_args.kwargs["kwargs"]["view_name"], "dcim:site_list")
+
+        # Exports below the threshold are generated within the request
+        response = self.client.get(f"{reverse('dcim:site_list')}?export&slug=site-1")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.get("Content-Type"), "text/csv")
+
+    @override_settings(EXPORT_JOB_THRESHOLD=1, EXEMPT_VIEW_PERMISSIONS=["*"])
+    @mock.patch("nautobot.core.views.generic.get_worker_count", return_value=1)
+    @mock.patch("nautobot.extras.tasks.export_objects.apply_async")
+    def test_list_view_export_anonymous(self, mock_apply_async, mock_get_worker_count):
+        self.client.logout()
+
+        # The export of an anonymous user is generated within the request, as no JobResult can be recorded for them
+        response = self.client.get(f"{reverse('dcim:site_list')}?export")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.get("Content-Type"), "text/csv")
+        mock_apply_async.assert_not_called()
+        self.assertFalse(JobResult.objects.exists())
+
+
+@mock.patch("nautobot.extras.models.models.JOB_LOGS", None)
+class ImportJobTestCase(TestCase):
+    """
+    Test CSV imports performed by a background job.
+    """
+
+    csv_data = "\n".join(
+        (
+            "name,slug,status",
+            "Site 1,site-1,active",
+            "Site 2,site-2,planned",
+            "Site 3,site-3,nonexistent",
+            "Site 4,site-4,active",
+        )
+    )
+
+    def run_import(self, chunk_size=500):
+        csv_file = SimpleUploadedFile("sites.csv", self.csv_data.encode())
+        job_result = enqueue_import_task(Site, "dcim:site_import", csv_file, self.user)
+        file_proxy_pk = job_result.files.get().pk
+        import_objects("dcim:site_import", file_proxy_pk, chunk_size=chunk_size, job_result_pk=job_result.pk)
+        job_result.refresh_from_db()
+        return job_result
+
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_import_objects(self, mock_apply_async):
+        self.add_permissions("dcim.add_site", "extras.view_status")
+
+        job_result = self.run_import(chunk_size=2)
+        mock_apply_async.assert_called_once()
+        self.assertEqual(job_result.name, "sites.csv")
+        # The invalid row is skipped, while the others are imported
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertEqual(
+            sorted(Site.objects.values_list("name", flat=True)),
+            ["Site 1", "Site 2", "Site 4"],
+        )
+        self.assertTrue(job_result.logs.filter(message__startswith="Row 3 status").exists())
+        self.assertFalse(job_result.files.exists())
+        self.assertEqual(ObjectChange.objects.filter(user=self.user).count(), 3)
+
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_import_objects_with_constrained_permission(self, mock_apply_async):
+        self.add_permissions("extras.view_status")
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission", constraints={"status__slug": "active"}, actions=["add"]
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Site))
+
+        job_result = self.run_import(chunk_size=2)
+        # The chunk containing Site 2 is rolled back
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertEqual(list(Site.objects.values_list("name", flat=True)), ["Site 4"])
+
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_import_objects_rolled_back_not_looked_up(self, mock_apply_async):
+        self.add_permissions("dcim.view_region")
+        obj_perm = ObjectPermission.objects.create(
+            name="Test permission", constraints={"name__startswith": "Region"}, actions=["add"]
+        )
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Region))
+        csv_data = "\n".join(
+            (
+                "name,slug,parent",
+                "Region 1,region-1,",
+                "Other Region,other-region,Region 1",
+                "Region 2,region-2,Region 1",
+            )
+        )
+        csv_file = SimpleUploadedFile("regions.csv", csv_data.encode())
+        job_result = enqueue_import_task(Region, "dcim:region_import", csv_file, self.user)
+
+        # The first chunk is rolled back, so the parent of the third row no longer exists
+        import_objects("dcim:region_import", job_result.files.get().pk, chunk_size=2, job_result_pk=job_result.pk)
+        self.assertFalse(Region.objects.exists())
+        self.assertTrue(job_result.logs.filter(message__startswith="Row 3 parent").exists())
+
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_import_objects_without_related_object_permission(self, mock_apply_async):
+        self.add_permissions("dcim.add_site")
+
+        # Without permission to view statuses, no status can be looked up, so each row is rejected
+        job_result = self.run_import()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertFalse(Site.objects.exists())
+        for row in (1, 2, 3, 4):
+            self.assertTrue(job_result.logs.filter(message__startswith=f"Row {row} status").exists())
+
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_import_objects_without_permission(self, mock_apply_async):
+        job_result = self.run_import()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertFalse(Site.objects.exists())
+        self.assertFalse(job_result.files.exists())
+
+    @override_settings(IMPORT_JOB_THRESHOLD=3)
+    @mock.patch("nautobot.core.views.generic.get_worker_count", return_value=1)
+    @mock.patch("nautobot.extras.tasks.import_objects.apply_async")
+    def test_bulk_import_view_in_background(self, mock_apply_async, mock_get_worker_count):
+        self.add_permissions("dcim.add_site", "extras.view_status")
+
+        response = self.client.post(reverse("dcim:site_import"), {"csv_data": self.csv_data})
+        job_result = JobResult.objects.get(name="nautobot_sites.csv")
+        self.assertRedirects(response, job_result.get_absolute_url(), fetch_redirect_response=False)
+        self.assertEqual(mock_apply_async.call_args.kwargs["kwargs"]["view_name"], "dcim:site_import")
+        self.assertFalse(Site.objects.exists())
+        self.assertEqual(job_result.files.get().file.read().decode(), self.csv_data)
+
+
 class JobTestCase(
     TestCase,
 ):
@@ -1,5 +1,9 @@
+import io
 import json
+import threading
 import uuid
+from contextlib import redirect_stdout
+from http.server import HTTPServer
 from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
@@ -9,9 +13,11 @@ from requests import Session
 from nautobot.dcim.api.serializers import SiteSerializer
 from nautobot.dcim.models import Site
 from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.management.commands.webhook_receiver import WebhookHandler
 from nautobot.extras.models import Webhook
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhook, process_webhooks
 from nautobot.extras.utils import generate_signature
+from nautobot.extras.webhooks import WebhookQueue, get_webhooks_for_action
 from nautobot.utilities.testing import APITestCase
 
 
@@ -89,3 +95,166 @@ class WebhookTest(APITestCase):
                 self.user.username,
                 request_id,
             )
+
+    def test_webhooks_process_webhooks_batch_payload(self):
+        """
+        Mock a Session.send to inspect the result of `process_webhooks()` for a webhook with a batch payload.
+        """
+
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.batch_payload = True
+        webhook.save()
+        timestamp = str(timezone.now())
+        sent_requests = []
+
+        def dummy_send(_, request, **kwargs):
+            sent_requests.append(request)
+
+            class FakeResponse:
+                ok = True
+                status_code = 200
+
+            return FakeResponse()
+
+        with patch.object(Session, "send", dummy_send):
+            sites = [Site.objects.create(name=f"Site {i}", slug=f"site-{i}") for i in range(3)]
+            serializer_context = {
+                "request": None,
+            }
+            events = [
+                [
+                    SiteSerializer(site, context=serializer_context).data,
+                    Site._meta.model_name,
+                    ObjectChangeActionChoices.ACTION_CREATE,
+                    timestamp,
+                    self.user.username,
+                    request_id,
+                ]
+                for site in sites
+            ]
+
+            process_webhooks(webhook.pk, events)
+
+        self.assertEqual(len(sent_requests), 1)
+        body = json.loads(sent_requests[0].body)
+        self.assertEqual([event["data"]["name"] for event in body], ["Site 0", "Site 1", "Site 2"])
+        self.assertEqual(body[0]["event"], "created")
+        self.assertEqual(body[0]["request_id"], str(request_id))
+
+    def test_webhook_queue_coalesces_events(self):
+        """
+        Repeated updates of one object are coalesced into a single event, enqueued as one task per webhook.
+        """
+        request_id = uuid.uuid4()
+        webhook = Webhook.objects.create(name="Site Update Webhook", type_update=True, payload_url="http://localhost/")
+        webhook.content_types.set([ContentType.objects.get_for_model(Site)])
+        site_1 = Site.objects.create(name="Site 1", slug="site-1")
+        site_2 = Site.objects.create(name="Site 2", slug="site-2")
+
+        with patch.object(process_webhooks, "apply_async") as apply_async:
+            webhook_queue = WebhookQueue(request_id)
+            site_1.description = "Updated"
+            site_1.save()
+            webhook_queue.add(site_1, self.user, ObjectChangeActionChoices.ACTION_UPDATE)
+            site_1.name = "Site 1 renamed"
+            site_1.save()
+            webhook_queue.add(site_1, self.user, ObjectChangeActionChoices.ACTION_UPDATE)
+            webhook_queue.add(site_2, self.user, ObjectChangeActionChoices.ACTION_UPDATE)
+            webhook_queue.flush()
+
+        apply_async.assert_called_once()
+        webhook_pk, events = apply_async.call_args[1]["args"]
+        self.assertEqual(webhook_pk, webhook.pk)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[0][0]["name"], "Site 1 renamed")
+        self.assertEqual(events[0][2], ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(events[1][0]["name"], "Site 2")
+
+    def test_webhook_queue_create_then_update(self):
+        """
+        A create followed by an update of the same object is reported to each webhook as of the action it's enabled for.
+        """
+        request_id = uuid.uuid4()
+        create_webhook = Webhook.objects.get(type_create=True)
+        update_webhook = Webhook.objects.create(
+            name="Site Update Webhook", type_update=True, payload_url="http://localhost/"
+        )
+        update_webhook.content_types.set([ContentType.objects.get_for_model(Site)])
+
+        with patch.object(process_webhooks, "apply_async") as apply_async:
+            webhook_queue = WebhookQueue(request_id)
+            site = Site.objects.create(name="Site 1", slug="site-1")
+            webhook_queue.add(site, self.user, ObjectChangeActionChoices.ACTION_CREATE)
+            site.name = "Site 1 renamed"
+            site.save()
+            webhook_queue.add(site, self.user, ObjectChangeActionChoices.ACTION_UPDATE)
+            site.description = "Updated"
+            site.save()
+            webhook_queue.add(site, self.user, ObjectChangeActionChoices.ACTION_UPDATE)
+            webhook_queue.flush()
+
+        events_by_webhook = {call[1]["args"][0]: call[1]["args"][1] for call in apply_async.call_args_list}
+        self.assertEqual(set(events_by_webhook), {create_webhook.pk, update_webhook.pk})
+
+        # The create-only webhook receives the object as created...
+        (event,) = events_by_webhook[create_webhook.pk]
+        self.assertEqual(event[2], ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(event[0]["name"], "Site 1")
+        self.assertEqual(event[0]["description"], "")
+
+        # ...and the update-only webhook a single "updated" event with its final state
+        (event,) = events_by_webhook[update_webhook.pk]
+        self.assertEqual(event[2], ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(event[0]["name"], "Site 1 renamed")
+        self.assertEqual(event[0]["description"], "Updated")
+
+    def test_webhook_cache_invalidated(self):
+        """
+        The cached webhook lookup reflects changes to Webhooks.
+        """
+        site_ct = ContentType.objects.get_for_model(Site)
+        webhook = Webhook.objects.get(type_create=True)
+        self.assertEqual(get_webhooks_for_action(site_ct, ObjectChangeActionChoices.ACTION_CREATE), [webhook])
+
+        webhook.enabled = False
+        webhook.save()
+        self.assertEqual(get_webhooks_for_action(site_ct, ObjectChangeActionChoices.ACTION_CREATE), [])
+
+    def test_webhooks_delivered_to_webhook_receiver(self):
+        """
+        Deliver a batch of events concurrently to a local instance of the `webhook_receiver` request handler.
+        """
+        httpd = HTTPServer(("localhost", 0), WebhookHandler)
+        self.addCleanup(httpd.server_close)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        self.addCleanup(httpd.shutdown)
+
+        webhook = Webhook.objects.get(type_create=True)
+        webhook.payload_url = f"http://localhost:{httpd.server_port}/"
+        webhook.save()
+
+        request_id = uuid.uuid4()
+        timestamp = str(timezone.now())
+        serializer_context = {
+            "request": None,
+        }
+        sites = [Site.objects.create(name=f"Site {i}", slug=f"site-{i}") for i in range(5)]
+        events = [
+            [
+                SiteSerializer(site, context=serializer_context).data,
+                Site._meta.model_name,
+                ObjectChangeActionChoices.ACTION_CREATE,
+                timestamp,
+                self.user.username,
+                request_id,
+            ]
+            for site in sites
+        ]
+
+        with redirect_stdout(io.StringIO()) as output:
+            results = process_webhooks(webhook.pk, events)
+
+        self.assertEqual(len(results), 5)
+        for i in range(5):
+            self.assertIn(f'"name": "Site {i}"', output.getvalue())
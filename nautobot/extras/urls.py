@@ -348,6 +348,7 @@ urlpatterns = [
     path("job-results/", views.JobResultListView.as_view(), name="jobresult_list"),
     path("job-results/<uuid:pk>/", views.JobResultView.as_view(), name="jobresult"),
     path("job-results/<uuid:pk>/log-table/", views.JobLogEntryTableView.as_view(), name="jobresult_log-table"),
+    path("job-results/<uuid:pk>/download/", views.JobResultDownloadView.as_view(), name="jobresult_download"),
     path(
         "job-results/delete/",
         views.JobResultBulkDeleteView.as_view(),
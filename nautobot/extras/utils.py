@@ -100,6 +100,16 @@ def generate_signature(request_body, secret):
     return hmac_prep.hexdigest()
 
 
+def can_download_job_result_files(user, job_result):
+    """
+    Return whether the given user may download the files produced by the given JobResult.
+
+    Such files (e.g. exports) reflect the permissions of the user who ran the job, so only that user or a superuser may
+    download them.
+    """
+    return user.is_superuser or (job_result.user_id is not None and job_result.user_id == user.pk)
+
+
 def get_worker_count(request=None):
     """
     Return a count of the active Celery workers.
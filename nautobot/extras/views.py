@@ -9,7 +9,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.db.models import ProtectedError, Q
 from django.forms.utils import pretty_name
-from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
@@ -23,7 +23,7 @@ from jsonschema.validators import Draft7Validator
 from nautobot.core.views import generic
 from nautobot.dcim.models import Device
 from nautobot.dcim.tables import DeviceTable
-from nautobot.extras.utils import get_worker_count
+from nautobot.extras.utils import can_download_job_result_files, get_worker_count
 from nautobot.utilities.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.utilities.forms import restrict_form_fields
 from nautobot.utilities.utils import (
@@ -51,6 +51,7 @@ from .models import (
     CustomField,
     CustomLink,
     ExportTemplate,
+    FileProxy,
     GitRepository,
     GraphQLQuery,
     ImageAttachment,
@@ -1110,9 +1111,28 @@ class JobResultView(generic.ObjectView):
             "job": job,
             "associated_record": associated_record,
             "result": instance,
+            "can_download": instance.files.exists() and can_download_job_result_files(request.user, instance),
         }
 
 
+class JobResultDownloadView(generic.ObjectView):
+    """
+    Download the file most recently produced by a JobResult, such as an export.
+    """
+
+    queryset = JobResult.objects.all()
+
+    def get(self, request, pk):
+        job_result = get_object_or_404(self.queryset, pk=pk)
+        if not can_download_job_result_files(request.user, job_result):
+            return HttpResponseForbidden("Only the user who ran this job may download its files.")
+        try:
+            file_proxy = job_result.files.latest()
+        except FileProxy.DoesNotExist:
+            raise Http404("This job result has no files.")
+        return FileResponse(file_proxy.file.open("rb"), as_attachment=True, filename=file_proxy.name)
+
+
 class JobLogEntryTableView(View):
     """
     Display a table of `JobLogEntry` objects for a given `JobResult` instance.
@@ -0,0 +1,213 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from jinja2.exceptions import TemplateError
+from prometheus_client import Counter, Gauge, Histogram
+
+from nautobot.extras.utils import generate_signature
+
+
+logger = getLogger("nautobot.extras.webhook_delivery")
+
+# HTTP response status codes which indicate a transient receiver-side failure worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+webhook_delivery_seconds = Histogram(
+    "webhook_delivery_seconds", "Time taken to deliver a webhook request, including retries", ["receiver"]
+)
+webhook_delivery_failures = Counter(
+    "webhook_delivery_failures", "Number of webhook requests which could not be delivered", ["receiver"]
+)
+webhook_delivery_retries = Counter("webhook_delivery_retries", "Number of webhook request retries", ["receiver"])
+webhook_requests_pending = Gauge(
+    "webhook_requests_pending",
+    "Number of webhook requests queued or in flight",
+    multiprocess_mode="livesum",
+)
+
+# Process-wide HTTP sessions and concurrency limits, keyed by receiver ("scheme://host:port")
+_sessions = {}
+_receiver_semaphores = {}
+_lock = threading.Lock()
+
+
+def get_receiver(url):
+    """
+    Return the "scheme://host[:port]" identifying the receiver of the given URL.
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_session(receiver):
+    """
+    Return the shared `requests.Session` for the given receiver, creating it if necessary.
+
+    Each session keeps a pool of up to `WEBHOOK_CONCURRENCY_PER_RECEIVER` persistent connections to its receiver.
+    """
+    with _lock:
+        if receiver not in _sessions:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=settings.WEBHOOK_CONCURRENCY_PER_RECEIVER,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[receiver] = session
+        return _sessions[receiver]
+
+
+def _get_receiver_semaphore(receiver):
+    with _lock:
+        if receiver not in _receiver_semaphores:
+            _receiver_semaphores[receiver] = threading.BoundedSemaphore(settings.WEBHOOK_CONCURRENCY_PER_RECEIVER)
+        return _receiver_semaphores[receiver]
+
+
+def prepare_webhook_request(webhook, context):
+    """
+    Render the headers and body of the given Webhook for the given template context and return a signed
+    `requests.PreparedRequest`.
+    """
+    # Build the headers for the HTTP request
+    headers = {
+        "Content-Type": webhook.http_content_type,
+    }
+    try:
+        headers.update(webhook.render_headers(context))
+    except (TemplateError, ValueError) as e:
+        logger.error("Error parsing HTTP headers for webhook %s: %s", webhook, e)
+        raise
+
+    # Render the request body
+    try:
+        body = webhook.render_body(context)
+    except TemplateError as e:
+        logger.error("Error rendering request body for webhook %s: %s", webhook, e)
+        raise
+
+    # Prepare the HTTP request
+    params = {
+        "method": webhook.http_method,
+        "url": webhook.payload_url,
+        "headers": headers,
+        "data": body.encode("utf8"),
+    }
+    logger.debug("%s", params)
+    try:
+        prepared_request = requests.Request(**params).prepare()
+    except requests.exceptions.RequestException as e:
+        logger.error("Error forming HTTP request: %s", e)
+        raise
+
+    # If a secret key is defined, sign the request with a hash of the key and its content
+    if webhook.secret != "":
+        prepared_request.headers["X-Hook-Signature"] = generate_signature(prepared_request.body, webhook.secret)
+
+    return prepared_request
+
+
+def send_webhook_request(webhook, prepared_request):
+    """
+    Send a prepared request to the Webhook's receiver, retrying transient failures with exponential backoff.
+
+    At most `WEBHOOK_CONCURRENCY_PER_RECEIVER` requests are sent to any one receiver at a time by this process.
+    """
+    receiver = get_receiver(prepared_request.url)
+    session = get_session(receiver)
+    verify = webhook.ca_file_path or webhook.ssl_verification
+    retries = settings.WEBHOOK_RETRIES
+
+    logger.info("Sending %s request to %s", prepared_request.method, prepared_request.url)
+    with _get_receiver_semaphore(receiver), webhook_delivery_seconds.labels(receiver).time():
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = settings.WEBHOOK_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logger.info("Retrying request to %s in %s seconds (attempt %d)", prepared_request.url, delay, attempt)
+                webhook_delivery_retries.labels(receiver).inc()
+                time.sleep(delay)
+
+            try:
+                response = session.send(
+                    prepared_request,
+                    verify=verify,
+                    proxies=settings.HTTP_PROXIES,
+                    timeout=settings.WEBHOOK_TIMEOUT,
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                logger.warning("Request to %s failed: %s", prepared_request.url, e)
+                if attempt < retries:
+                    continue
+                webhook_delivery_failures.labels(receiver).inc()
+                raise
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                logger.warning("Request failed; response status %s, will retry", response.status_code)
+                continue
+            break
+
+    if response.ok:
+        logger.info("Request succeeded; response status %s", response.status_code)
+        return "Status {} returned, webhook successfully processed.".format(response.status_code)
+    else:
+        logger.warning("Request failed; response status %s: %s", response.status_code, response.content)
+        webhook_delivery_failures.labels(receiver).inc()
+        raise requests.exceptions.RequestException(
+            "Status {} returned with content '{}', webhook FAILED to process.".format(
+                response.status_code, response.content
+            )
+        )
+
+
+def deliver_webhook(webhook, context):
+    """
+    Render and send a single request for the given Webhook and template context.
+    """
+    return send_webhook_request(webhook, prepare_webhook_request(webhook, context))
+
+
+def deliver_webhooks(webhook, contexts):
+    """
+    Render one request per template context for the given Webhook, then send them concurrently.
+
+    Up to `WEBHOOK_CONCURRENCY` requests are in flight at once, subject to the per-receiver limit. Templates are
+    rendered up front in the calling thread, so only the HTTP requests themselves are sent from worker threads.
+
+    Returns:
+        (list, int): Results of the successful requests, and the number of requests which failed
+    """
+    results = []
+    failures = 0
+
+    prepared_requests = []
+    for context in contexts:
+        try:
+            prepared_requests.append(prepare_webhook_request(webhook, context))
+        except (requests.exceptions.RequestException, TemplateError, ValueError):
+            # Already logged
+            failures += 1
+
+    def _send(prepared_request):
+        try:
+            return send_webhook_request(webhook, prepared_request)
+        finally:
+            webhook_requests_pending.dec()
+
+    webhook_requests_pending.inc(len(prepared_requests))
+    max_workers = max(1, min(settings.WEBHOOK_CONCURRENCY, len(prepared_requests)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_send, prepared_request) for prepared_request in prepared_requests]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except requests.exceptions.RequestException:
+                # Already logged
+                failures += 1
+
+    return results, failures
@@ -1,50 +1,170 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.utils import timezone
 
 from nautobot.utilities.api import get_serializer_for_model
+from nautobot.utilities.caching import VersionedCache
 from nautobot.extras.models import Webhook
 from nautobot.extras.registry import registry
-from nautobot.extras.tasks import process_webhook
+from nautobot.extras.tasks import process_webhooks
 from .choices import ObjectChangeActionChoices
 
 
-def enqueue_webhooks(instance, user, request_id, action):
+def _load_webhooks(key):
     """
-    Find Webhook(s) assigned to this instance + action and enqueue them
-    to be processed
+    Load the enabled Webhooks for the given (content type ID, action) key.
     """
-    # Determine whether this type of object supports webhooks
-    app_label = instance._meta.app_label
-    model_name = instance._meta.model_name
-    if model_name not in registry["model_features"]["webhooks"].get(app_label, []):
-        return
-
-    # Retrieve any applicable Webhooks
-    content_type = ContentType.objects.get_for_model(instance)
+    content_type_id, action = key
     action_flag = {
         ObjectChangeActionChoices.ACTION_CREATE: "type_create",
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
     }[action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
-
-    if webhooks.exists():
-        # Get the Model's API serializer class and serialize the object
-        serializer_class = get_serializer_for_model(instance.__class__)
-        serializer_context = {
-            "request": None,
-        }
-        serializer = serializer_class(instance, context=serializer_context)
-
-        # Enqueue the webhooks
-        for webhook in webhooks:
+    return list(Webhook.objects.filter(content_types=content_type_id, enabled=True, **{action_flag: True}))
+
+
+# Enabled Webhooks keyed by (content type ID, action); invalidated by signal handlers when Webhooks change
+webhook_cache = VersionedCache("extras.webhook", _load_webhooks)
+
+
+def get_webhooks_for_action(content_type, action, version=None):
+    """
+    Return the list of enabled Webhooks applicable to the given ContentType and ObjectChangeActionChoices action.
+    """
+    return webhook_cache.get((content_type.pk, action), version=version)
+
+
+def serialize_for_webhook(instance):
+    """
+    Serialize the given instance with its model's REST API serializer.
+    """
+    serializer_class = get_serializer_for_model(instance.__class__)
+    serializer_context = {
+        "request": None,
+    }
+    return serializer_class(instance, context=serializer_context).data
+
+
+class WebhookEvent:
+    """
+    A single object change to be reported to one or more Webhooks.
+    """
+
+    def __init__(self, instance, username, action, webhooks):
+        self.instance = instance
+        self.username = username
+        self.action = action
+        self.webhooks = list(webhooks)
+        self.timestamp = str(timezone.now())
+        self.data = None
+
+    def serialize(self):
+        if self.data is None:
+            self.data = serialize_for_webhook(self.instance)
+        return self.data
+
+
+class WebhookQueue:
+    """
+    Collect the webhook events generated during a single request (or job, etc.) and enqueue them as one batched
+    Celery task per Webhook, rather than one task per Webhook per changed object.
+
+    Consecutive changes of the same object with the same action within the queue's lifetime (such as repeated updates
+    of an object) are coalesced into a single event, which is serialized when the queue is flushed so that it reflects
+    the final state of the object. A change with a different action (such as an update following a create) is
+    recorded as a separate event for the Webhooks applicable to that action, and the prior event is serialized at that
+    point, so that it reflects the object as of its own action. Deletion events are serialized immediately, before the
+    object is removed from the database.
+    """
+
+    # Maximum number of events to include in a single Celery task
+    batch_size = 500
+
+    def __init__(self, request_id):
+        self.request_id = request_id
+        self._events = []
+        self._pending_changes = {}  # (content type ID, object ID) -> WebhookEvent not yet serialized
+        self._webhooks = {}  # (content type ID, action) -> applicable Webhooks
+        self._version = None
+
+    def __len__(self):
+        return len(self._events)
+
+    def add(self, instance, user, action):
+        """
+        Record the given change to `instance` by `user`, if any Webhooks apply to it.
+        """
+        # Determine whether this type of object supports webhooks
+        app_label = instance._meta.app_label
+        model_name = instance._meta.model_name
+        if model_name not in registry["model_features"]["webhooks"].get(app_label, []):
+            return
+
+        # Retrieve any applicable Webhooks, checking the shared cache version once per queue
+        content_type = ContentType.objects.get_for_model(instance)
+        if (content_type.pk, action) not in self._webhooks:
+            if self._version is None:
+                self._version = webhook_cache.get_version()
+            self._webhooks[(content_type.pk, action)] = get_webhooks_for_action(
+                content_type, action, version=self._version
+            )
+        webhooks = self._webhooks[(content_type.pk, action)]
+
+        key = (content_type.pk, instance.pk)
+        pending = self._pending_changes.get(key)
+        if pending is not None:
+            if pending.action == action:
+                # Coalesce this change into the pending event, which has the same Webhooks
+                return
+            # Serialize the prior change now, as of its own action (and while the object still exists)
+            pending.serialize()
+            del self._pending_changes[key]
+
+        if webhooks:
+            event = WebhookEvent(instance, user.username, action, webhooks)
+            self._events.append(event)
+            if action == ObjectChangeActionChoices.ACTION_DELETE:
+                event.serialize()
+            else:
+                self._pending_changes[key] = event
+
+    def flush(self):
+        """
+        Serialize all collected events and enqueue them for processing.
+        """
+        events, self._events = self._events, []
+        self._pending_changes = {}
+
+        events_by_webhook = {}
+        for event in events:
+            data = event.serialize()
             args = [
-                webhook.pk,
-                serializer.data,
-                instance._meta.model_name,
-                action,
-                str(timezone.now()),
-                user.username,
-                request_id,
+                data,
+                event.instance._meta.model_name,
+                event.action,
+                event.timestamp,
+                event.username,
+                self.request_id,
             ]
-            process_webhook.apply_async(args=args)
+            for webhook in event.webhooks:
+                events_by_webhook.setdefault(webhook.pk, []).append(args)
+
+        for webhook_pk, webhook_events in events_by_webhook.items():
+            for i in range(0, len(webhook_events), self.batch_size):
+                process_webhooks.apply_async(args=[webhook_pk, webhook_events[i : i + self.batch_size]])
+
+    def close(self):
+        """
+        Flush the queue once the current transaction (if any) has been committed.
+        """
+        transaction.on_commit(self.flush)
+
+
+def enqueue_webhooks(instance, user, request_id, action):
+    """
+    Find Webhook(s) assigned to this instance + action and enqueue them
+    to be processed
+    """
+    webhook_queue = WebhookQueue(request_id)
+    webhook_queue.add(instance, user, action)
+    webhook_queue.flush()
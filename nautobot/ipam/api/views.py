@@ -1,3 +1,5 @@
+from itertools import islice
+
 from django.core.cache import cache
 from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
@@ -20,6 +22,7 @@ from nautobot.ipam.models import (
     VLANGroup,
     VRF,
 )
+from nautobot.ipam.utils import release_ip_reservations, reserve_available_ips
 from nautobot.utilities.config import get_settings_or_config
 from nautobot.utilities.utils import count_related
 from . import serializers
@@ -135,21 +138,22 @@ class PrefixViewSet(StatusViewSetMixin, CustomFieldModelViewSet):
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
 
+            # Validate Requested Prefixes' length
+            serializer = serializers.PrefixLengthSerializer(
+                data=request.data if isinstance(request.data, list) else [request.data],
+                many=True,
+                context={
+                    "request": request,
+                    "prefix": prefix,
+                },
+            )
+            serializer.is_valid(raise_exception=True)
+            requested_prefixes = serializer.validated_data
+
+            # Only hold the lock while finding and creating the new Prefix(es)
             with cache.lock("available-prefixes", blocking_timeout=5):
                 available_prefixes = prefix.get_available_prefixes()
 
-                # Validate Requested Prefixes' length
-                serializer = serializers.PrefixLengthSerializer(
-                    data=request.data if isinstance(request.data, list) else [request.data],
-                    many=True,
-                    context={
-                        "request": request,
-                        "prefix": prefix,
-                    },
-                )
-                serializer.is_valid(raise_exception=True)
-
-                requested_prefixes = serializer.validated_data
                 # Allocate prefixes to the requested objects based on availability within the parent
                 for i, requested_prefix in enumerate(requested_prefixes):
 
@@ -181,7 +185,8 @@ class PrefixViewSet(StatusViewSetMixin, CustomFieldModelViewSet):
                 # Create the new Prefix(es)
                 serializer.is_valid(raise_exception=True)
                 serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
             available_prefixes = prefix.get_available_prefixes()
@@ -214,35 +219,35 @@ class PrefixViewSet(StatusViewSetMixin, CustomFieldModelViewSet):
         returned will be equivalent to PAGINATE_COUNT. An arbitrary limit (up to MAX_PAGE_SIZE, if set) may be passed,
         however results will not be paginated.
 
-        The advisory lock decorator uses a PostgreSQL advisory lock to prevent this API from being
-        invoked in parallel, which results in a race condition where multiple insertions can occur.
+        Each IP address to be created is first reserved in the cache, which prevents concurrent requests from being
+        allocated the same address while still allowing them to proceed in parallel.
         """
         prefix = get_object_or_404(Prefix.objects.restrict(request.user), pk=pk)
 
         # Create the next available IP within the prefix
         if request.method == "POST":
 
-            with cache.lock("available-ips", blocking_timeout=5):
-
-                # Normalize to a list of objects
-                requested_ips = request.data if isinstance(request.data, list) else [request.data]
-
-                # Determine if the requested number of IPs is available
-                available_ips = prefix.get_available_ips()
-                if available_ips.size < len(requested_ips):
-                    return Response(
-                        {
-                            "detail": "An insufficient number of IP addresses are available within the prefix {} ({} "
-                            "requested, {} available)".format(prefix, len(requested_ips), len(available_ips))
-                        },
-                        status=status.HTTP_204_NO_CONTENT,
-                    )
+            # Normalize to a list of objects
+            requested_ips = request.data if isinstance(request.data, list) else [request.data]
+
+            # Reserve the requested number of available IPs. Concurrent requests reserve distinct IPs, so (unlike
+            # available prefixes) no lock needs to be held while the new IP addresses are validated and created.
+            reserved_ips = reserve_available_ips(prefix, len(requested_ips))
+            if len(reserved_ips) < len(requested_ips):
+                release_ip_reservations(prefix, reserved_ips)
+                return Response(
+                    {
+                        "detail": "An insufficient number of IP addresses are available within the prefix {} ({} "
+                        "requested, {} available)".format(prefix, len(requested_ips), len(reserved_ips))
+                    },
+                    status=status.HTTP_204_NO_CONTENT,
+                )
 
-                # Assign addresses from the list of available IPs and copy VRF assignment from the parent prefix
-                available_ips = iter(available_ips)
+            try:
+                # Assign addresses from the list of reserved IPs and copy VRF assignment from the parent prefix
                 prefix_length = prefix.prefix.prefixlen
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = "{}/{}".format(next(available_ips), prefix_length)
+                for requested_ip, reserved_ip in zip(requested_ips, reserved_ips):
+                    requested_ip["address"] = "{}/{}".format(reserved_ip, prefix_length)
                     requested_ip["vrf"] = prefix.vrf.pk if prefix.vrf else None
 
                 # Initialize the serializer with a list or a single object depending on what was requested
@@ -255,7 +260,12 @@ class PrefixViewSet(StatusViewSetMixin, CustomFieldModelViewSet):
                 # Create the new IP address(es)
                 serializer.is_valid(raise_exception=True)
                 serializer.save()
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+            finally:
+                # Once created (and committed, as API requests aren't wrapped in a transaction) the new IP addresses
+                # are no longer available anyway. Otherwise, they won't be used after all.
+                release_ip_reservations(prefix, reserved_ips)
+
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         # Determine the maximum number of IPs to return
         else:
@@ -267,11 +277,7 @@ class PrefixViewSet(StatusViewSetMixin, CustomFieldModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE"))
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(prefix.get_available_ips(), start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = list(islice(prefix.iter_available_ips(), limit if limit > 0 else None))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -39,6 +39,11 @@ IPADDRESS_ASSIGNMENT_MODELS = Q(
 IPADDRESS_MASK_LENGTH_MIN = 1
 IPADDRESS_MASK_LENGTH_MAX = 128  # IPv6
 
+# Maximum time (in seconds) for which an IP address being allocated through the REST API is reserved against allocation
+# by other requests. Reservations are normally released as soon as the allocation completes; this is a safeguard against
+# a process exiting before it can do so.
+IPADDRESS_RESERVATION_TIMEOUT = 300
+
 IPADDRESS_ROLES_NONUNIQUE = (
     # IPAddress roles which are exempt from unique address enforcement
     IPAddressRoleChoices.ROLE_ANYCAST,
@@ -5,7 +5,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import F, Q
+from django.db.models import DEFERRED, F, Q
 from django.urls import reverse
 from django.utils.functional import classproperty
 
@@ -26,7 +26,8 @@ from .constants import (
     VRF_RD_MAX_LENGTH,
 )
 from .fields import VarbinaryIPField
-from .querysets import PrefixQuerySet, AggregateQuerySet, IPAddressQuerySet
+from .querysets import PrefixQuerySet, AggregateQuerySet, IPAddressQuerySet, get_available_ranges
+from .trees import prefix_index
 from .validators import DNSValidator
 
 
@@ -521,6 +522,8 @@ class Prefix(PrimaryModel, StatusModel):
         prefix = kwargs.pop("prefix", None)
         super(Prefix, self).__init__(*args, **kwargs)
         self._deconstruct_prefix(prefix)
+        # The VRF in which the prefix index records this Prefix, unless deferred (see `PrefixIndex`)
+        self._indexed_vrf_id = self.__dict__.get("vrf_id", DEFERRED)
 
     def __str__(self):
         return str(self.prefix)
@@ -640,55 +643,98 @@ class Prefix(PrimaryModel, StatusModel):
         else:
             return IPAddress.objects.net_host_contained(self.prefix).filter(vrf=self.vrf)
 
+    def _get_usable_ip_range(self):
+        """
+        Return the first and last usable IP addresses within this prefix, as integers.
+        """
+        # IPv6, pool, or IPv4 /31-32 prefixes are fully usable
+        if self.family == 6 or self.is_pool or self.prefix_length >= 31:
+            return self.prefix.first, self.prefix.last
+        # For "normal" IPv4 prefixes, omit first and last addresses
+        return self.prefix.first + 1, self.prefix.last - 1
+
+    def _make_ip_range(self, first, last):
+        return netaddr.IPRange(netaddr.IPAddress(first, self.family), netaddr.IPAddress(last, self.family))
+
+    def iter_available_prefix_ranges(self):
+        """
+        Yield the ranges of available address space within this prefix, in ascending order, as `netaddr.IPRange`s.
+
+        Child prefixes are streamed from the database in order of network address, so callers needing only the first
+        few ranges don't have to retrieve (or hold in memory) the entire set of children.
+        """
+        used_ranges = self.get_child_prefixes().iter_address_ranges("network", "broadcast", self.family)
+        for first, last in get_available_ranges(used_ranges, self.prefix.first, self.prefix.last):
+            yield self._make_ip_range(first, last)
+
+    def iter_available_ip_ranges(self):
+        """
+        Yield the ranges of available IP addresses within this prefix, in ascending order, as `netaddr.IPRange`s.
+
+        Child IP addresses are streamed from the database in order of host address, so callers needing only the first
+        few ranges don't have to retrieve (or hold in memory) the entire set of children.
+        """
+        used_ranges = self.get_child_ips().iter_address_ranges("host", "host", self.family)
+        first, last = self._get_usable_ip_range()
+        for range_first, range_last in get_available_ranges(used_ranges, first, last):
+            yield self._make_ip_range(range_first, range_last)
+
+    def iter_available_ips(self):
+        """
+        Yield the available IP addresses within this prefix, in ascending order, as `netaddr.IPAddress`es.
+        """
+        for ip_range in self.iter_available_ip_ranges():
+            yield from ip_range
+
     def get_available_prefixes(self):
         """
         Return all available Prefixes within this prefix as an IPSet.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.get_child_prefixes()])
-        available_prefixes = prefix - child_prefixes
-
-        return available_prefixes
+        return netaddr.IPSet(self.iter_available_prefix_ranges())
 
     def get_available_ips(self):
         """
         Return all available IPs within this prefix as an IPSet.
         """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.get_child_ips()])
-        available_ips = prefix - child_ips
-
-        # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if self.family == 6 or self.is_pool or (self.family == 4 and self.prefix.prefixlen >= 31):
-            return available_ips
+        return netaddr.IPSet(self.iter_available_ip_ranges())
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
-        )
-        return available_ips
+    def _get_prefix_tree(self, ips=False):
+        """
+        Return the `PrefixTree` holding this Prefix's children (including IP addresses, if `ips` is True) from the
+        prefix index, or None if the index can't be used to answer questions about them (such as inside of a
+        transaction, or for a container in the global table, whose children may belong to any VRF).
+        """
+        if self.vrf_id is None and self.status == Prefix.STATUS_CONTAINER:
+            return None
+        if not prefix_index.is_available():
+            return None
+        return prefix_index.get_tree(self.vrf_id, self.family, ips=ips)
 
     def get_first_available_prefix(self):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
+        tree = self._get_prefix_tree()
+        if tree is not None:
+            return tree.get_first_available_prefix(self.prefix.first, self.prefix_length)
+
+        available_range = next(self.iter_available_prefix_ranges(), None)
+        if available_range is None:
             return None
-        return available_prefixes.iter_cidrs()[0]
+        return available_range.cidrs()[0]
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        tree = self._get_prefix_tree(ips=True)
+        if tree is not None:
+            first_available_ip = tree.get_first_available_ip(*self._get_usable_ip_range())
+        else:
+            first_available_ip = next(self.iter_available_ips(), None)
+        if first_available_ip is None:
             return None
-        return "{}/{}".format(next(available_ips.__iter__()), self.prefix.prefixlen)
+        return "{}/{}".format(first_available_ip, self.prefix_length)
 
     def get_utilization(self):
         """Get the child prefix size and parent size.
@@ -699,13 +745,26 @@ class Prefix(PrimaryModel, StatusModel):
             UtilizationData (namedtuple): (numerator, denominator)
         """
         if self.status == Prefix.STATUS_CONTAINER:
-            queryset = Prefix.objects.net_contained(self.prefix).filter(vrf=self.vrf)
-            child_prefixes = netaddr.IPSet([p.prefix for p in queryset])
-            return UtilizationData(numerator=child_prefixes.size, denominator=self.prefix.size)
+            tree = prefix_index.get_tree(self.vrf_id, self.family) if prefix_index.is_available() else None
+            if tree is not None:
+                child_size = tree.get_child_prefix_size(self.prefix.first, self.prefix_length)
+            else:
+                used_ranges = (
+                    Prefix.objects.net_contained(self.prefix)
+                    .filter(vrf=self.vrf)
+                    .iter_address_ranges("network", "broadcast", self.family)
+                )
+                available_ranges = get_available_ranges(used_ranges, self.prefix.first, self.prefix.last)
+                child_size = self.prefix.size - sum(last - first + 1 for first, last in available_ranges)
+            return UtilizationData(numerator=child_size, denominator=self.prefix.size)
 
         else:
-            # Compile an IPSet to avoid counting duplicate IPs
-            child_count = netaddr.IPSet([ip.address.ip for ip in self.get_child_ips()]).size
+            tree = prefix_index.get_tree(self.vrf_id, self.family, ips=True) if prefix_index.is_available() else None
+            if tree is not None:
+                child_count = tree.get_ip_count(self.prefix.first, self.prefix_length)
+            else:
+                # Count distinct hosts to avoid counting duplicate IPs
+                child_count = self.get_child_ips().order_by().values("host").distinct().count()
             prefix_size = self.prefix.size
             if self.prefix.version == 4 and self.prefix.prefixlen < 31 and not self.is_pool:
                 prefix_size -= 2
@@ -821,6 +880,8 @@ class IPAddress(PrimaryModel, StatusModel):
         address = kwargs.pop("address", None)
         super(IPAddress, self).__init__(*args, **kwargs)
         self._deconstruct_address(address)
+        # The VRF in which the prefix index records this IPAddress, unless deferred (see `PrefixIndex`)
+        self._indexed_vrf_id = self.__dict__.get("vrf_id", DEFERRED)
 
     def __str__(self):
         return str(self.address)
@@ -3,6 +3,7 @@ import uuid
 
 import netaddr
 from django.db.models import (
+    BinaryField,
     Count,
     ExpressionWrapper,
     IntegerField,
@@ -14,11 +15,37 @@ from django.db.models import (
     Value,
 )
 from django.db.models.functions import Coalesce, Length
+from django.db.models.query import ModelIterable
 
 from nautobot.ipam.constants import IPV4_BYTE_LENGTH, IPV6_BYTE_LENGTH
+from nautobot.ipam.trees import prefix_index
 from nautobot.utilities.querysets import RestrictedQuerySet
 
 
+def get_available_ranges(used_ranges, first, last):
+    """
+    Yield the (first, last) ranges of integers within the range [first, last] which aren't covered by any of the given
+    `used_ranges`.
+
+    Args:
+        used_ranges (iterable): (first, last) integer ranges, in ascending order of their first value. Ranges may
+            overlap, be nested within one another, or lie (partially) outside of [first, last].
+        first (int): First integer (e.g. IP address) of the overall range
+        last (int): Last integer of the overall range
+    """
+    candidate = first
+    for used_first, used_last in used_ranges:
+        if used_first > last:
+            break
+        if used_first > candidate:
+            yield candidate, used_first - 1
+        candidate = max(candidate, used_last + 1)
+        if candidate > last:
+            return
+    if candidate <= last:
+        yield candidate, last
+
+
 class BaseNetworkQuerySet(RestrictedQuerySet):
     """Base class for network-related querysets."""
 
@@ -33,6 +60,32 @@ class BaseNetworkQuerySet(RestrictedQuerySet):
     # Match string from "0000" to "ffff" with no trailing ":"
     RE_HEXTET = re.compile("^[a-f0-9]{4}$")
 
+    def iter_address_ranges(self, first_field, last_field, family):
+        """
+        Yield the (first, last) address range of each object as a pair of integers, in ascending order of first address.
+
+        Objects are streamed from the database with their addresses read as raw bytes, so no model instances or
+        `netaddr` objects are created. Objects whose addresses don't belong to the given IP family are skipped.
+
+        Args:
+            first_field (str): Name of the field holding the first address of each range (e.g. "network" or "host")
+            last_field (str): Name of the field holding the last address of each range (e.g. "broadcast" or "host")
+            family (int): IP family (4 or 6)
+        """
+        byte_length = self.ip_family_map[family]
+        queryset = (
+            self.order_by(first_field)
+            .annotate(
+                range_first=ExpressionWrapper(F(first_field), output_field=BinaryField()),
+                range_last=ExpressionWrapper(F(last_field), output_field=BinaryField()),
+            )
+            .values_list("range_first", "range_last")
+        )
+        for range_first, range_last in queryset.iterator():
+            if len(range_first) != byte_length:
+                continue
+            yield int.from_bytes(range_first, "big"), int.from_bytes(range_last, "big")
+
     @staticmethod
     def _get_last_ip(network):
         """
@@ -236,13 +289,60 @@ class AggregateQuerySet(NetworkQuerySet):
     """Queryset for `Aggregate` objects."""
 
 
+class PrefixTreeIterable(ModelIterable):
+    """
+    Iterable yielding Prefix instances with `parents` and `children` counts looked up from the prefix index.
+    """
+
+    def __iter__(self):
+        # VRF ID -> version of its prefix index
+        versions = {}
+        for prefix in super().__iter__():
+            if prefix.vrf_id not in versions:
+                versions[prefix.vrf_id] = prefix_index.get_version(prefix.vrf_id)
+            network = int(netaddr.IPAddress(prefix.network))
+            tree = prefix_index.get_tree(prefix.vrf_id, prefix.family, version=versions[prefix.vrf_id])
+            prefix.parents = tree.get_parent_count(network, prefix.prefix_length)
+            prefix.children = tree.get_child_count(network, prefix.prefix_length)
+            yield prefix
+
+
 class PrefixQuerySet(NetworkQuerySet):
     """Queryset for `Prefix` objects."""
 
+    def order_by(self, *field_names):
+        """
+        Order the queryset, using database annotations for the `parents` and `children` counts of `annotate_tree()` if
+        they're among the given fields.
+        """
+        if self._iterable_class is PrefixTreeIterable and any(
+            isinstance(field_name, str) and field_name.lstrip("-") in ("parents", "children")
+            for field_name in field_names
+        ):
+            queryset = self._chain()
+            queryset._iterable_class = ModelIterable
+            return queryset._annotate_tree_subqueries().order_by(*field_names)
+        return super().order_by(*field_names)
+
     def annotate_tree(self):
         """
         Annotate the number of parent and child prefixes for each Prefix.
 
+        Outside of a database transaction, the counts are looked up from the in-memory prefix index as the Prefixes are
+        retrieved (so they cannot be used to filter the queryset, and ordering by them falls back to the subqueries
+        below). Otherwise they are calculated by the database, using subqueries.
+        """
+        if prefix_index.is_available():
+            queryset = self._chain()
+            queryset._iterable_class = PrefixTreeIterable
+            return queryset
+
+        return self._annotate_tree_subqueries()
+
+    def _annotate_tree_subqueries(self):
+        """
+        Annotate the number of parent and child prefixes for each Prefix, as calculated by the database.
+
         The UUID being used is fake for purposes of satisfying the COALESCE condition.
         """
         # The COALESCE needs a valid, non-zero, non-null UUID value to do the comparison.
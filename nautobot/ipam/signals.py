@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from .models import IPAddress, Prefix
+from .trees import prefix_index
+
+
+#
+# Prefix index maintenance
+#
+
+
+@receiver(post_save, sender=Prefix)
+def update_prefix_index_on_prefix_save(instance, **kwargs):
+    prefix_index.prefix_saved(instance)
+
+
+@receiver(post_delete, sender=Prefix)
+def update_prefix_index_on_prefix_delete(instance, **kwargs):
+    prefix_index.prefix_deleted(instance)
+
+
+@receiver(post_save, sender=IPAddress)
+def update_prefix_index_on_ipaddress_save(instance, **kwargs):
+    prefix_index.ip_address_saved(instance)
+
+
+@receiver(post_delete, sender=IPAddress)
+def update_prefix_index_on_ipaddress_delete(instance, **kwargs):
+    prefix_index.ip_address_deleted(instance)
+
+
+# Migrations (and the database flushes performed between tests) may change IPAM data without sending model signals
+post_migrate.connect(prefix_index.invalidate)
@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from django.db import connection
+from django.test import tag
+from django.urls import reverse
+import netaddr
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from nautobot.ipam.models import IPAddress, Prefix
+from nautobot.utilities.testing.api import APITransactionTestCase
+
+
+@tag("performance")
+class AvailableIPAllocationPerformanceTestCase(APITransactionTestCase):
+    """Measure the throughput of concurrent requests to allocate available IP addresses through the REST API."""
+
+    # Number of concurrent clients, and of requests made by each
+    clients = 50
+    requests_per_client = 4
+
+    def test_concurrent_allocation(self):
+        prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/22"), is_pool=True)
+        url = reverse("ipam-api:prefix-available-ips", kwargs={"pk": prefix.pk})
+
+        def allocate(client_id):
+            # The test client isn't thread-safe (it keeps cookies and session state), so each thread has its own
+            client = APIClient()
+            try:
+                return [
+                    client.post(
+                        url, {"description": f"Client {client_id}", "status": "active"}, format="json", **self.header
+                    ).status_code
+                    for _ in range(self.requests_per_client)
+                ]
+            finally:
+                # Each thread uses its own database connection, which must be closed explicitly
+                connection.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.clients) as executor:
+            results = list(executor.map(allocate, range(self.clients)))
+        elapsed = time.perf_counter() - start
+
+        total = self.clients * self.requests_per_client
+        print(f"\n{total} IP addresses allocated by {self.clients} clients: {total / elapsed:.1f} allocations/s")
+        for client_id, codes in enumerate(results):
+            self.assertEqual(codes, [status.HTTP_201_CREATED] * self.requests_per_client, f"Client {client_id}")
+        hosts = list(IPAddress.objects.values_list("host", flat=True))
+        self.assertEqual(len(hosts), total)
+        self.assertEqual(len(set(hosts)), total, "Duplicate IPs should not exist")
@@ -0,0 +1,63 @@
+from itertools import islice
+
+import netaddr
+
+from nautobot.extras.models import Status
+from nautobot.ipam.models import IPAddress, Prefix
+from nautobot.utilities.testing.performance import PerformanceTestCase
+
+
+def get_available_ips_with_ipset(prefix):
+    """The previous, IPSet-based implementation of `Prefix.get_available_ips()`."""
+    available_ips = netaddr.IPSet(prefix.prefix) - netaddr.IPSet([ip.address.ip for ip in prefix.get_child_ips()])
+    if prefix.family == 4 and prefix.prefix_length < 31 and not prefix.is_pool:
+        available_ips -= netaddr.IPSet([netaddr.IPAddress(prefix.prefix.first), netaddr.IPAddress(prefix.prefix.last)])
+    return available_ips
+
+
+def get_available_prefixes_with_ipset(prefix):
+    """The previous, IPSet-based implementation of `Prefix.get_available_prefixes()`."""
+    return netaddr.IPSet(prefix.prefix) - netaddr.IPSet([child.prefix for child in prefix.get_child_prefixes()])
+
+
+class AvailableAddressPerformanceTestCase(PerformanceTestCase):
+    """Compare finding available IPs and prefixes from sorted address ranges against building `netaddr.IPSet`s."""
+
+    @classmethod
+    def setUpTestData(cls):
+        container = Status.objects.get_for_model(Prefix).get(slug="container")
+
+        # A /16 pool with 60,000 assigned IP addresses
+        cls.pool = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"), is_pool=True)
+        IPAddress.objects.bulk_create(
+            [IPAddress(address=netaddr.IPNetwork(f"10.0.{i // 256}.{i % 256}/16")) for i in range(60000)],
+            batch_size=1000,
+        )
+
+        # A /16 container with every other /28 assigned
+        cls.container = Prefix.objects.create(prefix=netaddr.IPNetwork("10.1.0.0/16"), status=container)
+        Prefix.objects.bulk_create(
+            [Prefix(prefix=netaddr.IPNetwork(f"10.1.{i // 16}.{(i % 16) * 16}/28")) for i in range(0, 4096, 2)],
+            batch_size=1000,
+        )
+
+    def test_first_available_ips(self):
+        self.assertFasterThan(
+            "First 50 available IPs",
+            lambda: list(islice(get_available_ips_with_ipset(self.pool), 50)),
+            lambda: list(islice(self.pool.iter_available_ips(), 50)),
+        )
+
+    def test_available_ips(self):
+        self.assertFasterThan(
+            "All available IPs",
+            lambda: get_available_ips_with_ipset(self.pool),
+            self.pool.get_available_ips,
+        )
+
+    def test_available_prefixes(self):
+        self.assertFasterThan(
+            "All available prefixes",
+            lambda: get_available_prefixes_with_ipset(self.container),
+            self.container.get_available_prefixes,
+        )
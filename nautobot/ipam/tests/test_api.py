@@ -408,6 +408,25 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_201_CREATED)
         self.assertEqual(len(response.data), 8)
 
+    def test_create_available_ip_after_failure(self):
+        """
+        Test that IP addresses reserved by a failed request are available to subsequent requests.
+        """
+        prefix = Prefix.objects.create(prefix=IPNetwork("192.0.2.0/30"), is_pool=True, status=self.status_active)
+        url = reverse("ipam-api:prefix-available-ips", kwargs={"pk": prefix.pk})
+        self.add_permissions("ipam.view_prefix", "ipam.add_ipaddress", "extras.view_status")
+
+        # Try to create two IPs with an invalid status
+        data = [{"description": f"Test IP {i}", "status": "invalid"} for i in range(1, 3)]
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        # Create all four available IPs
+        data = [{"description": f"Test IP {i}", "status": "active"} for i in range(1, 5)]
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual([ip["address"] for ip in response.data], [f"192.0.2.{i}/30" for i in range(4)])
+
 
 class ParallelPrefixTest(APITransactionTestCase):
     """
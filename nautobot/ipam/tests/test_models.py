@@ -1,3 +1,4 @@
+from itertools import islice
 from unittest import skipIf
 
 import netaddr
@@ -267,6 +268,37 @@ class TestPrefix(TestCase):
 
         self.assertEqual(available_ips, missing_ips)
 
+    def test_iter_available_ip_ranges(self):
+
+        parent_prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/24"))
+        IPAddress.objects.bulk_create(
+            (
+                IPAddress(address=netaddr.IPNetwork("10.0.0.0/24")),
+                IPAddress(address=netaddr.IPNetwork("10.0.0.2/24")),
+                IPAddress(address=netaddr.IPNetwork("10.0.0.2/32")),
+                IPAddress(address=netaddr.IPNetwork("10.0.0.3/24")),
+                IPAddress(address=netaddr.IPNetwork("10.0.0.100/24")),
+                IPAddress(address=netaddr.IPNetwork("10.0.1.1/24")),  # Outside of the parent prefix
+            )
+        )
+        self.assertEqual(
+            list(parent_prefix.iter_available_ip_ranges()),
+            [
+                netaddr.IPRange("10.0.0.1", "10.0.0.1"),
+                netaddr.IPRange("10.0.0.4", "10.0.0.99"),
+                netaddr.IPRange("10.0.0.101", "10.0.0.254"),
+            ],
+        )
+        self.assertEqual(
+            [str(ip) for ip in islice(parent_prefix.iter_available_ips(), 3)], ["10.0.0.1", "10.0.0.4", "10.0.0.5"]
+        )
+
+        parent_prefix.is_pool = True
+        self.assertEqual(next(parent_prefix.iter_available_ip_ranges()), netaddr.IPRange("10.0.0.1", "10.0.0.1"))
+        self.assertEqual(
+            list(parent_prefix.iter_available_ip_ranges())[-1], netaddr.IPRange("10.0.0.101", "10.0.0.255")
+        )
+
     def test_get_first_available_prefix(self):
 
         prefixes = Prefix.objects.bulk_create(
@@ -1,9 +1,22 @@
 import netaddr
 
 from nautobot.ipam.models import Prefix, Aggregate, IPAddress, RIR
+from nautobot.ipam.querysets import get_available_ranges
 from nautobot.utilities.testing import TestCase
 
 
+class GetAvailableRangesTestCase(TestCase):
+    def test_get_available_ranges(self):
+        self.assertEqual(list(get_available_ranges([], 0, 255)), [(0, 255)])
+        self.assertEqual(list(get_available_ranges([(0, 255)], 0, 255)), [])
+        self.assertEqual(
+            list(get_available_ranges([(2, 2), (2, 2), (4, 7), (5, 6), (10, 20)], 1, 15)),
+            [(1, 1), (3, 3), (8, 9)],
+        )
+        # Ranges extending beyond the overall range
+        self.assertEqual(list(get_available_ranges([(0, 3), (9, 20)], 1, 10)), [(4, 8)])
+
+
 class AggregateQuerysetTestCase(TestCase):
     queryset = Aggregate.objects.all()
 
@@ -0,0 +1,263 @@
+import random
+import threading
+from unittest import mock
+
+import netaddr
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.query import ModelIterable
+from django.test import override_settings, SimpleTestCase
+from django.urls import reverse
+
+from nautobot.extras.models import Status
+from nautobot.ipam.models import IPAddress, Prefix, VRF
+from nautobot.ipam.querysets import PrefixTreeIterable
+from nautobot.ipam.trees import PrefixTree, prefix_index
+from nautobot.utilities.testing import TransactionTestCase
+
+
+# Use the proper swappable User model
+User = get_user_model()
+
+
+class PrefixTreeTestCase(SimpleTestCase):
+    """Tests for `nautobot.ipam.trees.PrefixTree`, checked against equivalent `netaddr` set operations."""
+
+    def setUp(self):
+        self.tree = PrefixTree(4)
+        self.prefixes = {}
+        self.ips = {}
+
+        random.seed(5)
+        for pk in range(200):
+            network = netaddr.IPNetwork(
+                "10.{}.{}.{}/{}".format(
+                    random.randint(0, 3), random.randint(0, 255), random.randint(0, 255), random.randint(16, 30)
+                )
+            ).cidr
+            self.prefixes[pk] = network
+            self.tree.add_prefix(pk, network.first, network.prefixlen)
+        for pk in range(500):
+            host = netaddr.IPAddress(
+                "10.{}.{}.{}".format(random.randint(0, 3), random.randint(0, 255), random.randint(0, 255))
+            )
+            self.ips[pk] = host
+            self.tree.add_ip(pk, int(host))
+
+    def assertTreeMatches(self, *networks):
+        for network in networks:
+            children = [prefix for prefix in self.prefixes.values() if prefix in network and prefix != network]
+            parents = [prefix for prefix in self.prefixes.values() if network in prefix and prefix != network]
+            hosts = netaddr.IPSet(host for host in self.ips.values() if host in network)
+
+            self.assertEqual(self.tree.get_parent_count(network.first, network.prefixlen), len(parents))
+            self.assertEqual(self.tree.get_child_count(network.first, network.prefixlen), len(children))
+            self.assertEqual(
+                self.tree.get_child_prefix_size(network.first, network.prefixlen), netaddr.IPSet(children).size
+            )
+            self.assertEqual(self.tree.get_ip_count(network.first, network.prefixlen), hosts.size)
+
+            available_prefixes = netaddr.IPSet(network) - netaddr.IPSet(children)
+            self.assertEqual(
+                self.tree.get_first_available_prefix(network.first, network.prefixlen),
+                available_prefixes.iter_cidrs()[0] if available_prefixes else None,
+            )
+            available_ips = netaddr.IPSet(network) - hosts
+            self.assertEqual(
+                self.tree.get_first_available_ip(network.first, network.last),
+                next(iter(available_ips)) if available_ips else None,
+            )
+
+    def test_queries(self):
+        self.assertTreeMatches(
+            netaddr.IPNetwork("10.0.0.0/8"),
+            netaddr.IPNetwork("10.1.0.0/16"),
+            netaddr.IPNetwork("10.3.128.0/17"),
+            netaddr.IPNetwork("192.0.2.0/24"),
+            *list(self.prefixes.values())[:50],
+        )
+
+    def test_removal(self):
+        for pk in list(self.prefixes)[::2]:
+            network = self.prefixes.pop(pk)
+            self.tree.remove_prefix(pk, network.first, network.prefixlen)
+        for pk in list(self.ips)[::2]:
+            self.tree.remove_ip(pk, int(self.ips.pop(pk)))
+
+        self.assertTreeMatches(netaddr.IPNetwork("10.0.0.0/8"), *list(self.prefixes.values())[:50])
+
+        for pk, network in self.prefixes.items():
+            self.tree.remove_prefix(pk, network.first, network.prefixlen)
+        for pk, host in self.ips.items():
+            self.tree.remove_ip(pk, int(host))
+
+        self.assertEqual(self.tree.root.children, [None, None])
+        self.assertEqual(self.tree.root.prefix_count, 0)
+        self.assertEqual(self.tree.root.ip_count, 0)
+        self.assertEqual(self.tree.root.covered, 0)
+
+    def test_full(self):
+        tree = PrefixTree(6)
+        network = netaddr.IPNetwork("2001:db8::/126")
+        tree.add_prefix(1, network.first, 127)
+        tree.add_prefix(2, network.first + 2, 127)
+        for host in range(network.first, network.last + 1):
+            tree.add_ip(host, host)
+
+        self.assertEqual(tree.get_child_prefix_size(network.first, network.prefixlen), 4)
+        self.assertIsNone(tree.get_first_available_prefix(network.first, network.prefixlen))
+        self.assertIsNone(tree.get_first_available_ip(network.first, network.last))
+
+
+class PrefixIndexTestCase(TransactionTestCase):
+    """
+    Tests for `nautobot.ipam.trees.prefix_index`, which isn't used inside of database transactions which have changed
+    Prefixes or IP addresses.
+    """
+
+    def setUp(self):
+        super().setUp()
+        prefix_index.invalidate()
+        self.vrf = VRF.objects.create(name="VRF 1")
+
+    def test_annotate_tree(self):
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.0.0/16"))
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.1.0/24"))
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.3.0/24"))
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.3.192/28"))
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.3.0/24"), vrf=self.vrf)
+
+        # Load the index, then check that subsequent changes are reflected in it
+        self.assertEqual(Prefix.objects.annotate_tree().get(prefix="192.168.3.0/24", vrf=None).parents, 1)
+        prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.3.224/28"))
+
+        queryset = Prefix.objects.annotate_tree()
+        self.assertEqual(queryset.get(prefix="192.168.0.0/16").parents, 0)
+        self.assertEqual(queryset.get(prefix="192.168.0.0/16").children, 4)
+        self.assertEqual(queryset.get(prefix="192.168.3.0/24", vrf=None).parents, 1)
+        self.assertEqual(queryset.get(prefix="192.168.3.0/24", vrf=None).children, 2)
+        self.assertEqual(queryset.get(prefix="192.168.3.0/24", vrf=self.vrf).parents, 0)
+        self.assertEqual(queryset.get(prefix="192.168.3.224/28").parents, 2)
+
+        prefix.prefix = netaddr.IPNetwork("192.168.2.0/24")
+        prefix.save()
+        self.assertEqual(queryset.get(prefix="192.168.3.0/24", vrf=None).children, 1)
+        self.assertEqual(queryset.get(prefix="192.168.2.0/24").parents, 1)
+
+        prefix.delete()
+        self.assertEqual(queryset.get(prefix="192.168.0.0/16").children, 3)
+
+    def test_get_first_available_and_utilization(self):
+        container = Status.objects.get_for_model(Prefix).get(slug="container")
+        parent = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"), vrf=self.vrf, status=container)
+        for i in range(3):
+            Prefix.objects.create(prefix=netaddr.IPNetwork(f"10.0.{i}.0/24"), vrf=self.vrf)
+        prefix = Prefix.objects.get(prefix="10.0.0.0/24")
+        for i in range(1, 4):
+            IPAddress.objects.create(address=netaddr.IPNetwork(f"10.0.0.{i}/24"), vrf=self.vrf)
+        IPAddress.objects.create(address=netaddr.IPNetwork("10.0.0.4/24"))  # Global table
+
+        self.assertEqual(parent.get_first_available_prefix(), netaddr.IPNetwork("10.0.3.0/24"))
+        self.assertEqual(parent.get_utilization(), (768, 65536))
+        self.assertEqual(prefix.get_first_available_ip(), "10.0.0.4/24")
+        self.assertEqual(prefix.get_utilization(), (3, 254))
+
+        Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.3.0/24"), vrf=self.vrf)
+        IPAddress.objects.create(address=netaddr.IPNetwork("10.0.0.4/24"), vrf=self.vrf)
+        self.assertEqual(parent.get_first_available_prefix(), netaddr.IPNetwork("10.0.4.0/22"))
+        self.assertEqual(parent.get_utilization(), (1024, 65536))
+        self.assertEqual(prefix.get_first_available_ip(), "10.0.0.5/24")
+        self.assertEqual(prefix.get_utilization(), (4, 254))
+
+    def test_index_loaded_per_vrf(self):
+        Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"))
+        prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"), vrf=self.vrf)
+        IPAddress.objects.create(address=netaddr.IPNetwork("10.0.0.1/16"), vrf=self.vrf)
+
+        with mock.patch.object(prefix_index, "_load_vrf", wraps=prefix_index._load_vrf) as load_vrf:
+            with mock.patch.object(prefix_index, "_load_ips", wraps=prefix_index._load_ips) as load_ips:
+                # IP addresses aren't needed for the prefix hierarchy
+                self.assertEqual([p.parents for p in Prefix.objects.annotate_tree()], [0, 0])
+                self.assertEqual(load_vrf.call_count, 2)
+                load_ips.assert_not_called()
+
+                # A change to one VRF made by another process only causes that VRF to be reloaded
+                cache.incr(prefix_index._get_version_key(self.vrf.pk))
+                self.assertEqual([p.parents for p in Prefix.objects.annotate_tree()], [0, 0])
+                self.assertEqual(load_vrf.call_count, 3)
+                self.assertEqual(load_vrf.call_args[0][0], self.vrf.pk)
+
+                self.assertEqual(prefix.get_utilization(), (1, 65534))
+                load_ips.assert_called_once()
+
+    def test_prefix_moved_between_vrfs(self):
+        prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"), vrf=self.vrf)
+        Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/24"))
+        self.assertEqual(Prefix.objects.annotate_tree().get(prefix="10.0.0.0/24").parents, 0)
+        self.assertEqual(prefix_index.get_tree(self.vrf.pk, 4).get_child_count(prefix.prefix.first, 8), 1)
+
+        prefix.vrf = None
+        prefix.save()
+        self.assertEqual(Prefix.objects.annotate_tree().get(prefix="10.0.0.0/24").parents, 1)
+        self.assertEqual(prefix_index.get_tree(self.vrf.pk, 4).get_child_count(prefix.prefix.first, 8), 0)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_prefix_list_ordered_by_children(self):
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.0.0/16"))
+        Prefix.objects.create(prefix=netaddr.IPNetwork("192.168.1.0/24"))
+
+        # Ordering by the counts of the index falls back to calculating them in the database
+        queryset = Prefix.objects.annotate_tree()
+        self.assertEqual([p.children for p in queryset.order_by("-children")], [1, 0])
+        self.assertEqual([p.children for p in queryset.order_by("children")], [0, 1])
+
+        self.client.force_login(User.objects.create_user(username="testuser"))
+        response = self.client.get(reverse("ipam:prefix_list") + "?sort=-children")
+        self.assertEqual(response.status_code, 200)
+
+    def test_index_used_in_transaction_without_changes(self):
+        Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"))
+
+        with transaction.atomic():
+            # A transaction which hasn't changed any Prefixes sees the same data in the index as in the database
+            self.assertTrue(prefix_index.is_available())
+            queryset = Prefix.objects.annotate_tree()
+            self.assertIs(queryset._iterable_class, PrefixTreeIterable)
+            self.assertEqual(queryset.get().children, 0)
+
+            # Changes rolled back to a savepoint don't affect the index
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/24"))
+                    self.assertFalse(prefix_index.is_available())
+                    raise RuntimeError()
+            self.assertTrue(prefix_index.is_available())
+
+            # Once the transaction has changed a Prefix, the counts are calculated by the database until it commits
+            Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.1.0/24"))
+            self.assertFalse(prefix_index.is_available())
+            queryset = Prefix.objects.annotate_tree()
+            self.assertIs(queryset._iterable_class, ModelIterable)
+            self.assertEqual(queryset.get(prefix="10.0.0.0/16").children, 1)
+
+        self.assertTrue(prefix_index.is_available())
+        self.assertEqual(Prefix.objects.annotate_tree().get(prefix="10.0.0.0/16").children, 1)
+
+    def test_lookups_wait_for_changes(self):
+        prefix = Prefix.objects.create(prefix=netaddr.IPNetwork("10.0.0.0/16"))
+        tree = prefix_index.get_tree(None, 4)
+        results = []
+
+        def lookup():
+            results.append(tree.get_child_count(prefix.prefix.first, prefix.prefix_length))
+
+        # Lookups by other threads wait while a change is being applied to the index
+        with prefix_index._lock:
+            thread = threading.Thread(target=lookup)
+            thread.start()
+            thread.join(timeout=0.5)
+            self.assertTrue(thread.is_alive())
+            tree.add_prefix("child", int(netaddr.IPAddress("10.0.1.0")), 24)
+        thread.join()
+        self.assertEqual(results, [1])
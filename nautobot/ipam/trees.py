@@ -0,0 +1,551 @@
+import functools
+import random
+import threading
+import uuid
+
+import netaddr
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DEFERRED
+
+
+class _Node:
+    """
+    A node of a `PrefixTree`, representing the CIDR block `network`/`prefix_length`.
+
+    Nodes exist only for blocks which have Prefixes or IP addresses recorded against them, and for the branch points
+    between such blocks, so the depth of the tree is bounded by the address length rather than the number of entries.
+    """
+
+    __slots__ = ("network", "prefix_length", "children", "prefixes", "ips", "prefix_count", "ip_count", "covered")
+
+    def __init__(self, network, prefix_length):
+        self.network = network
+        self.prefix_length = prefix_length
+        self.children = [None, None]
+        # PKs of the Prefixes equal to this block
+        self.prefixes = set()
+        # PKs of the IPAddresses whose host is this block (only for host-length blocks)
+        self.ips = set()
+        # Number of Prefixes in this subtree
+        self.prefix_count = 0
+        # Number of distinct IP hosts in this subtree
+        self.ip_count = 0
+        # Number of addresses in this subtree which are covered by one or more Prefixes
+        self.covered = 0
+
+
+def _locked(method):
+    """
+    Decorate a public method of `PrefixTree` to hold the tree's lock, so that lookups never see a change in progress.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class PrefixTree:
+    """
+    A path-compressed binary (Patricia) trie of the Prefixes and IP addresses of a single VRF and IP family.
+
+    Each node keeps aggregate counts for its subtree, so that the number of parents or children of a Prefix, its
+    utilization, and its first available child prefix or IP address can be determined in time proportional to the
+    prefix length, regardless of the number of Prefixes and IP addresses in the tree.
+
+    Networks are given as integers; the tree does not query the database. All of its public methods hold `lock` (a
+    reentrant lock, which may be shared with other trees), as a tree may be shared by the threads of a process.
+    """
+
+    def __init__(self, family, lock=None):
+        self.family = family
+        self.max_length = 32 if family == 4 else 128
+        self.root = _Node(0, 0)
+        self.lock = lock if lock is not None else threading.RLock()
+
+    def _size(self, prefix_length):
+        return 1 << (self.max_length - prefix_length)
+
+    def _mask(self, network, prefix_length):
+        return network & ~(self._size(prefix_length) - 1)
+
+    def _bit(self, network, position):
+        """Return the bit of `network` at the given position, 0 being the most significant bit."""
+        return (network >> (self.max_length - 1 - position)) & 1
+
+    def _covers(self, node, network, prefix_length):
+        """Return True if the given node's block contains (or is equal to) the given block."""
+        return node.prefix_length <= prefix_length and self._mask(network, node.prefix_length) == node.network
+
+    def _get_path(self, network, prefix_length, create=False):
+        """
+        Return the list of nodes from the root to the node for the given block, inclusive.
+
+        If there is no node for the block, one is created if `create` is True, otherwise None is returned.
+        """
+        node = self.root
+        path = [node]
+        while node.prefix_length < prefix_length:
+            bit = self._bit(network, node.prefix_length)
+            child = node.children[bit]
+            if child is None:
+                if not create:
+                    return None
+                child = _Node(network, prefix_length)
+                node.children[bit] = child
+            elif not self._covers(child, network, prefix_length):
+                if not create:
+                    return None
+                # Split the edge to the existing child with a new node at the longest common prefix of the two
+                common_length = min(
+                    child.prefix_length,
+                    prefix_length,
+                    self.max_length - (child.network ^ network).bit_length(),
+                )
+                branch = _Node(self._mask(network, common_length), common_length)
+                branch.children[self._bit(child.network, common_length)] = child
+                node.children[bit] = branch
+                child = branch
+            node = child
+            path.append(node)
+        return path
+
+    def _update(self, path):
+        """Recalculate the aggregate counts of the given nodes, deepest first."""
+        for node in reversed(path):
+            children = [child for child in node.children if child is not None]
+            node.prefix_count = len(node.prefixes) + sum(child.prefix_count for child in children)
+            node.ip_count = (1 if node.ips else 0) + sum(child.ip_count for child in children)
+            if node.prefixes:
+                node.covered = self._size(node.prefix_length)
+            else:
+                node.covered = sum(child.covered for child in children)
+
+    def _prune(self, path):
+        """Remove any nodes at the end of the given path which are no longer needed."""
+        while len(path) > 1:
+            node, parent = path[-1], path[-2]
+            children = [child for child in node.children if child is not None]
+            if node.prefixes or node.ips or len(children) == 2:
+                break
+            parent.children[self._bit(node.network, parent.prefix_length)] = children[0] if children else None
+            path.pop()
+
+    def _add(self, attr, pk, network, prefix_length, update):
+        path = self._get_path(network, prefix_length, create=True)
+        getattr(path[-1], attr).add(pk)
+        if update:
+            self._update(path)
+
+    def _remove(self, attr, pk, network, prefix_length):
+        path = self._get_path(network, prefix_length)
+        if path is None:
+            return
+        getattr(path[-1], attr).discard(pk)
+        self._prune(path)
+        self._update(path)
+
+    @_locked
+    def add_prefix(self, pk, network, prefix_length, update=True):
+        """
+        Add the Prefix with the given PK to the tree.
+
+        When adding many entries at once, pass `update=False` and call `recalculate()` afterwards.
+        """
+        self._add("prefixes", pk, network, prefix_length, update)
+
+    @_locked
+    def remove_prefix(self, pk, network, prefix_length):
+        self._remove("prefixes", pk, network, prefix_length)
+
+    @_locked
+    def add_ip(self, pk, host, update=True):
+        """
+        Add the IPAddress with the given PK to the tree.
+
+        When adding many entries at once, pass `update=False` and call `recalculate()` afterwards.
+        """
+        self._add("ips", pk, host, self.max_length, update)
+
+    @_locked
+    def remove_ip(self, pk, host):
+        self._remove("ips", pk, host, self.max_length)
+
+    @_locked
+    def recalculate(self):
+        """Recalculate the aggregate counts of all nodes."""
+        nodes = [self.root]
+        for node in nodes:
+            nodes.extend(child for child in node.children if child is not None)
+        # Parents precede their children in the list
+        self._update(nodes)
+
+    def _get_subtree(self, network, prefix_length):
+        """Return the topmost node equal to or within the given block, or None if the block is empty."""
+        node = self.root
+        while node is not None:
+            if node.prefix_length >= prefix_length:
+                return node if self._mask(node.network, prefix_length) == network else None
+            if not self._covers(node, network, prefix_length):
+                return None
+            node = node.children[self._bit(network, node.prefix_length)]
+        return None
+
+    @_locked
+    def get_parent_count(self, network, prefix_length):
+        """
+        Return the number of Prefixes which contain the given block (excluding any equal to it).
+        """
+        count = 0
+        node = self.root
+        while node is not None and node.prefix_length < prefix_length and self._covers(node, network, prefix_length):
+            count += len(node.prefixes)
+            node = node.children[self._bit(network, node.prefix_length)]
+        return count
+
+    @_locked
+    def get_child_count(self, network, prefix_length):
+        """
+        Return the number of Prefixes within the given block (excluding any equal to it).
+        """
+        node = self._get_subtree(self._mask(network, prefix_length), prefix_length)
+        if node is None:
+            return 0
+        if node.prefix_length == prefix_length:
+            return node.prefix_count - len(node.prefixes)
+        return node.prefix_count
+
+    @_locked
+    def get_child_prefix_size(self, network, prefix_length):
+        """
+        Return the number of addresses in the given block which are covered by the Prefixes within it.
+        """
+        node = self._get_subtree(self._mask(network, prefix_length), prefix_length)
+        if node is None:
+            return 0
+        if node.prefix_length == prefix_length:
+            return sum(child.covered for child in node.children if child is not None)
+        return node.covered
+
+    @_locked
+    def get_ip_count(self, network, prefix_length):
+        """
+        Return the number of distinct IP hosts within the given block.
+        """
+        node = self._get_subtree(self._mask(network, prefix_length), prefix_length)
+        if node is None:
+            return 0
+        return node.ip_count
+
+    def _iter_used_ranges(self, node, first, last, prefix_length, ips):
+        """
+        Yield the (first, last) address ranges within the given node's subtree which overlap the range [first, last]
+        and are used by IP addresses (if `ips`) or by Prefixes longer than `prefix_length`, in ascending order.
+        """
+        size = self._size(node.prefix_length)
+        if node.network + size - 1 < first or node.network > last:
+            return
+        if ips:
+            if not node.ip_count:
+                return
+            full = node.ip_count == size
+        else:
+            if not node.covered:
+                return
+            full = node.prefix_length > prefix_length and node.covered == size
+        if full:
+            yield node.network, node.network + size - 1
+            return
+        for child in node.children:
+            if child is not None:
+                yield from self._iter_used_ranges(child, first, last, prefix_length, ips)
+
+    def _get_first_gap(self, first, last, prefix_length, ips):
+        """
+        Return the first (first, last) range of unused addresses in the range [first, last], or None.
+        """
+        candidate = first
+        for used_first, used_last in self._iter_used_ranges(self.root, first, last, prefix_length, ips):
+            if used_first > candidate:
+                return candidate, used_first - 1
+            candidate = max(candidate, used_last + 1)
+            if candidate > last:
+                return None
+        return candidate, last
+
+    @_locked
+    def get_first_available_prefix(self, network, prefix_length):
+        """
+        Return the first available child prefix within the given block as a `netaddr.IPNetwork`, or None.
+        """
+        network = self._mask(network, prefix_length)
+        gap = self._get_first_gap(network, network + self._size(prefix_length) - 1, prefix_length, ips=False)
+        if gap is None:
+            return None
+        return netaddr.iprange_to_cidrs(
+            netaddr.IPAddress(gap[0], version=self.family), netaddr.IPAddress(gap[1], version=self.family)
+        )[0]
+
+    @_locked
+    def get_first_available_ip(self, first, last):
+        """
+        Return the first address in the range [first, last] which has no IP address, as a `netaddr.IPAddress`, or None.
+        """
+        if first > last:
+            return None
+        gap = self._get_first_gap(first, last, self.max_length, ips=True)
+        if gap is None:
+            return None
+        return netaddr.IPAddress(gap[0], version=self.family)
+
+
+class _VRFIndex:
+    """
+    The Prefixes and (once loaded) the IP addresses of a single VRF or of the global table, as one `PrefixTree` per IP
+    family, sharing the given lock.
+    """
+
+    def __init__(self, version, lock):
+        self.version = version
+        self.trees = {4: PrefixTree(4, lock), 6: PrefixTree(6, lock)}
+        # Prefix PK -> (family, network, prefix length)
+        self.prefixes = {}
+        # IPAddress PK -> (family, host), or None until the IP addresses have been loaded
+        self.ips = None
+
+    def add_prefix(self, pk, network, prefix_length, update=True):
+        self.prefixes[pk] = (network.version, int(network), prefix_length)
+        self.trees[network.version].add_prefix(pk, int(network), prefix_length, update)
+
+    def remove_prefix(self, pk):
+        if pk in self.prefixes:
+            family, network, prefix_length = self.prefixes.pop(pk)
+            self.trees[family].remove_prefix(pk, network, prefix_length)
+
+    def add_ip(self, pk, host, update=True):
+        if self.ips is not None:
+            self.ips[pk] = (host.version, int(host))
+            self.trees[host.version].add_ip(pk, int(host), update)
+
+    def remove_ip(self, pk):
+        if self.ips is not None and pk in self.ips:
+            family, host = self.ips.pop(pk)
+            self.trees[family].remove_ip(pk, host)
+
+
+class PrefixIndex:
+    """
+    A per-process index of the Prefixes and IP addresses of each VRF (and of the global table), as one `PrefixTree` per
+    VRF and IP family.
+
+    The Prefixes of a VRF are loaded from the database on first use, and its IP addresses only once they're needed (for
+    utilization and available IPs). Committed changes made by this process are applied to the index in place (see
+    `nautobot.ipam.signals`), while changes made by other processes are detected by means of a version number per VRF
+    kept in the shared Django cache, causing only the VRFs concerned to be reloaded on next use. Changes which bypass
+    model signals (such as `QuerySet.update()`) must be followed by a call to `invalidate()`.
+
+    The index only reflects committed data, so it isn't used inside of a database transaction which has changed any
+    Prefixes or IP addresses (see `is_available()`); other transactions, such as those of most views and API requests
+    which don't edit Prefixes or IP addresses, see the same data in the index as in the database.
+
+    The index is shared by the threads of a process: each change is applied while holding a lock, which the trees
+    also hold while answering lookups (see `PrefixTree`).
+    """
+
+    generation_key = "nautobot.ipam.prefix_index.generation"
+    version_key_prefix = "nautobot.ipam.prefix_index.version"
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # VRF ID -> _VRFIndex
+        self._vrfs = {}
+
+    @staticmethod
+    def is_available():
+        """
+        Return True if the index may be used to answer queries, i.e. unless we're inside of a database transaction
+        which has changed any Prefixes or IP addresses (whose changes are only applied to the index once committed).
+        """
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            return True
+        # Changes rolled back to a savepoint are also removed from the pending on-commit callbacks
+        return not any(getattr(entry[1], "prefix_index_change", False) for entry in connection.run_on_commit)
+
+    @staticmethod
+    def _on_commit(func):
+        """
+        Register a function applying a change to the index, to be called once the current transaction (if any) commits.
+        """
+        func.prefix_index_change = True
+        transaction.on_commit(func)
+
+    def _get_version_key(self, vrf_id):
+        return f"{self.version_key_prefix}.{vrf_id or 'global'}"
+
+    def get_version(self, vrf_id):
+        """
+        Return the current shared version of the index of the given VRF ID (or None for the global table).
+
+        A version is the pair of the generation of the whole index, which `invalidate()` replaces, and a counter which
+        is incremented by each change to the VRF.
+        """
+        version_key = self._get_version_key(vrf_id)
+        versions = cache.get_many([self.generation_key, version_key])
+        if self.generation_key not in versions:
+            cache.add(self.generation_key, uuid.uuid4().hex, timeout=None)
+            versions[self.generation_key] = cache.get(self.generation_key)
+        if version_key not in versions:
+            # Counters start from a random value, so that one recreated after being evicted from the cache doesn't
+            # match a version which was current before
+            cache.add(version_key, random.getrandbits(48), timeout=None)
+            versions[version_key] = cache.get(version_key)
+        return versions[self.generation_key], versions[version_key]
+
+    def _load_vrf(self, vrf_id, version):
+        from nautobot.ipam.models import Prefix
+
+        vrf_index = _VRFIndex(version, self._lock)
+        prefixes = Prefix.objects.filter(vrf_id=vrf_id).order_by().values_list("pk", "network", "prefix_length")
+        for pk, network, prefix_length in prefixes.iterator():
+            vrf_index.add_prefix(pk, netaddr.IPAddress(network), prefix_length, update=False)
+        for tree in vrf_index.trees.values():
+            tree.recalculate()
+        return vrf_index
+
+    def _load_ips(self, vrf_id, vrf_index):
+        from nautobot.ipam.models import IPAddress
+
+        vrf_index.ips = {}
+        ip_addresses = IPAddress.objects.filter(vrf_id=vrf_id).order_by().values_list("pk", "host")
+        for pk, host in ip_addresses.iterator():
+            vrf_index.add_ip(pk, netaddr.IPAddress(host), update=False)
+        for tree in vrf_index.trees.values():
+            tree.recalculate()
+
+    def get_tree(self, vrf_id, family, version=None, ips=False):
+        """
+        Return the `PrefixTree` for the given VRF ID (or None for the global table) and IP family, loading or reloading
+        the VRF's Prefixes, and its IP addresses if `ips` is True, if necessary.
+
+        Callers performing many lookups in a row may pass a `version` obtained from `get_version()` to avoid checking
+        the shared version on every call.
+        """
+        if version is None:
+            version = self.get_version(vrf_id)
+        with self._lock:
+            vrf_index = self._vrfs.get(vrf_id)
+            if vrf_index is None or vrf_index.version != version:
+                vrf_index = self._vrfs[vrf_id] = self._load_vrf(vrf_id, version)
+            if ips and vrf_index.ips is None:
+                self._load_ips(vrf_id, vrf_index)
+            return vrf_index.trees[family]
+
+    def _apply(self, vrf_id, change):
+        """
+        Apply a committed change to the local index of the given VRF (if loaded and current) and notify other processes
+        of it.
+        """
+        with self._lock:
+            version_key = self._get_version_key(vrf_id)
+            try:
+                counter = cache.incr(version_key)
+            except ValueError:
+                # The version key doesn't exist (yet, or any more)
+                cache.set(version_key, random.getrandbits(48), timeout=None)
+                counter = None
+            vrf_index = self._vrfs.get(vrf_id)
+            if vrf_index is None:
+                return
+            generation, current_counter = vrf_index.version
+            if counter is not None and current_counter is not None and counter == current_counter + 1:
+                change(vrf_index)
+                vrf_index.version = (generation, counter)
+            else:
+                # We've missed changes from another process, so reload on next use
+                del self._vrfs[vrf_id]
+
+    def _apply_changes(self, instance, remove, update):
+        """
+        Once the current transaction (if any) has been committed, apply `remove` to the index of the VRF in which the
+        given Prefix or IPAddress was recorded, if that has changed, and `update` to the index of its current VRF.
+        """
+        # Recorded when the object was loaded (see `Prefix.__init__()`), unless its VRF was deferred
+        indexed_vrf_id = instance.__dict__.get("_indexed_vrf_id", DEFERRED)
+        if indexed_vrf_id is DEFERRED:
+            self.invalidate()
+            return
+        vrf_id = instance._indexed_vrf_id = instance.vrf_id
+
+        def _apply():
+            if indexed_vrf_id != vrf_id:
+                self._apply(indexed_vrf_id, remove)
+            self._apply(vrf_id, update)
+
+        self._on_commit(_apply)
+
+    def prefix_saved(self, instance):
+        """
+        Record the given Prefix in the index once the current transaction (if any) has been committed.
+        """
+        pk, network, prefix_length = instance.pk, instance.network, instance.prefix_length
+
+        def _update(vrf_index):
+            vrf_index.remove_prefix(pk)
+            vrf_index.add_prefix(pk, netaddr.IPAddress(network), prefix_length)
+
+        self._apply_changes(instance, lambda vrf_index: vrf_index.remove_prefix(pk), _update)
+
+    def prefix_deleted(self, instance):
+        """
+        Remove the given Prefix from the index once the current transaction (if any) has been committed.
+        """
+        pk = instance.pk
+
+        def _remove(vrf_index):
+            vrf_index.remove_prefix(pk)
+
+        self._apply_changes(instance, _remove, _remove)
+
+    def ip_address_saved(self, instance):
+        """
+        Record the given IPAddress in the index once the current transaction (if any) has been committed.
+        """
+        pk, host = instance.pk, instance.host
+
+        def _update(vrf_index):
+            vrf_index.remove_ip(pk)
+            vrf_index.add_ip(pk, netaddr.IPAddress(host))
+
+        self._apply_changes(instance, lambda vrf_index: vrf_index.remove_ip(pk), _update)
+
+    def ip_address_deleted(self, instance):
+        """
+        Remove the given IPAddress from the index once the current transaction (if any) has been committed.
+        """
+        pk = instance.pk
+
+        def _remove(vrf_index):
+            vrf_index.remove_ip(pk)
+
+        self._apply_changes(instance, _remove, _remove)
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Discard the whole index in all processes, causing it to be reloaded on next use.
+
+        Accepts and ignores any arguments, so that it can be connected directly as a signal receiver.
+        """
+        with self._lock:
+            self._vrfs = {}
+
+        def _invalidate():
+            cache.set(self.generation_key, uuid.uuid4().hex, timeout=None)
+
+        self._on_commit(_invalidate)
+
+
+prefix_index = PrefixIndex()
@@ -1,6 +1,7 @@
 import netaddr
+from django.core.cache import cache
 
-from .constants import VLAN_VID_MAX, VLAN_VID_MIN
+from .constants import IPADDRESS_RESERVATION_TIMEOUT, VLAN_VID_MAX, VLAN_VID_MIN
 from .models import Prefix, VLAN
 
 
@@ -27,49 +28,85 @@ def add_available_ipaddresses(prefix, ipaddress_list, is_pool=False):
     """
 
     output = []
-    prev_ip = None
 
     # Ignore the network and broadcast addresses for non-pool IPv4 prefixes larger than /31.
     if prefix.version == 4 and prefix.prefixlen < 31 and not is_pool:
-        first_ip_in_prefix = netaddr.IPAddress(prefix.first + 1)
-        last_ip_in_prefix = netaddr.IPAddress(prefix.last - 1)
+        first_ip_in_prefix = prefix.first + 1
+        last_ip_in_prefix = prefix.last - 1
     else:
-        first_ip_in_prefix = netaddr.IPAddress(prefix.first)
-        last_ip_in_prefix = netaddr.IPAddress(prefix.last)
-
-    if not ipaddress_list:
-        return [
-            (
-                int(last_ip_in_prefix - first_ip_in_prefix + 1),
-                "{}/{}".format(first_ip_in_prefix, prefix.prefixlen),
-            )
-        ]
-
-    # Account for any available IPs before the first real IP
-    if ipaddress_list[0].address.ip > first_ip_in_prefix:
-        skipped_count = int(ipaddress_list[0].address.ip - first_ip_in_prefix)
-        first_skipped = "{}/{}".format(first_ip_in_prefix, prefix.prefixlen)
-        output.append((skipped_count, first_skipped))
-
-    # Iterate through existing IPs and annotate free ranges
+        first_ip_in_prefix = prefix.first
+        last_ip_in_prefix = prefix.last
+
+    def _available(first, last):
+        return (last - first + 1, "{}/{}".format(netaddr.IPAddress(first, prefix.version), prefix.prefixlen))
+
+    # Iterate through existing IPs (in order of host address) and annotate free ranges, doing all arithmetic on
+    # integers rather than netaddr objects
+    next_available = first_ip_in_prefix
     for ip in ipaddress_list:
-        if prev_ip:
-            diff = int(ip.address.ip - prev_ip.address.ip)
-            if diff > 1:
-                first_skipped = "{}/{}".format(prev_ip.address.ip + 1, prefix.prefixlen)
-                output.append((diff - 1, first_skipped))
+        host = int(netaddr.IPAddress(ip.host))
+        if host > next_available:
+            output.append(_available(next_available, min(host - 1, last_ip_in_prefix)))
         output.append(ip)
-        prev_ip = ip
+        next_available = max(next_available, host + 1)
 
     # Include any remaining available IPs
-    if prev_ip.address.ip < last_ip_in_prefix:
-        skipped_count = int(last_ip_in_prefix - prev_ip.address.ip)
-        first_skipped = "{}/{}".format(prev_ip.address.ip + 1, prefix.prefixlen)
-        output.append((skipped_count, first_skipped))
+    if next_available <= last_ip_in_prefix:
+        output.append(_available(next_available, last_ip_in_prefix))
 
     return output
 
 
+def _get_ip_reservation_key(prefix, ip):
+    return "nautobot.ipam.ip_reservation.{}.{}".format(prefix.vrf_id, ip)
+
+
+def reserve_available_ips(prefix, count):
+    """
+    Reserve up to `count` of the first available IP addresses within the given prefix, for the creation of new
+    IPAddresses in the prefix's VRF.
+
+    Each address is reserved atomically in the shared cache, so concurrent callers are given distinct addresses without
+    having to wait on one another. Once the IPAddresses have been created (or if they won't be), the reservations must
+    be released with `release_ip_reservations()`.
+
+    Returns:
+        list: The reserved addresses, as `netaddr.IPAddress`es
+    """
+    reserved_ips = []
+    available_ips = prefix.iter_available_ips()
+    while len(reserved_ips) < count:
+        candidate_ips = []
+        for ip in available_ips:
+            if cache.add(_get_ip_reservation_key(prefix, ip), True, timeout=IPADDRESS_RESERVATION_TIMEOUT):
+                candidate_ips.append(ip)
+                if len(reserved_ips) + len(candidate_ips) == count:
+                    break
+        if not candidate_ips:
+            break
+
+        # Another caller may have created one of these addresses (and released its reservation) since we read the
+        # available addresses from the database
+        existing_ips = {
+            netaddr.IPAddress(host)
+            for host in prefix.get_child_ips()
+            .filter(host__in=[str(ip) for ip in candidate_ips])
+            .values_list("host", flat=True)
+        }
+        release_ip_reservations(prefix, [ip for ip in candidate_ips if ip in existing_ips])
+        reserved_ips.extend(ip for ip in candidate_ips if ip not in existing_ips)
+
+    return reserved_ips
+
+
+def release_ip_reservations(prefix, ips):
+    """
+    Release the reservations of the given IP addresses, made by `reserve_available_ips()`.
+    """
+    if ips:
+        cache.delete_many([_get_ip_reservation_key(prefix, ip) for ip in ips])
+
+
 def add_available_vlans(vlan_group, vlans):
     """
     Create fake records for all gaps between used VLANs
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     name = "nautobot.users"
     verbose_name = "Users"
+
+    def ready(self):
+        super().ready()
+        import nautobot.users.signals  # noqa
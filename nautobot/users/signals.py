@@ -0,0 +1,23 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from nautobot.core.authentication import object_permission_cache
+from .models import AdminGroup, ObjectPermission, User
+
+
+#
+# Object permissions
+#
+
+
+post_save.connect(object_permission_cache.invalidate, sender=ObjectPermission)
+post_delete.connect(object_permission_cache.invalidate, sender=ObjectPermission)
+for field_name in ("object_types", "groups", "users"):
+    m2m_changed.connect(object_permission_cache.invalidate, sender=getattr(ObjectPermission, field_name).through)
+
+# Group memberships (the permissions map doesn't depend on any other attribute of the user, such as `is_active`, which
+# is checked on each request)
+m2m_changed.connect(object_permission_cache.invalidate, sender=User.groups.through)
+post_delete.connect(object_permission_cache.invalidate, sender=User)
+post_delete.connect(object_permission_cache.invalidate, sender=Group)
+post_delete.connect(object_permission_cache.invalidate, sender=AdminGroup)
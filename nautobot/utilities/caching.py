@@ -0,0 +1,175 @@
+from collections import OrderedDict
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class LRUCache:
+    """
+    A bounded per-process cache, which discards the least recently used values once it's full.
+
+    Unlike `functools.lru_cache`, hits and misses may be counted by Prometheus counters, and a value is only cached if
+    the loader returns successfully.
+
+    Example:
+
+    >>> template_cache = LRUCache(256, environment.from_string)
+    >>> template_cache.get(template_code)
+    """
+
+    def __init__(self, maxsize, loader, hits=None, misses=None):
+        """
+        Args:
+            maxsize (int): Maximum number of values to retain
+            loader (callable): Function taking a key and returning the value to cache for it
+            hits (prometheus_client.Counter): Optional counter of lookups answered from the cache
+            misses (prometheus_client.Counter): Optional counter of lookups requiring the loader to be called
+        """
+        self.maxsize = maxsize
+        self.loader = loader
+        self.hits = hits
+        self.misses = misses
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key):
+        """
+        Return the cached value for the given key, loading it if necessary.
+        """
+        with self._lock:
+            if key in self._values:
+                self._values.move_to_end(key)
+                if self.hits is not None:
+                    self.hits.inc()
+                return self._values[key]
+
+        # Load outside of the lock; at worst, concurrent misses for the same key load it more than once
+        if self.misses is not None:
+            self.misses.inc()
+        value = self.loader(key)
+
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        """
+        Discard all cached values.
+        """
+        with self._lock:
+            self._values.clear()
+
+
+class VersionedCache:
+    """
+    A per-process cache of values derived from the database.
+
+    Each process keeps its own copy of the loaded values, so lookups don't require a database query. A version token
+    kept in the shared Django cache allows invalidation (typically from signal handlers) to be seen by all processes:
+    whenever the shared version differs from the one the local values were loaded under, they're discarded and
+    reloaded on demand. Values loaded inside of a database transaction are retained, by the current thread only, until
+    the transaction ends.
+
+    Example:
+
+    >>> webhook_cache = VersionedCache("extras.webhook", lambda key: list(Webhook.objects.filter(...)))
+    >>> webhook_cache.get(key)
+    >>> post_save.connect(webhook_cache.invalidate, sender=Webhook)
+    """
+
+    def __init__(self, name, loader):
+        """
+        Args:
+            name (str): Unique name for this cache, used to construct the shared version key
+            loader (callable): Function taking a key and returning the value to cache for it
+        """
+        self.name = name
+        self.loader = loader
+        self._version = None
+        self._values = {}
+        self._transaction_values = threading.local()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+    @property
+    def version_key(self):
+        return f"nautobot.versioned_cache.{self.name}"
+
+    def get_version(self):
+        """
+        Return the current shared version of this cache.
+        """
+        version = cache.get(self.version_key)
+        if version is None:
+            token = uuid.uuid4().hex
+            cache.add(self.version_key, token, timeout=None)
+            version = cache.get(self.version_key, token)
+        return version
+
+    def get(self, key, version=None):
+        """
+        Return the cached value for the given key, loading it if necessary.
+
+        Callers performing many lookups in a row may pass a `version` obtained from `get_version()` to avoid checking
+        the shared version on every call.
+        """
+        if version is None:
+            version = self.get_version()
+        if version != self._version:
+            self._values = {}
+            self._version = version
+        if key in self._values:
+            return self._values[key]
+
+        connection = transaction.get_connection()
+        if connection.in_atomic_block:
+            # Values read inside of a transaction may yet be rolled back, so don't share them with the whole process
+            values = self._get_transaction_values(connection, version)
+            if key not in values:
+                values[key] = self.loader(key)
+            return values[key]
+
+        value = self.loader(key)
+        self._values[key] = value
+        return value
+
+    def _get_transaction_values(self, connection, version):
+        """
+        Return the values loaded by this thread inside of the current transaction of the given connection.
+
+        Django replaces the connection's list of on-commit callbacks whenever a transaction is committed or rolled back
+        (including to a savepoint), so the values are discarded once that list has changed.
+        """
+        local = self._transaction_values
+        if getattr(local, "run_on_commit", None) is not connection.run_on_commit or local.version != version:
+            local.run_on_commit = connection.run_on_commit
+            local.version = version
+            local.values = {}
+        return local.values
+
+    def _bump_version(self):
+        # A random token rather than a counter: if the key is evicted, a counter would restart from values that some
+        # process may still hold, which would then keep using its stale values.
+        cache.set(self.version_key, uuid.uuid4().hex, timeout=None)
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Discard all cached values in all processes.
+
+        Accepts and ignores any arguments, so that it can be connected directly as a signal receiver. Local values are
+        discarded immediately; other processes are notified once the current transaction (if any) commits, so that
+        they don't reload values from before the change.
+        """
+        self._values = {}
+        self._version = None
+        self._transaction_values.values = {}
+        transaction.on_commit(self._bump_version)
@@ -1,6 +1,7 @@
 import re
 
 from django import forms
+from django.core.exceptions import EmptyResultSet
 from django.forms.models import fields_for_model
 
 from nautobot.utilities.querysets import RestrictedQuerySet
@@ -14,7 +15,10 @@ __all__ = (
     "parse_alphanumeric_range",
     "parse_numeric_range",
     "restrict_form_fields",
+    "cache_related_object_lookups",
+    "iter_csv_records",
     "parse_csv",
+    "parse_csv_headers",
     "validate_csv",
 )
 
@@ -138,18 +142,46 @@ def restrict_form_fields(form, user, action="view"):
             field.queryset = field.queryset.restrict(user, action)
 
 
-def parse_csv(reader):
+def cache_related_object_lookups(form, lookups):
     """
-    Parse a csv_reader object into a headers dictionary and a list of records dictionaries. Raise an error
-    if the records are formatted incorrectly. Return headers and records as a tuple.
+    Memoize the related objects looked up by the single-object choice fields of a bound form in `lookups`, a dictionary
+    shared by the forms of all rows of a CSV import, so that each distinct value (e.g. a site's slug) is only looked up
+    once rather than once per row. Only successful lookups are retained, as a value which doesn't match an object may
+    be matched by an object imported from a later row. Lookups are only ever added to `lookups`, so those added after
+    a given point are the last entries of the dictionary.
     """
-    records = []
-    headers = {}
 
-    # Consume the first line of CSV data as column headers. Create a dictionary mapping each header to an optional
-    # "to" field specifying how the related object is being referenced. For example, importing a Device might use a
-    # `site.slug` header, to indicate the related site is being referenced by its slug.
+    def memoize(name, field):
+        to_python = field.to_python
+
+        def cached_to_python(value):
+            if value in field.empty_values:
+                return to_python(value)
+            # The queryset may be restricted differently for each row, e.g. to the site of the row's device
+            try:
+                query = str(field.queryset.query)
+            except EmptyResultSet:
+                # The queryset matches nothing (e.g. restricted for a user without permission to view its objects)
+                return to_python(value)
+            key = (name, field.to_field_name, query, value)
+            if key not in lookups:
+                lookups[key] = to_python(value)
+            return lookups[key]
+
+        return cached_to_python
 
+    for name, field in form.fields.items():
+        if isinstance(field, forms.ModelChoiceField) and not isinstance(field, forms.ModelMultipleChoiceField):
+            field.to_python = memoize(name, field)
+
+
+def parse_csv_headers(reader):
+    """
+    Consume the first line of CSV data from a csv_reader object as column headers. Return a dictionary mapping each
+    header to an optional "to" field specifying how the related object is being referenced. For example, importing a
+    Device might use a `site.slug` header, to indicate the related site is being referenced by its slug.
+    """
+    headers = {}
     for header in next(reader):
         if "." in header:
             field, to_field = header.split(".", 1)
@@ -157,13 +189,28 @@ def parse_csv(reader):
         else:
             headers[header] = None
 
-    # Parse CSV rows into a list of dictionaries mapped from the column headers.
+    return headers
+
+
+def iter_csv_records(reader, headers):
+    """
+    Parse the remaining rows of a csv_reader object, yielding a dictionary mapped from the column headers for each
+    of them, without reading the whole of the data at once. Raise an error if a record is formatted incorrectly.
+    """
     for i, row in enumerate(reader, start=1):
         if len(row) != len(headers):
             raise forms.ValidationError(f"Row {i}: Expected {len(headers)} columns but found {len(row)}")
         row = [col.strip() for col in row]
-        record = dict(zip(headers.keys(), row))
-        records.append(record)
+        yield dict(zip(headers.keys(), row))
+
+
+def parse_csv(reader):
+    """
+    Parse a csv_reader object into a headers dictionary and a list of records dictionaries. Raise an error
+    if the records are formatted incorrectly. Return headers and records as a tuple.
+    """
+    headers = parse_csv_headers(reader)
+    records = list(iter_csv_records(reader, headers))
 
     return headers, records
 
@@ -3,7 +3,7 @@
 import logging
 import os
 
-from git import Repo
+from git import GitCommandError, Repo
 
 
 logger = logging.getLogger("nautobot.utilities.git")
@@ -14,20 +14,70 @@ class BranchDoesNotExist(Exception):
 
 
 class GitRepo:
-    def __init__(self, path, url):
+    def __init__(self, path, url, depth=None, sparse_paths=None):
         """
         Ensure that we have a clone of the given remote Git repository URL at the given local directory path.
+
+        Args:
+            path (str): Local directory path of the clone
+            url (str): Remote Git repository URL
+            depth (int): If set, only fetch this many commits of each branch (a shallow clone), rather than its full
+                history
+            sparse_paths (list): If set, only check out these directories (and the files at the top level of the
+                repository), rather than the whole tree (a sparse checkout)
         """
+        self.depth = depth
         if os.path.isdir(path):
             self.repo = Repo(path=path)
+        elif depth or sparse_paths is not None:
+            # Fetch the latest commit(s) of every branch, as any branch may be checked out; with a sparse checkout,
+            # nothing is checked out until the sparse paths have been set below.
+            self.repo = Repo.clone_from(
+                url, to_path=path, depth=depth, no_single_branch=True, no_checkout=sparse_paths is not None
+            )
         else:
             self.repo = Repo.clone_from(url, to_path=path)
 
         if url not in self.repo.remotes.origin.urls:
             self.repo.remotes.origin.set_url(url)
 
+        self.set_sparse_paths(sparse_paths)
+
+    @property
+    def is_shallow(self):
+        return os.path.exists(os.path.join(self.repo.git_dir, "shallow"))
+
+    def set_sparse_paths(self, sparse_paths):
+        """
+        Restrict the working tree to the given directories, or restore the whole working tree if `sparse_paths` is
+        None.
+        """
+        is_sparse = self.repo.config_reader().get_value("core", "sparseCheckout", False)
+        if sparse_paths is not None:
+            if not is_sparse:
+                self.repo.git.sparse_checkout("init", "--cone")
+            self.repo.git.sparse_checkout("set", *sparse_paths)
+        elif is_sparse:
+            self.repo.git.sparse_checkout("disable")
+
     def fetch(self):
-        self.repo.remotes.origin.fetch()
+        if self.depth:
+            self.repo.remotes.origin.fetch(depth=self.depth)
+        elif self.is_shallow:
+            # A shallow clone is no longer wanted, so fetch the full history
+            self.repo.remotes.origin.fetch(unshallow=True)
+        else:
+            self.repo.remotes.origin.fetch()
+
+    def has_commit(self, commit_hexsha):
+        """
+        Return whether the given commit has been fetched.
+        """
+        try:
+            self.repo.git.cat_file("-e", f"{commit_hexsha}^{{commit}}")
+        except GitCommandError:
+            return False
+        return True
 
     def checkout(self, branch, commit_hexsha=None):
         """
@@ -39,6 +89,10 @@ class GitRepo:
             return commit_hexsha
 
         self.fetch()
+        if commit_hexsha and self.is_shallow and not self.has_commit(commit_hexsha):
+            # The commit is older than the history fetched by a shallow clone
+            logger.info(f"Commit {commit_hexsha} is not in the shallow clone; fetching the full history...")
+            self.repo.remotes.origin.fetch(unshallow=True)
         if commit_hexsha:
             # Sanity check - GitPython doesn't provide a handy API for this so we just call a raw Git command:
             # $ git branch origin/<branch> --remotes --contains <commit>
@@ -1,5 +1,8 @@
 from django.conf import settings
+from django.contrib.auth import get_backends
 from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied
+from django.db.models import Q
 
 
 def get_permission_for_model(model, action):
@@ -68,3 +71,53 @@ def permission_is_exempt(name):
             return True
 
     return False
+
+
+def compile_constraints(constraint_sets):
+    """
+    Return a Q object matching the objects which satisfy any of the given sets of ObjectPermission constraints. If any
+    of the sets is empty (i.e. unconstrained), this is an empty Q object, which matches all objects.
+
+    :param constraint_sets: List of constraint sets (dictionaries of query filters, or lists thereof)
+    """
+    query = Q()
+    for constraints in constraint_sets:
+        if type(constraints) is list:
+            constraints_query = compile_constraints(constraints)
+            if not constraints_query:
+                return Q()
+            query |= constraints_query
+        elif constraints:
+            query |= Q(**constraints)
+        else:
+            # Any permission with null constraints grants access to _all_ instances
+            return Q()
+    return query
+
+
+def get_permitted_pks(user, name, objects):
+    """
+    Return the set of primary keys of those of the given objects on which the user has been granted the specified
+    permission. This is equivalent to calling `user.has_perm(name, obj)` for each object, but authentication backends
+    which support it (such as `ObjectPermissionBackend`) evaluate all of the objects in a single query.
+
+    :param user: User instance
+    :param name: Permission name in the format <app_label>.<action>_<model>
+    :param objects: Instances of the model to which the permission applies
+    """
+    objects = list(objects)
+    permitted_pks = set()
+    for backend in get_backends():
+        remaining = [obj for obj in objects if obj.pk not in permitted_pks]
+        if not remaining:
+            break
+        try:
+            if hasattr(backend, "get_permitted_pks"):
+                permitted_pks |= backend.get_permitted_pks(user, name, remaining)
+            elif hasattr(backend, "has_perm"):
+                permitted_pks |= {obj.pk for obj in remaining if backend.has_perm(user, name, obj)}
+        except PermissionDenied:
+            # As with `has_perm()`, a backend raising PermissionDenied denies the permission outright
+            break
+
+    return permitted_pks
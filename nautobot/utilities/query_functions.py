@@ -1,6 +1,9 @@
+import json
+
 from django.db.models import Aggregate, JSONField
 
 from django.contrib.postgres.aggregates.mixins import OrderableAggMixin
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import NotSupportedError
 from django.db.models import Func
 
@@ -73,3 +76,106 @@ class OrderableJSONBAgg(OrderableAggMixin, JSONBAgg):
     """
 
     template = "%(function)s(%(distinct)s%(expressions)s %(ordering)s)"
+
+
+def _mysql_json_path(key):
+    """
+    Return the MySQL JSON path of the given top-level key.
+    """
+    key = key.replace("\\", "\\\\").replace('"', '\\"')
+    return f'$."{key}"'
+
+
+class JSONKeyFunc(Func):
+    """
+    Base class for functions which modify a top-level key of a JSON field, such as `_custom_field_data`, in place.
+
+    These are intended for use in `QuerySet.update()`, so that many objects can be modified by a single query.
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, **extra):
+        self.key = key
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"{self.__class__.__name__} is not supported for database {connection.vendor}")
+
+    @staticmethod
+    def dumps(value):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+class JSONSetKey(JSONKeyFunc):
+    """
+    Set the value of a top-level key of a JSON field, adding the key if it's not already present.
+    """
+
+    def __init__(self, expression, key, value, **extra):
+        self.value = value
+        super().__init__(expression, key, **extra)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSONB_SET({sql}, ARRAY[%s], %s::jsonb)", [*params, self.key, self.dumps(self.value)]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSON_SET({sql}, %s, CAST(%s AS JSON))", [*params, _mysql_json_path(self.key), self.dumps(self.value)]
+
+
+class JSONRemoveKey(JSONKeyFunc):
+    """
+    Remove a top-level key from a JSON field.
+    """
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"({sql} - %s)", [*params, self.key]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSON_REMOVE({sql}, %s)", [*params, _mysql_json_path(self.key)]
+
+
+class JSONReplaceArrayElement(JSONKeyFunc):
+    """
+    Replace a string in the array stored under a top-level key of a JSON field with another string.
+
+    The array is expected to contain the string being replaced (at most once); otherwise the field is left unchanged.
+    """
+
+    def __init__(self, expression, key, old_value, new_value, **extra):
+        self.old_value = old_value
+        self.new_value = new_value
+        super().__init__(expression, key, **extra)
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        elements = (
+            "SELECT JSONB_AGG(CASE WHEN elem = %s::jsonb THEN %s::jsonb ELSE elem END ORDER BY idx) "
+            f"FROM JSONB_ARRAY_ELEMENTS({sql} -> %s) WITH ORDINALITY AS t(elem, idx)"
+        )
+        return (
+            f"COALESCE(JSONB_SET({sql}, ARRAY[%s], ({elements})), {sql})",
+            [
+                *params,
+                self.key,
+                self.dumps(self.old_value),
+                self.dumps(self.new_value),
+                *params,
+                self.key,
+                *params,
+            ],
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        # JSON_SEARCH() matches using LIKE syntax, so wildcards must be escaped
+        search = self.old_value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        path = f"JSON_UNQUOTE(JSON_SEARCH({sql}, 'one', %s, NULL, %s))"
+        return (
+            f"COALESCE(JSON_SET({sql}, {path}, CAST(%s AS JSON)), {sql})",
+            [*params, *params, search, _mysql_json_path(self.key), self.dumps(self.new_value), *params],
+        )
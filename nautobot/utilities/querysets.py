@@ -1,6 +1,6 @@
-from django.db.models import Q, QuerySet
+from django.db.models import QuerySet
 
-from nautobot.utilities.permissions import permission_is_exempt
+from nautobot.utilities.permissions import compile_constraints, permission_is_exempt
 
 
 class RestrictedQuerySet(QuerySet):
@@ -26,18 +26,11 @@ class RestrictedQuerySet(QuerySet):
             qs = self.none()
 
         # Filter the queryset to include only objects with allowed attributes
+        elif hasattr(user, "_object_perm_constraints"):
+            # Constraints compiled (and cached) by ObjectPermissionBackend
+            qs = self.filter(user._object_perm_constraints[permission_required])
+
         else:
-            attrs = Q()
-            for perm_attrs in user._object_perm_cache[permission_required]:
-                if type(perm_attrs) is list:
-                    for p in perm_attrs:
-                        attrs |= Q(**p)
-                elif perm_attrs:
-                    attrs |= Q(**perm_attrs)
-                else:
-                    # Any permission with null constraints grants access to _all_ instances
-                    attrs = Q()
-                    break
-            qs = self.filter(attrs)
+            qs = self.filter(compile_constraints(user._object_perm_cache[permission_required]))
 
         return qs
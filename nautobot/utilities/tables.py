@@ -2,7 +2,6 @@ import django_tables2 as tables
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.fields import GenericForeignKey
-from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models.fields.related import RelatedField
 from django.urls import reverse
@@ -12,8 +11,9 @@ from django.utils.text import Truncator
 from django_tables2.data import TableQuerysetData
 from django_tables2.utils import Accessor
 
-from nautobot.extras.models import CustomField
 from nautobot.extras.choices import CustomFieldTypeChoices
+from nautobot.extras.custom_fields import get_custom_fields_for_model
+from nautobot.utilities.permissions import get_permission_for_model, get_permitted_pks
 
 
 class BaseTable(tables.Table):
@@ -30,9 +30,7 @@ class BaseTable(tables.Table):
 
     def __init__(self, *args, user=None, **kwargs):
         # Add custom field columns
-        obj_type = ContentType.objects.get_for_model(self._meta.model)
-
-        for cf in CustomField.objects.filter(content_types=obj_type):
+        for cf in get_custom_fields_for_model(self._meta.model):
             name = "cf_{}".format(cf.name)
             self.base_columns[name] = CustomFieldColumn(cf)
 
@@ -172,12 +170,12 @@ class ButtonsColumn(tables.TemplateColumn):
             <i class="mdi mdi-history"></i>
         </a>
     {{% endif %}}
-    {{% if "edit" in buttons and perms.{app_label}.change_{model_name} %}}
+    {{% if "edit" in buttons and record.pk in permitted_pks.change %}}
         <a href="{{% url '{prefix}{app_label}:{model_name}_edit' {pk_field}=record.{pk_field} %}}?return_url={{{{ request.path }}}}{{{{ return_url_extra }}}}" class="btn btn-xs btn-warning" title="Edit">
             <i class="mdi mdi-pencil"></i>
         </a>
     {{% endif %}}
-    {{% if "delete" in buttons and perms.{app_label}.delete_{model_name} %}}
+    {{% if "delete" in buttons and record.pk in permitted_pks.delete %}}
         <a href="{{% url '{prefix}{app_label}:{model_name}_delete' {pk_field}=record.{pk_field} %}}?return_url={{{{ request.path }}}}{{{{ return_url_extra }}}}" class="btn btn-xs btn-danger" title="Delete">
             <i class="mdi mdi-trash-can-outline"></i>
         </a>
@@ -222,6 +220,31 @@ class ButtonsColumn(tables.TemplateColumn):
     def header(self):
         return ""
 
+    def get_permitted_pks(self, table):
+        """
+        Return the primary keys of the records on the table's current page which the user may change or delete,
+        evaluating each permission for the whole page at once rather than per row.
+        """
+        permitted_pks = {"change": set(), "delete": set()}
+        request = getattr(table, "context", {}).get("request")
+        if request is None:
+            return permitted_pks
+
+        # The rows of the page have already been retrieved to render them, so this doesn't query them again
+        page = getattr(table, "page", None)
+        records = [row.record for row in (page.object_list if page is not None else table.rows)]
+        for button, action in (("edit", "change"), ("delete", "delete")):
+            if records and button in self.extra_context["buttons"]:
+                permission = get_permission_for_model(records[0], action)
+                permitted_pks[action] = get_permitted_pks(request.user, permission, records)
+        return permitted_pks
+
+    def render(self, record, table, **kwargs):
+        if not hasattr(table, "_permitted_pks"):
+            table._permitted_pks = self.get_permitted_pks(table)
+        self.extra_context["permitted_pks"] = table._permitted_pks
+        return super().render(record=record, table=table, **kwargs)
+
 
 class ChoiceFieldColumn(tables.Column):
     """
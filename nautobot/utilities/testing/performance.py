@@ -0,0 +1,44 @@
+import time
+
+from django.test import tag, TestCase
+
+
+@tag("performance")
+class PerformanceTestCase(TestCase):
+    """
+    Base test case for benchmarks, which compare the time taken by alternative implementations of the same operation.
+
+    Performance tests are excluded from test runs by default; use `nautobot-server test --tag performance` (or `invoke
+    performance-test`) to run them.
+    """
+
+    # Number of times each benchmarked callable is run; the fastest run is reported
+    repeat = 5
+
+    def benchmark(self, func, *args, **kwargs):
+        """
+        Call `func(*args, **kwargs)` `repeat` times.
+
+        Returns:
+            (float, object): The shortest time taken, in seconds, and the value returned by the last call
+        """
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    def assertFasterThan(self, label, baseline, candidate):
+        """
+        Benchmark the `baseline` and `candidate` callables, report their timings, and assert that both return the same
+        value and that `candidate` is faster.
+        """
+        baseline_time, baseline_result = self.benchmark(baseline)
+        candidate_time, candidate_result = self.benchmark(candidate)
+        print(
+            f"\n{label}: baseline {baseline_time * 1000:.1f} ms, candidate {candidate_time * 1000:.1f} ms "
+            f"({baseline_time / max(candidate_time, 1e-9):.1f}x)"
+        )
+        self.assertEqual(candidate_result, baseline_result)
+        self.assertLess(candidate_time, baseline_time)
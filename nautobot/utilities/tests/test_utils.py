@@ -1,12 +1,18 @@
+from django.core.cache import cache as django_cache
 from django.http import QueryDict
 from django.test import TestCase
 
 from nautobot.core.settings_funcs import is_truthy
+from nautobot.utilities.caching import LRUCache, VersionedCache
 from nautobot.utilities.utils import (
+    buffer_chunks,
     get_filterset_for_model,
     deepmerge,
     dict_to_filter_params,
+    iter_queryset,
+    jinja2_template_cache,
     normalize_querydict,
+    render_jinja2,
 )
 from nautobot.dcim.models import Device, Site
 from nautobot.dcim.filters import DeviceFilterSet, SiteFilterSet
@@ -158,3 +164,88 @@ class IsTruthyTest(TestCase):
         self.assertFalse(is_truthy("n"))
         self.assertFalse(is_truthy(0))
         self.assertFalse(is_truthy("0"))
+
+
+class LRUCacheTest(TestCase):
+    def test_lru_cache(self):
+        loaded = []
+
+        def loader(key):
+            loaded.append(key)
+            if key == "error":
+                raise ValueError(key)
+            return key.upper()
+
+        cache = LRUCache(2, loader)
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("b"), "B")
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(loaded, ["a", "b"])
+
+        # "b" is now the least recently used value
+        self.assertEqual(cache.get("c"), "C")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), "A")
+        self.assertEqual(cache.get("b"), "B")
+        self.assertEqual(loaded, ["a", "b", "c", "b"])
+
+        # Failures aren't cached
+        with self.assertRaises(ValueError):
+            cache.get("error")
+        with self.assertRaises(ValueError):
+            cache.get("error")
+        self.assertEqual(loaded, ["a", "b", "c", "b", "error", "error"])
+
+    def test_render_jinja2(self):
+        jinja2_template_cache.clear()
+        self.assertEqual(render_jinja2("{{ obj | upper }}", {"obj": "a"}), "A")
+        self.assertEqual(render_jinja2("{{ obj | upper }}", {"obj": "b"}), "B")
+        self.assertEqual(len(jinja2_template_cache), 1)
+
+
+class VersionedCacheTest(TestCase):
+    def test_values_reloaded_after_version_key_eviction(self):
+        loaded = []
+
+        def loader(key):
+            loaded.append(key)
+            return len(loaded)
+
+        cache = VersionedCache("utilities.tests.versioned_cache", loader)
+        django_cache.delete(cache.version_key)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+
+        # Another process invalidates the cache after the version key was evicted from the shared cache; the new
+        # version must not match the one this process loaded its values under
+        old_version = cache.get_version()
+        django_cache.delete(cache.version_key)
+        cache._bump_version()
+        self.assertNotEqual(cache.get_version(), old_version)
+        self.assertEqual(cache.get("a"), 2)
+
+        # Likewise when the version key is evicted without a subsequent invalidation
+        django_cache.delete(cache.version_key)
+        self.assertEqual(cache.get("a"), 3)
+        self.assertEqual(loaded, ["a", "a", "a"])
+
+
+class IterQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([Site(name=f"Site {i}", slug=f"site-{i}") for i in range(5)])
+
+    def test_iter_queryset(self):
+        queryset = Site.objects.order_by("name")
+        self.assertEqual(list(iter_queryset(queryset, chunk_size=2)), list(queryset))
+
+    def test_iter_queryset_prefetch_related(self):
+        queryset = Site.objects.prefetch_related("tags").order_by("-name")
+        sites = list(iter_queryset(queryset, chunk_size=2))
+        self.assertEqual(sites, list(queryset))
+        self.assertIn("tags", sites[0]._prefetched_objects_cache)
+
+    def test_buffer_chunks(self):
+        self.assertEqual(list(buffer_chunks(["ab", "cd", "e", "f", "ghi"], size=3)), ["abcd", "efghi"])
+        self.assertEqual(list(buffer_chunks(["ab", "cd", "e"], size=3)), ["abcd", "e"])
+        self.assertEqual(list(buffer_chunks([], size=3)), [])
@@ -4,7 +4,7 @@ import json
 import inspect
 from importlib import import_module
 from collections import OrderedDict, namedtuple
-from itertools import count, groupby
+from itertools import count, groupby, islice
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -12,9 +12,11 @@ from django.core.serializers import serialize
 from django.db.models import Count, OuterRef, Subquery, Model
 from django.db.models.functions import Coalesce
 from django.template import engines
+from prometheus_client import Counter
 
 from nautobot.dcim.choices import CableLengthUnitChoices
 from nautobot.extras.utils import is_taggable
+from nautobot.utilities.caching import LRUCache
 from nautobot.utilities.constants import HTTP_REQUEST_META_SAFE_COPY
 
 
@@ -227,15 +229,101 @@ def to_meters(length, unit):
     raise ValueError("Unknown unit {}. Must be 'm', 'cm', 'ft', or 'in'.".format(unit))
 
 
+jinja2_template_cache_hits = Counter(
+    "jinja2_template_cache_hits", "Number of Jinja2 templates rendered without being compiled again"
+)
+jinja2_template_cache_misses = Counter("jinja2_template_cache_misses", "Number of Jinja2 templates compiled")
+
+
+def _compile_jinja2(template_code):
+    return engines["jinja"].from_string(template_code)
+
+
+# Compiled Jinja2 templates, keyed by their source code
+jinja2_template_cache = LRUCache(
+    settings.JINJA2_TEMPLATE_CACHE_SIZE,
+    _compile_jinja2,
+    hits=jinja2_template_cache_hits,
+    misses=jinja2_template_cache_misses,
+)
+
+
 def render_jinja2(template_code, context):
     """
     Render a Jinja2 template with the provided context. Return the rendered content.
+
+    The most recently used JINJA2_TEMPLATE_CACHE_SIZE templates are kept compiled by each process, as the same template
+    (such as that of a computed field or custom link) is typically rendered for many objects in turn.
     """
-    rendering_engine = engines["jinja"]
-    template = rendering_engine.from_string(template_code)
+    template = jinja2_template_cache.get(template_code)
     return template.render(context=context)
 
 
+def iter_queryset(queryset, chunk_size=1000):
+    """
+    Iterate over the objects of a queryset, retrieving them from the database in chunks of `chunk_size` rather than all
+    at once (and without populating the queryset's result cache), so that memory use doesn't grow with its size.
+
+    Querysets without prefetched relations are iterated with `QuerySet.iterator()`, which uses a server-side cursor
+    where supported. As `iterator()` ignores `prefetch_related()`, the primary keys of other querysets are iterated over
+    instead, and each chunk of objects is then retrieved (along with their prefetched relations) by a separate query.
+    """
+    if not queryset._prefetch_related_lookups:
+        yield from queryset.iterator(chunk_size=chunk_size)
+        return
+
+    pks = queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(islice(pks, chunk_size))
+        if not chunk:
+            return
+        # A subset of the queryset retains its ordering
+        yield from queryset.filter(pk__in=chunk).nocache()
+
+
+class QuerySetStream:
+    """
+    Wrapper around a queryset which, when iterated over, retrieves its objects in chunks (see `iter_queryset()`).
+
+    All other attributes are those of the queryset itself. This allows a queryset to be passed to code which may
+    iterate over it, such as an export template, without the entire queryset being loaded into memory.
+    """
+
+    def __init__(self, queryset, chunk_size=1000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return iter_queryset(self.queryset, chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+
+def buffer_chunks(chunks, size=65536):
+    """
+    Combine an iterable of (typically small) strings into strings of at least `size` characters (except for the last),
+    such as for a `StreamingHttpResponse`.
+    """
+    buffer = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
 def prepare_cloned_fields(instance):
     """
     Compile an object's `clone_fields` list into a string of URL query parameters. Tags are automatically cloned where
@@ -505,6 +505,44 @@ def integration_test(
     )
 
 
+@task(
+    help={
+        "keepdb": "Save and re-use test database between test runs for faster re-testing.",
+        "label": "Specify a directory or module to test instead of running all Nautobot tests.",
+        "failfast": "Fail as soon as a single test fails don't run the entire test suite.",
+        "tag": "Run only tests with the specified tag. Can be used multiple times.",
+        "exclude_tag": "Do not run tests with the specified tag. Can be used multiple times.",
+        "verbose": "Enable verbose test output.",
+    },
+    iterable=["tag", "exclude_tag"],
+)
+def performance_test(
+    context,
+    keepdb=False,
+    label="nautobot",
+    failfast=False,
+    tag=None,
+    exclude_tag=None,
+    verbose=False,
+):
+    """Run Nautobot performance tests (benchmarks)."""
+
+    # Enforce "performance" tag
+    tag.append("performance")
+
+    # Don't buffer output, as benchmark results are reported on stdout
+    unittest(
+        context,
+        keepdb=keepdb,
+        label=label,
+        failfast=failfast,
+        buffer=False,
+        tag=tag,
+        exclude_tag=exclude_tag,
+        verbose=verbose,
+    )
+
+
 @task(
     help={
         "lint-only": "Only run linters; unit tests will be excluded.",